@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+import random
+import time
+
+from odps.compat import unittest
+from odps.dag import DAG
+
+
+class Test(unittest.TestCase):
+    NODE_AMOUNT = 10000
+    EDGES_PER_NODE = 3
+    SORT_AMOUNT = 100
+
+    def _build_dag(self):
+        rs = random.Random(0)
+        nodes = [object() for _ in range(self.NODE_AMOUNT)]
+        dag = DAG()
+        for node in nodes:
+            dag.add_node(node)
+        for idx in range(1, self.NODE_AMOUNT):
+            for _ in range(self.EDGES_PER_NODE):
+                dag.add_edge(nodes[rs.randint(max(0, idx - 100), idx - 1)], nodes[idx])
+        return dag, nodes
+
+    def testBuild(self):
+        start = time.time()
+        self._build_dag()
+        print('build with validation: %.3f s' % (time.time() - start))
+
+    def testTopologicalSort(self):
+        dag, nodes = self._build_dag()
+
+        start = time.time()
+        for _ in range(self.SORT_AMOUNT):
+            dag.topological_sort()
+        print('cached sort: %.6f s per call' % ((time.time() - start) / self.SORT_AMOUNT))
+
+        start = time.time()
+        for idx in range(self.SORT_AMOUNT):
+            # changes of the graph invalidate the cached order
+            dag.add_edge(nodes[idx], nodes[-1])
+            dag.topological_sort()
+        print('sort after change: %.6f s per call' % ((time.time() - start) / self.SORT_AMOUNT))
+
+    def testPredecessors(self):
+        dag, nodes = self._build_dag()
+
+        start = time.time()
+        for node in nodes:
+            dag.predecessors(node)
+        print('predecessors: %.3f us per call'
+              % ((time.time() - start) * 1e6 / self.NODE_AMOUNT))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+import time
+
+from odps.compat import unittest
+from odps.models import Schema
+from odps.readers import RecordReader
+
+
+class Test(unittest.TestCase):
+    ROW_AMOUNT = 10000
+
+    def setUp(self):
+        self.schema = Schema.from_lists(
+            ['id', 'name', 'score', 'flag', 'dt'],
+            ['bigint', 'string', 'double', 'boolean', 'datetime'])
+        lines = ['"id","name","score","flag","dt"']
+        for i in range(self.ROW_AMOUNT):
+            lines.append('%d,"name_%d",%s,%s,2017-01-01 00:00:%02d'
+                         % (i, i, i * 0.5, 'true' if i % 2 else 'false', i % 60))
+        lines.append('\\N,"escaped\\t\\u4e2d",\\N,\\N,\\N')
+        self.text = '\n'.join(lines)
+
+    def testRecords(self):
+        start = time.time()
+        records = list(RecordReader(self.schema, self.text))
+        self.assertEqual(self.ROW_AMOUNT + 1, len(records))
+        print('records: %.3f s' % (time.time() - start))
+
+    def testRows(self):
+        start = time.time()
+        rows = list(RecordReader(self.schema, self.text).iter_rows())
+        self.assertEqual(self.ROW_AMOUNT + 1, len(rows))
+        print('rows: %.3f s' % (time.time() - start))
+
+    def testColumns(self):
+        start = time.time()
+        columns = RecordReader(self.schema, self.text).read_columns()
+        self.assertEqual(self.ROW_AMOUNT + 1, len(columns['id']))
+        print('columns: %.3f s' % (time.time() - start))
+
+
+if __name__ == '__main__':
+    unittest.main()
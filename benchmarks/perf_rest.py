@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+import time
+
+from odps import options
+from odps.accounts import AliyunAccount
+from odps.compat import unittest
+from odps.rest import RestClient
+from odps.tests.core import StubHTTPServer
+
+
+class Test(unittest.TestCase):
+    REQUEST_AMOUNT = 2000
+
+    def setUp(self):
+        self._old_keep_alive = options.keep_alive
+        self.server = StubHTTPServer().start()
+
+    def tearDown(self):
+        options.keep_alive = self._old_keep_alive
+        self.server.stop()
+
+    def _run_requests(self, keep_alive):
+        options.keep_alive = keep_alive
+        client = RestClient(AliyunAccount('access_id', 'secret_access_key'), self.server.endpoint)
+        url = self.server.endpoint + '/projects/test'
+
+        start = time.time()
+        for _ in range(self.REQUEST_AMOUNT):
+            client.get(url)
+        elapsed = time.time() - start
+        client.close()
+        return self.REQUEST_AMOUNT / elapsed
+
+    def testRequestRate(self):
+        no_pool_rate = self._run_requests(False)
+        n_connections = self.server.n_connections
+        pool_rate = self._run_requests(True)
+        print('without pool: %.1f req/s, %d connections' % (no_pool_rate, n_connections))
+        print('with pool: %.1f req/s, %d connections'
+              % (pool_rate, self.server.n_connections - n_connections))
+
+if __name__ == '__main__':
+    unittest.main()
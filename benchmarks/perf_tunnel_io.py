@@ -0,0 +1,145 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from __future__ import print_function
+import io
+import random
+import threading
+import time
+import zlib
+
+import requests
+
+from odps.compat import unittest, six
+from odps.tunnel import io as tio
+
+BaseHTTPServer = six.moves.BaseHTTPServer
+socketserver = six.moves.socketserver
+
+
+class DiscardHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        # read and discard the chunked body
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            left = size + 2
+            while left > 0:
+                left -= len(self.rfile.read(min(left, 1 << 20)))
+            if size == 0:
+                break
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *_):
+        pass
+
+
+class DiscardServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class LegacyChunkRequestsIO(tio.ThreadRequestsIO):
+    def data_generator(self):
+        while True:
+            data = self.get()
+            if data is None:
+                break
+            while data:
+                to_send = data[:self._chunk_size]
+                data = data[self._chunk_size:]
+                yield to_send
+
+
+class SmallBlockDeflateInputStream(tio.DeflateInputStream):
+    READ_BLOCK_SIZE = 1024 * 10
+
+    def _buffer_next_chunk(self):
+        data = self._read_block()
+        return self._decompressor.decompress(data) if data is not None else None
+
+
+class Test(unittest.TestCase):
+    BLOCK_SIZE = 1024 * 1024
+    N_BLOCKS = 8
+    CHUNK_SIZE = 1496
+
+    def setUp(self):
+        self.server = DiscardServer(('127.0.0.1', 0), DiscardHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%d/' % self.server.server_address[1]
+        self.session = requests.Session()
+        self.block = bytes(bytearray(i % 251 for i in range(self.BLOCK_SIZE)))
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _upload(self, io_cls):
+        req_io = io_cls(lambda data: self.session.post(self.url, data=data),
+                        chunk_size=self.CHUNK_SIZE)
+        start = time.time()
+        req_io.start()
+        for _ in range(self.N_BLOCKS):
+            req_io.write(self.block)
+        self.assertEqual(200, req_io.finish().status_code)
+        elapsed = time.time() - start
+        return self.BLOCK_SIZE * self.N_BLOCKS / elapsed / 1024 / 1024
+
+    def testUpload(self):
+        print('legacy upload: %.1f MB/s' % self._upload(LegacyChunkRequestsIO))
+        print('upload: %.1f MB/s' % self._upload(tio.ThreadRequestsIO))
+
+    def _decompress(self, stream_cls, compressed, expected_size):
+        start = time.time()
+        instream = stream_cls(io.BytesIO(compressed))
+        size = 0
+        while True:
+            data = instream.read(1024 * 64)
+            if not data:
+                break
+            size += len(data)
+        self.assertEqual(expected_size, size)
+        return size / (time.time() - start) / 1024 / 1024
+
+    def testDecompress(self):
+        words = [('word%d' % i).encode() for i in range(5000)]
+        rs = random.Random(0)
+        data = bytes().join(rs.choice(words) for _ in range(self.BLOCK_SIZE * self.N_BLOCKS // 8))
+        compressed = zlib.compress(data, 1)
+        print('legacy decompress: %.1f MB/s'
+              % self._decompress(SmallBlockDeflateInputStream, compressed, len(data)))
+        print('decompress: %.1f MB/s'
+              % self._decompress(tio.DeflateInputStream, compressed, len(data)))
+
+        compressed = zlib.compress(self.block * self.N_BLOCKS, 1)
+        size = self.BLOCK_SIZE * self.N_BLOCKS
+        print('legacy decompress repeated: %.1f MB/s'
+              % self._decompress(SmallBlockDeflateInputStream, compressed, size))
+        print('decompress repeated: %.1f MB/s'
+              % self._decompress(tio.DeflateInputStream, compressed, size))
+
+
+if __name__ == '__main__':
+    unittest.main()
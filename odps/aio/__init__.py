@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Asyncio interfaces of PyODPS, which submit and wait for instances, and read or
+write data without holding a thread for every running job. Python 3.5.2 or
+later is required. When aiohttp is installed, REST requests are sent with it,
+otherwise they are sent by the blocking client in the executor of event loop.
+
+:Example:
+
+>>> from odps.aio import AsyncODPS
+>>> aodps = AsyncODPS(odps)
+>>> instance = await aodps.run_sql('select * from dual')
+>>> await instance.wait_for_success()
+>>> async with instance.open_reader() as reader:
+>>>     async for record in reader:
+>>>         # handle each record
+"""
+
+import sys
+
+if sys.version_info[:3] < (3, 5, 2):
+    raise ImportError('Python 3.5.2 or later is required to use odps.aio.')
+
+from .rest import AsyncRestClient
+from .instance import AsyncInstance, AsyncResultReader
+from .tunnel import AsyncTableReader, AsyncTableWriter
+from .core import AsyncODPS
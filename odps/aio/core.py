@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from .rest import AsyncRestClient
+from .instance import AsyncInstance
+from .tunnel import AsyncTableReader, AsyncTableWriter
+
+
+class AsyncODPS(object):
+    """
+    Asynchronous entrance of ODPS, sharing account and endpoint with a
+    :class:`odps.ODPS` object.
+
+    :param odps: ODPS entrance
+    :param loop: event loop, the current one by default
+    :param executor: executor to run blocking calls in, the default one of the loop if not given
+    """
+
+    def __init__(self, odps, loop=None, executor=None):
+        self._odps = odps
+        self._loop = loop
+        self._executor = executor
+        self.rest = AsyncRestClient(odps.rest, loop=loop, executor=executor)
+
+    @property
+    def odps(self):
+        return self._odps
+
+    async def run_sql(self, sql, project=None, priority=None, running_cluster=None,
+                      hints=None, aliases=None, **kwargs):
+        """
+        Submit a SQL statement. Arguments are the same as :meth:`odps.ODPS.run_sql`.
+
+        :return: instance
+        :rtype: :class:`odps.aio.AsyncInstance`
+        """
+        priority = self._odps._get_sql_priority(priority)
+        on_instance_create = kwargs.pop('on_instance_create', None)
+        task = self._odps._build_sql_task(sql, project=project, hints=hints,
+                                          aliases=aliases, **kwargs)
+
+        instances = self._odps.get_project(name=project).instances
+        xml, headers = instances._get_create_content(task=task, priority=priority,
+                                                     running_cluster=running_cluster)
+        resp = await self.rest.post(instances.resource(), xml, headers=headers)
+        instance = instances._create_from_response(resp, create_callback=on_instance_create)
+        return AsyncInstance(instance, self.rest)
+
+    async def execute_sql(self, sql, project=None, priority=None, running_cluster=None,
+                          hints=None, aliases=None, **kwargs):
+        """
+        Submit a SQL statement and wait for its success.
+
+        :return: instance
+        :rtype: :class:`odps.aio.AsyncInstance`
+        """
+        instance = await self.run_sql(sql, project=project, priority=priority,
+                                      running_cluster=running_cluster, hints=hints,
+                                      aliases=aliases, **kwargs)
+        await instance.wait_for_success()
+        return instance
+
+    def get_instance(self, id_, project=None):
+        """
+        Get an instance by id without sending requests.
+
+        :rtype: :class:`odps.aio.AsyncInstance`
+        """
+        return AsyncInstance(self._odps.get_instance(id_, project=project), self.rest)
+
+    def _get_table(self, name, project=None):
+        from ..models import Table
+
+        if isinstance(name, Table):
+            return name
+        return self._odps.get_table(name, project=project)
+
+    def open_reader(self, table, partition=None, project=None, batch_size=None,
+                    start=None, count=None, **kw):
+        """
+        Open a reader of a table, which should be used with ``async with``.
+        Other arguments are the same as :meth:`odps.models.Table.open_reader`.
+
+        :rtype: :class:`odps.aio.AsyncTableReader`
+        """
+        context = self._get_table(table, project=project).open_reader(partition=partition, **kw)
+        return AsyncTableReader(context, loop=self._loop, executor=self._executor,
+                                batch_size=batch_size, start=start, count=count)
+
+    def open_writer(self, table, partition=None, project=None, **kw):
+        """
+        Open a writer of a table, which should be used with ``async with``.
+        Other arguments are the same as :meth:`odps.models.Table.open_writer`.
+
+        :rtype: :class:`odps.aio.AsyncTableWriter`
+        """
+        context = self._get_table(table, project=project).open_writer(partition=partition, **kw)
+        return AsyncTableWriter(context, loop=self._loop, executor=self._executor)
+
+    async def close(self):
+        await self.rest.close()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+
+from .. import errors, readers, utils, options
+from ..compat import six, OrderedDict
+from ..models import Instance
+
+
+class AsyncInstance(object):
+    """
+    Asynchronous wrapper of :class:`odps.models.Instance`, whose methods send
+    requests with an :class:`odps.aio.AsyncRestClient`.
+    """
+
+    def __init__(self, instance, client):
+        self._instance = instance
+        self._client = client
+
+    @property
+    def instance(self):
+        return self._instance
+
+    @property
+    def id(self):
+        return self._instance.id
+
+    def get_logview_address(self, hours=None):
+        return self._instance.get_logview_address(hours=hours)
+
+    async def reload(self):
+        resp = await self._client.get(self._instance.resource())
+        self._instance._parse_reload(resp)
+
+    async def stop(self):
+        """
+        Stop this instance.
+        """
+        instance_status = Instance.InstanceStatus(status='Terminated')
+        headers = {'Content-Type': 'application/xml'}
+        await self._client.put(self._instance.resource(), instance_status.serialize(),
+                               headers=headers)
+
+    async def get_status(self):
+        # read the attribute directly to avoid lazy loading with blocking requests
+        if self._instance._getattr('_status') != Instance.Status.TERMINATED:
+            await self.reload()
+        return self._instance._getattr('_status')
+
+    async def is_terminated(self):
+        return await self.get_status() == Instance.Status.TERMINATED
+
+    async def get_task_statuses(self):
+        resp = await self._client.get(self._instance.resource(), params={'taskstatus': ''})
+        return self._instance._parse_task_statuses(resp)
+
+    async def is_successful(self):
+        if not await self.is_terminated():
+            return False
+        statuses = await self.get_task_statuses()
+        return all(task.status == Instance.Task.TaskStatus.SUCCESS
+                   for task in statuses.values())
+
+    async def get_task_results(self):
+        if self._instance.is_sync:
+            results = self._instance._task_results
+        else:
+            resp = await self._client.get(self._instance.resource(), params={'result': ''})
+            results = self._instance._parse_task_results(resp)
+        return OrderedDict([(k, str(result)) for k, result in six.iteritems(results)])
+
+    async def get_task_result(self, task_name):
+        return (await self.get_task_results()).get(task_name)
+
+    async def wait_for_completion(self, interval=1, max_interval=None):
+        """
+        Wait for the instance to complete without blocking the event loop.
+
+        :param interval: time interval to check
+        :param max_interval: max time interval to check, ``options.max_poll_interval`` by default
+        """
+        if max_interval is None:
+            max_interval = options.max_poll_interval
+        intervals = utils.backoff_intervals(interval, max_interval)
+        while not await self.is_terminated():
+            await asyncio.sleep(next(intervals))
+
+    async def wait_for_success(self, interval=1, max_interval=None):
+        """
+        Wait for the instance to complete, and check if the instance is successful.
+
+        :param interval: time interval to check
+        :param max_interval: max time interval to check
+        :raise: :class:`odps.errors.ODPSError` if the instance failed
+        """
+        await self.wait_for_completion(interval=interval, max_interval=max_interval)
+
+        if not await self.is_successful():
+            for task_name, task in six.iteritems(await self.get_task_statuses()):
+                if task.status == Instance.Task.TaskStatus.FAILED:
+                    raise errors.parse_result_error(await self.get_task_result(task_name))
+                elif task.status != Instance.Task.TaskStatus.SUCCESS:
+                    raise errors.ODPSError('%s, status=%s' % (task_name, task.status.value))
+
+    def open_reader(self, schema=None, task_name=None):
+        """
+        Open a reader of SQL results, which should be used with ``async with``.
+
+        :return: :class:`odps.aio.AsyncResultReader`
+        """
+        return AsyncResultReader(self, schema=schema, task_name=task_name)
+
+    def __str__(self):
+        return str(self._instance)
+
+
+class AsyncResultReader(object):
+    """
+    Asynchronous iterator of records in results of a SQL instance.
+    """
+
+    def __init__(self, instance, schema=None, task_name=None):
+        self._instance = instance
+        self._schema = schema
+        self._task_name = task_name
+        self._reader = None
+
+    @property
+    def raw(self):
+        return self._reader.raw
+
+    async def open(self):
+        if not await self._instance.is_successful():
+            raise errors.ODPSError(
+                'Cannot open reader, instance(%s) may fail or has not finished yet'
+                % self._instance.id)
+
+        task_statuses = await self._instance.get_task_statuses()
+        task_name = Instance._get_sql_task_name(task_statuses, self._task_name)
+        result = await self._instance.get_task_result(task_name)
+        self._reader = readers.RecordReader(self._schema, result)
+        return self
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, *_):
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._reader)
+        except StopIteration:
+            raise StopAsyncIteration
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import functools
+import logging
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = None
+
+from .. import utils
+from ..compat import six
+from ..config import options
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncRestClient(object):
+    """
+    Asynchronous counterpart of :class:`odps.rest.RestClient`. Requests are
+    built and signed by the blocking client, and sent with aiohttp if installed.
+    Otherwise the blocking client is called in ``executor``, or the default
+    executor of the event loop when not specified.
+    """
+
+    def __init__(self, client, loop=None, executor=None):
+        self._client = client
+        self._loop = loop
+        self._executor = executor
+        self._session = None
+
+    @property
+    def client(self):
+        return self._client
+
+    @property
+    def endpoint(self):
+        return self._client.endpoint
+
+    @property
+    def project(self):
+        return self._client.project
+
+    def _get_loop(self):
+        return self._loop or asyncio.get_event_loop()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=options.pool_maxsize,
+                                             ssl=False, loop=self._get_loop())
+            timeout = aiohttp.ClientTimeout(sock_connect=options.connect_timeout,
+                                            sock_read=options.read_timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                                  loop=self._get_loop())
+        return self._session
+
+    @staticmethod
+    def _build_response(prepared_req, resp, content):
+        res = requests.Response()
+        res.status_code = resp.status
+        res.reason = resp.reason
+        res.headers = CaseInsensitiveDict(resp.headers)
+        res.encoding = get_encoding_from_headers(res.headers)
+        res.url = prepared_req.url
+        res.request = prepared_req
+        res._content = content
+        return res
+
+    async def _send(self, prepared_req):
+        session = self._get_session()
+        # url is signed as is, thus should not be quoted again
+        url = yarl.URL(prepared_req.url, encoded=True)
+        skip_auto_headers = [h for h in ('Content-Type', ) if h not in prepared_req.headers]
+
+        retry_times = options.retry_times
+        while True:
+            try:
+                async with session.request(prepared_req.method, url,
+                                           headers=dict(prepared_req.headers),
+                                           data=prepared_req.body,
+                                           skip_auto_headers=skip_auto_headers) as resp:
+                    content = await resp.read()
+                    return self._build_response(prepared_req, resp, content)
+            except aiohttp.ClientConnectorError:
+                # only retry when no connection is made, as requests already sent,
+                # like creating instances, are not idempotent
+                if retry_times <= 0:
+                    raise
+                retry_times -= 1
+                LOG.debug('Retry request %s %s', prepared_req.method, prepared_req.url)
+
+    async def request(self, url, method, **kwargs):
+        if aiohttp is None:
+            func = functools.partial(self._client.request, url, method, **kwargs)
+            return await self._get_loop().run_in_executor(self._executor, func)
+
+        prepared_req = self._client._prepare_request(url, method, **kwargs)
+        res = await self._send(prepared_req)
+        return self._client._check_response(res)
+
+    async def get(self, url, **kwargs):
+        return await self.request(url, 'get', **kwargs)
+
+    async def post(self, url, data, **kwargs):
+        data = utils.to_binary(data) if isinstance(data, six.string_types) else data
+        return await self.request(url, 'post', data=data, **kwargs)
+
+    async def put(self, url, data, **kwargs):
+        data = utils.to_binary(data) if isinstance(data, six.string_types) else data
+        return await self.request(url, 'put', data=data, **kwargs)
+
+    async def head(self, url, **kwargs):
+        return await self.request(url, 'head', **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request(url, 'delete', **kwargs)
+
+    async def close(self):
+        """
+        Release connections held by this client.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+
+from odps import ODPS, aio, errors
+from odps.aio import rest as aio_rest
+from odps.tests.core import TestBase, InstanceServer, StubHTTPServer
+from odps.compat import unittest
+
+
+class Test(TestBase):
+    def setup(self):
+        self.loop = asyncio.new_event_loop()
+
+    def teardown(self):
+        self.loop.close()
+
+    def _make_odps(self, server):
+        odps = ODPS('access_id', 'secret_access_key', 'test_project', endpoint=server.endpoint)
+        return aio.AsyncODPS(odps, loop=self.loop)
+
+    def testRunSql(self):
+        with InstanceServer() as server:
+            aodps = self._make_odps(server)
+
+            async def run():
+                instance = await aodps.run_sql('select * from dual')
+                self.assertFalse(await instance.is_terminated())
+                await instance.wait_for_success(interval=0.01)
+
+                values = []
+                async with instance.open_reader() as reader:
+                    async for r in reader:
+                        values.append(r.values)
+                return values
+
+            self.assertEqual([['1', 'a'], ['2', 'b']], self.loop.run_until_complete(run()))
+            self.loop.run_until_complete(aodps.close())
+
+    def testWaitForManyInstances(self):
+        with InstanceServer(n_polls=5) as server:
+            aodps = self._make_odps(server)
+
+            async def run():
+                instance = await aodps.run_sql('select * from dual')
+                await instance.wait_for_success(interval=0.01)
+                return instance.id
+
+            ids = self.loop.run_until_complete(
+                asyncio.gather(*[run() for _ in range(50)], loop=self.loop))
+            self.assertEqual(50, len(set(ids)))
+            # 1 submission and 5 polls of status for every instance, plus checks of success
+            self.assertEqual(50 * 7, server.n_requests)
+
+    def testWaitForFailure(self):
+        with InstanceServer(n_polls=1, task_status='Failed',
+                            result='ODPS-0130071: Semantic analysis exception') as server:
+            aodps = self._make_odps(server)
+
+            async def run():
+                await aodps.execute_sql('select * from non_exist_table')
+
+            self.assertRaises(errors.ODPSError, self.loop.run_until_complete, run())
+
+    @unittest.skipIf(aio_rest.aiohttp is None, 'Skipped due to absence of aiohttp.')
+    def testNoRetryAfterSent(self):
+        def drop(request, data):
+            # the connection is closed without any response
+            raise IOError('connection dropped')
+
+        with StubHTTPServer(handler=drop) as server:
+            aodps = self._make_odps(server)
+
+            async def run():
+                try:
+                    await aodps.run_sql('select * from dual')
+                finally:
+                    await aodps.close()
+
+            self.assertRaises(aio_rest.aiohttp.ClientConnectionError,
+                              self.loop.run_until_complete, run())
+            self.assertEqual(1, server.n_requests)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import collections
+import functools
+import itertools
+
+
+class _AsyncTableIO(object):
+    def __init__(self, context, loop=None, executor=None):
+        self._context = context
+        self._loop = loop
+        self._executor = executor
+        self._io = None
+
+    async def _run(self, func, *args, **kwargs):
+        loop = self._loop or asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def __aenter__(self):
+        self._io = await self._run(self._context.__enter__)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._run(self._context.__exit__, *exc_info)
+
+
+class AsyncTableReader(_AsyncTableIO):
+    """
+    Asynchronous iterator of records in a table. Records are downloaded by the
+    table tunnel in the executor, ``batch_size`` records at a time.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+
+    def __init__(self, context, loop=None, executor=None, batch_size=None, **kw):
+        super(AsyncTableReader, self).__init__(context, loop=loop, executor=executor)
+        self._batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+        self._read_kw = kw
+        self._records = None
+        self._buffer = collections.deque()
+
+    @property
+    def count(self):
+        return self._io.count
+
+    def _read_batch(self):
+        if self._records is None:
+            self._records = self._io.read(**self._read_kw)
+        return list(itertools.islice(self._records, self._batch_size))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._buffer:
+            self._buffer.extend(await self._run(self._read_batch))
+            if not self._buffer:
+                raise StopAsyncIteration
+        return self._buffer.popleft()
+
+
+class AsyncTableWriter(_AsyncTableIO):
+    """
+    Asynchronous writer of a table. Records are uploaded by the table tunnel
+    in the executor, and are committed when leaving the ``async with`` block.
+    """
+
+    async def write(self, *args, **kwargs):
+        await self._run(self._io.write, *args, **kwargs)
+
+    async def write_batch(self, columns, **kwargs):
+        await self._run(self._io.write_batch, columns, **kwargs)
+
+    async def write_pandas(self, df, **kwargs):
+        await self._run(self._io.write_pandas, df, **kwargs)
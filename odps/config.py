@@ -28,6 +28,9 @@ DEFAULT_CHUNK_SIZE = 1496
 DEFAULT_CONNECT_RETRY_TIMES = 4
 DEFAULT_CONNECT_TIMEOUT = 5
 DEFAULT_READ_TIMEOUT = 120
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_POOL_IDLE_TIMEOUT = 30
 _DEFAULT_REDIRECT_WARN = 'Option {source} has been replaced by {target} and might be removed in a future release.'
 
 
@@ -278,6 +281,7 @@ def all_validator(*validators):
 is_null = lambda x: x is None
 is_bool = lambda x: isinstance(x, bool)
 is_integer = lambda x: isinstance(x, six.integer_types)
+is_number = lambda x: isinstance(x, (float, ) + six.integer_types)
 is_string = lambda x: isinstance(x, six.string_types)
 is_dict = lambda x: isinstance(x, dict)
 def is_in(vals):
@@ -302,6 +306,7 @@ options.register_option('temp_lifecycle', 1, validator=is_integer)
 options.register_option('lifecycle', None, validator=any_validator(is_null, is_integer))
 options.register_option('table_read_limit', None, validator=any_validator(is_null, is_integer))
 options.register_option('completion_size', 10, validator=is_integer)
+options.register_option('partition_cache_ttl', None, validator=any_validator(is_null, is_integer))
 
 # c or python mode, use for UT, in other cases, please do not modify the value
 options.register_option('force_c', False, validator=is_integer)
@@ -309,12 +314,20 @@ options.register_option('force_py', False, validator=is_integer)
 
 # instance create callback
 options.register_option('instance_create_callback', None)
+# max interval in seconds between two checks of instance status
+options.register_option('max_poll_interval', 5, validator=any_validator(is_null, is_number))
 
 # network connections
 options.register_option('chunk_size', DEFAULT_CHUNK_SIZE, validator=is_integer)
 options.register_option('retry_times', DEFAULT_CONNECT_RETRY_TIMES, validator=is_integer)
 options.register_option('connect_timeout', DEFAULT_CONNECT_TIMEOUT, validator=is_integer)
 options.register_option('read_timeout', DEFAULT_READ_TIMEOUT, validator=is_integer)
+options.register_option('keep_alive', True, validator=is_bool)
+options.register_option('pool_connections', DEFAULT_POOL_CONNECTIONS, validator=is_integer)
+options.register_option('pool_maxsize', DEFAULT_POOL_MAXSIZE, validator=is_integer)
+options.register_option('pool_idle_timeout', DEFAULT_POOL_IDLE_TIMEOUT,
+                        validator=any_validator(is_null, is_integer))
+options.register_option('share_connection_pool', False, validator=is_bool)
 
 # terminal
 options.register_option('console.max_lines', None)
@@ -334,10 +347,15 @@ options.register_option('df.optimizes.pp', True, validator=is_bool)
 options.register_option('df.optimizes.tunnel', True, validator=is_bool)
 options.register_option('df.analyze', True, validator=is_bool)
 options.register_option('df.use_cache', True, validator=is_bool)
+options.register_option('df.persistent_cache', False, validator=is_bool)
+options.register_option('df.cache_max_bytes', None, validator=any_validator(is_null, is_integer))
 options.register_option('df.quote', True, validator=is_bool)
 options.register_option('df.dump_udf', False, validator=is_bool)
 options.register_option('df.libraries', None)
 options.register_option('df.odps.sort.limit', 10000, )
+options.register_option('df.tunnel.n_threads', 4, validator=is_integer)
+options.register_option('df.pandas.n_workers', 1, validator=is_integer)
+options.register_option('df.pandas.chunk_size', None, validator=any_validator(is_null, is_integer))
 
 # Runner
 options.register_option('runner.parallel_num', 5, validator=is_integer)
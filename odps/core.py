@@ -249,6 +249,11 @@ class ODPS(object):
         :param endpoint: tunnel service URL
         :param reopen: reading the table will reuse the session which opened last time,
                        if set to True will open a new download session, default as False
+        :param n_threads: number of threads to download row ranges concurrently
+        :type n_threads: int
+        :param ordered: if False when ``n_threads`` is specified, records will be returned
+                        once downloaded instead of in the order of the table, default as True
+        :type ordered: bool
         :return: records
         :rtype: generator
 
@@ -258,6 +263,8 @@ class ODPS(object):
         >>>     # deal with such 100 records
         >>> for record in odps.read_table('test_table', partition='pt=test', start=100, limit=100):
         >>>     # read the `pt=test` partition, skip 100 records and read 100 records
+        >>> for record in odps.read_table('test_table', n_threads=8):
+        >>>     # read the whole table with 8 threads
 
         .. seealso:: :class:`odps.models.Record`
         """
@@ -270,10 +277,12 @@ class ODPS(object):
 
         compress = kw.pop('compress', False)
         columns = kw.pop('columns', None)
+        n_threads = kw.pop('n_threads', None)
+        ordered = kw.pop('ordered', True)
 
         with table.open_reader(partition=partition, **kw) as reader:
-            for record in reader.read(start, limit, step=step,
-                                      compress=compress, columns=columns):
+            for record in reader.read(start, limit, step=step, compress=compress,
+                                      columns=columns, n_threads=n_threads, ordered=ordered):
                 yield record
 
     def write_table(self, name, *block_records, **kw):
@@ -685,11 +694,22 @@ class ODPS(object):
         .. seealso:: :class:`odps.models.Instance`
         """
 
+        priority = self._get_sql_priority(priority)
+        on_instance_create = kwargs.pop('on_instance_create', None)
+        task = self._build_sql_task(sql, project=project, hints=hints, aliases=aliases, **kwargs)
+
+        project = self.get_project(name=project)
+        return project.instances.create(task=task, priority=priority,
+                                        running_cluster=running_cluster,
+                                        create_callback=on_instance_create)
+
+    def _get_sql_priority(self, priority=None):
         priority = priority or options.priority
         if priority is None and options.get_priority is not None:
             priority = options.get_priority(self)
-        on_instance_create = kwargs.pop('on_instance_create', None)
+        return priority
 
+    def _build_sql_task(self, sql, project=None, hints=None, aliases=None, **kwargs):
         def update(kv, dest):
             if not kv:
                 return
@@ -727,10 +747,7 @@ class ODPS(object):
                 task.properties = dict()
             task.properties['biz_id'] = str(options.biz_id)
 
-        project = self.get_project(name=project)
-        return project.instances.create(task=task, priority=priority,
-                                        running_cluster=running_cluster,
-                                        create_callback=on_instance_create)
+        return task
 
     def list_volumes(self, project=None, owner=None):
         """
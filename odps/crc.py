@@ -142,15 +142,17 @@ if Crc32c is None:
             :param length: length
             """
 
-            off = off or 0
-            length = length or len(buf)
-
-            to_crc = buf[off: off + length]
+            if off or length:
+                off = off or 0
+                length = length or len(buf)
+                to_crc = buf[off: off + length]
+            else:
+                to_crc = buf
 
             crc = self.crc
+            table = _CRC_TABLE
             for b in to_crc:
-                table_index = (crc ^ b) & 0xff
-                crc = (_CRC_TABLE[table_index] ^ (crc >> 8)) & 0xffffffff
+                crc = table[(crc ^ b) & 0xff] ^ (crc >> 8)
             self.crc = crc & 0xffffffff
 
         def reset(self):
@@ -17,13 +17,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import itertools
-import functools
-import weakref
-from collections import Iterable
-from copy import deepcopy
+from collections import Iterable, deque
 
-from .compat import Queue, six
+from .compat import six
 
 
 class DAGValidationError(Exception):
@@ -31,17 +27,31 @@ class DAGValidationError(Exception):
 
 
 class DAG(object):
-    """Directed acyclic graph implementation."""
+    """
+    Directed acyclic graph implementation.
+
+    Both successors and predecessors of every node are indexed, thus looking up
+    predecessors and in-degrees takes constant time. The topological order is
+    cached until the graph is changed.
+    """
     _graph_dict_type = dict
     _dict_type = dict
 
     def __init__(self, reverse=False):
+        # predecessors are always indexed, ``reverse`` is kept for compatibility
         self._graph = self._graph_dict_type()
+        self._reversed_graph = self._graph_dict_type()
         self._map = self._dict_type()
-        if reverse:
-            self._reversed_graph = self._graph_dict_type()
-        else:
-            self._reversed_graph = None
+        self._cache = dict()
+
+    def _share_graph(self, dag):
+        self._graph = dag._graph
+        self._reversed_graph = dag._reversed_graph
+        self._map = dag._map
+        self._cache = dag._cache
+
+    def _invalidate(self):
+        self._cache.clear()
 
     def nodes(self):
         return [self._map[n] for n in self._graph]
@@ -50,28 +60,24 @@ class DAG(object):
         return id(node) in self._graph
 
     def add_node(self, node):
-        self._graph[id(node)] = set()
-        self._map[id(node)] = node
-        if self._reversed_graph is not None:
-            self._reversed_graph[id(node)] = set()
+        node_id = id(node)
+        self._map[node_id] = node
+        if node_id not in self._graph:
+            self._graph[node_id] = set()
+            self._reversed_graph[node_id] = set()
+            self._invalidate()
 
     def remove_node(self, node):
-        if id(node) not in self._graph:
+        node_id = id(node)
+        if node_id not in self._graph:
             raise KeyError('Node does not exist')
 
-        self._graph.pop(id(node))
-        self._map.pop(id(node))
-
-        for edges in six.itervalues(self._graph):
-            if id(node) in edges:
-                edges.remove(id(node))
-
-        if self._reversed_graph is not None:
-            self._reversed_graph.pop(id(node))
-
-            for edges in six.itervalues(self._reversed_graph):
-                if id(node) in edges:
-                    edges.remove(id(node))
+        self._map.pop(node_id, None)
+        for succ_id in self._graph.pop(node_id):
+            self._reversed_graph[succ_id].discard(node_id)
+        for pred_id in self._reversed_graph.pop(node_id):
+            self._graph[pred_id].discard(node_id)
+        self._invalidate()
 
     def contains_edge(self, predecessor_node, successor_node):
         if id(predecessor_node) not in self._graph or \
@@ -80,54 +86,67 @@ class DAG(object):
 
         return id(successor_node) in self._graph[id(predecessor_node)]
 
+    def _reachable(self, from_id, to_id):
+        if from_id == to_id:
+            return True
+        visited = set([from_id])
+        stack = [from_id]
+        while stack:
+            for succ_id in self._graph[stack.pop()]:
+                if succ_id == to_id:
+                    return True
+                if succ_id not in visited:
+                    visited.add(succ_id)
+                    stack.append(succ_id)
+        return False
+
     def add_edge(self, predecessor_node, successor_node, validate=True):
-        if id(predecessor_node) not in self._graph or \
-                id(successor_node) not in self._graph:
+        pred_id, succ_id = id(predecessor_node), id(successor_node)
+        if pred_id not in self._graph or succ_id not in self._graph:
             raise KeyError('Node does not exist')
+        if succ_id in self._graph[pred_id]:
+            return
 
-        if validate:
-            test_graph = deepcopy(self._graph)
-            test_graph[id(predecessor_node)].add(id(successor_node))
-            test_reversed_graph = None
-            if self._reversed_graph is not None:
-                test_reversed_graph = deepcopy(self._reversed_graph)
-                test_reversed_graph[id(successor_node)].add(id(predecessor_node))
-            valid, msg = self._validate(test_graph, test_reversed_graph)
-        else:
-            valid, msg = True, ''
-        if valid:
-            self._graph[id(predecessor_node)].add(id(successor_node))
-            if self._reversed_graph is not None:
-                self._reversed_graph[id(successor_node)].add(id(predecessor_node))
-        else:
-            raise DAGValidationError(msg)
+        # the new edge makes a cycle only when the predecessor is reachable from the successor
+        if validate and self._reachable(succ_id, pred_id):
+            raise DAGValidationError('Fail to topological sort')
+
+        self._graph[pred_id].add(succ_id)
+        self._reversed_graph[succ_id].add(pred_id)
+        self._invalidate()
 
     def remove_edge(self, predecessor_node, successor_node):
         if id(successor_node) not in self._graph.get(id(predecessor_node), []):
             raise KeyError('Edge does not exist in the graph')
 
         self._graph[id(predecessor_node)].remove(id(successor_node))
-        if self._reversed_graph is not None:
-            self._reversed_graph[id(successor_node)].remove(id(predecessor_node))
+        self._reversed_graph[id(successor_node)].remove(id(predecessor_node))
+        self._invalidate()
 
     def _indep_ids(self, graph=None, reversed_graph=None):
-        graph = graph or self._graph
-        reversed_graph = reversed_graph or self._reversed_graph
-
-        if reversed_graph is not None:
-            return [node for node, precessors in six.iteritems(reversed_graph)
-                    if len(precessors) == 0]
+        if graph is None:
+            reversed_graph = self._reversed_graph
+        elif reversed_graph is None:
+            reversed_graph = self._build_reversed_graph(graph)
 
-        all_nodes = set(graph.keys())
-        return list(all_nodes - set(itertools.chain(*graph.values())))
+        return [node for node, precessors in six.iteritems(reversed_graph)
+                if len(precessors) == 0]
 
     def indep_nodes(self, graph=None, reversed_graph=None):
         return [self._map.get(i) for i in self._indep_ids(graph=graph,
                                                           reversed_graph=reversed_graph)]
 
+    @staticmethod
+    def _build_reversed_graph(graph):
+        reversed_graph = dict((node_id, set()) for node_id in graph)
+        for node_id, succ_ids in six.iteritems(graph):
+            for succ_id in succ_ids:
+                reversed_graph[succ_id].add(node_id)
+        return reversed_graph
+
     def _predecessor_ids(self, node_id, graph=None, reversed_graph=None):
-        graph = graph or self._graph
-        reversed_graph = reversed_graph or self._reversed_graph
+        if graph is None and reversed_graph is None:
+            return self._reversed_graph[node_id]
         if reversed_graph is not None:
             return reversed_graph[node_id]
         return [nid for nid, deps in six.iteritems(graph) if node_id in deps]
@@ -136,7 +155,7 @@ class DAG(object):
         if id(node) not in self._graph:
             raise KeyError('Node does not exist: %s' % node)
 
-        return [self._map.get(node_id) for node_id in self._predecessor_ids(id(node))]
+        return [self._map.get(node_id) for node_id in self._reversed_graph[id(node)]]
 
     def successors(self, node):
         if id(node) not in self._graph:
@@ -145,13 +164,12 @@ class DAG(object):
         return [self._map.get(node_id) for node_id in self._graph[id(node)]]
 
     def _validate(self, graph=None, reversed_graph=None):
-        graph = graph or self._graph
-        reversed_graph = reversed_graph or self._reversed_graph
-        if len(self.indep_nodes(graph, reversed_graph)) == 0:
+        if len(self._indep_ids(graph, reversed_graph)) == 0 and \
+                len(graph if graph is not None else self._graph) > 0:
             return False, 'No independent nodes detected'
 
         try:
-            self.topological_sort(graph, reversed_graph)
+            self._topological_sort_ids(graph, reversed_graph)
         except ValueError:
             return False, 'Fail to topological sort'
         return True, 'Valid'
@@ -164,15 +182,14 @@ class DAG(object):
         assert all(id(node) in self._graph for node in start_nodes)
 
         visited = set(id(node) for node in start_nodes)
-        node_queue = Queue()
-        [node_queue.put(node) for node in start_nodes]
-        while not node_queue.empty():
-            cur_node = node_queue.get()
+        node_queue = deque(start_nodes)
+        while node_queue:
+            cur_node = node_queue.popleft()
             for up_node in (n for n in successor(cur_node) if cond(n)):
                 if id(up_node) not in visited:
                     visited.add(id(up_node))
                     yield up_node
-                    node_queue.put(up_node)
+                    node_queue.append(up_node)
 
     def ancestors(self, start_nodes, cond=None):
         return list(self.bfs(start_nodes, self.predecessors, cond))
@@ -188,32 +205,40 @@ class DAG(object):
         for it in self.bfs(start_nodes, cond=cond):
             yield it
 
-    def topological_sort(self, graph=None, reversed_graph=None):
-        graph = graph or self._graph
-        graph = deepcopy(graph)
-        reversed_graph = reversed_graph or self._reversed_graph
-        reversed_graph = deepcopy(reversed_graph)
-
-        node_ids = []
-
-        indep_ids = self._indep_ids(graph, reversed_graph)
-        while len(indep_ids) != 0:
-            n = indep_ids.pop(0)
-            node_ids.append(n)
-            for dep_id in deepcopy(graph[n]):
-                graph[n].remove(dep_id)
-                if reversed_graph is not None:
-                    reversed_graph[dep_id].remove(n)
-                if len(self._predecessor_ids(dep_id, graph, reversed_graph)) == 0:
-                    indep_ids.append(dep_id)
+    def _topological_sort_ids(self, graph=None, reversed_graph=None):
+        if graph is None:
+            graph, reversed_graph = self._graph, self._reversed_graph
+        elif reversed_graph is None:
+            reversed_graph = self._build_reversed_graph(graph)
+
+        # Kahn's algorithm over in-degree counts, leaving the graph untouched
+        in_degrees = dict((node_id, len(pred_ids))
+                          for node_id, pred_ids in six.iteritems(reversed_graph))
+        node_ids = [node_id for node_id, degree in six.iteritems(in_degrees) if degree == 0]
+        idx = 0
+        while idx < len(node_ids):
+            for succ_id in graph[node_ids[idx]]:
+                in_degrees[succ_id] -= 1
+                if in_degrees[succ_id] == 0:
+                    node_ids.append(succ_id)
+            idx += 1
 
         if len(node_ids) != len(graph):
             raise ValueError('Graph is not acyclic')
+        return node_ids
+
+    def topological_sort(self, graph=None, reversed_graph=None):
+        if graph is not None or reversed_graph is not None:
+            node_ids = self._topological_sort_ids(graph, reversed_graph)
+        else:
+            node_ids = self._cache.get('topological_order')
+            if node_ids is None:
+                node_ids = self._cache['topological_order'] = self._topological_sort_ids()
 
         return [self._map.get(nid) for nid in node_ids]
 
     def reset_graph(self):
         self._graph = self._graph_dict_type()
+        self._reversed_graph = self._graph_dict_type()
         self._map = self._dict_type()
-        if self._reversed_graph is not None:
-            self._reversed_graph = self._graph_dict_type()
+        self._cache = dict()
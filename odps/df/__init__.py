@@ -24,7 +24,7 @@ from .expr.expressions import SequenceExpr, Scalar, BuiltinFunction, RandomScala
 from .expr.element import switch
 from .expr.datetimes import year, month, day, hour, minute, second, millisecond
 from .expr.reduction import aggregate, agg
-from .utils import output_types, output_names, output
+from .utils import output_types, output_names, output, vectorized
 from ..compat import six
 
 
@@ -17,23 +17,153 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import sys
+import threading
+import weakref
+
+from ...compat import OrderedDict
+from ...config import options
+
+_NO_DEFAULT = object()
+
+def _get_data_size(data):
+    memory_usage = getattr(data, 'memory_usage', None)
+    if callable(memory_usage):
+        # pandas DataFrame or Series
+        try:
+            usage = memory_usage(deep=True)
+        except TypeError:
+            usage = memory_usage()
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    return sys.getsizeof(data)
+
 
 class ExecuteContext(object):
-    def __init__(self):
-        self._expr_id_cached_data = dict()
+    """
+    Data of executed expressions, keyed by expression ids.
+
+    When ``bounded`` is True, the context keeps data within ``options.df.cache_max_bytes``
+    by evicting the least recently used ones, and releases data of expressions once all
+    the expressions tracked by :meth:`track` are garbage collected.
+    """
+    def __init__(self, bounded=False):
+        self._bounded = bounded
+        self._lock = threading.RLock()
+        self._expr_id_cached_data = OrderedDict()
+        self._expr_id_sizes = dict()
+        self._expr_id_refs = dict()
+        self._release_callbacks = []
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._releases = 0
+
+    def _remove(self, expr_id):
+        self._expr_id_cached_data.pop(expr_id, None)
+        self._size -= self._expr_id_sizes.pop(expr_id, 0)
 
     def cache(self, expr, data):
-        if data is not None:
+        if data is None:
+            return
+
+        # data is only sized when limited, as sizing objects walks all the values
+        max_bytes = options.df.cache_max_bytes if self._bounded else None
+        size = _get_data_size(data) if max_bytes is not None else None
+
+        with self._lock:
+            self._remove(expr._id)
+            if size is not None:
+                if size > max_bytes:
+                    self._evictions += 1
+                    return
+                self._expr_id_sizes[expr._id] = size
+                self._size += size
             self._expr_id_cached_data[expr._id] = data
 
+            if self._bounded and options.df.cache_max_bytes is not None:
+                while self._size > options.df.cache_max_bytes:
+                    # evict the least recently used data
+                    evicted_id = next(iter(self._expr_id_cached_data))
+                    self._remove(evicted_id)
+                    self._evictions += 1
+
     def is_cached(self, expr):
-        return expr._id in self._expr_id_cached_data
+        with self._lock:
+            cached = expr._id in self._expr_id_cached_data
+            if cached:
+                self._hits += 1
+            elif getattr(expr, '_need_cache', False):
+                self._misses += 1
+            return cached
 
-    def get_cached(self, expr):
-        return self._expr_id_cached_data[expr._id]
+    def get_cached(self, expr, default=_NO_DEFAULT):
+        """
+        Get cached data of the expression. As data may be evicted by other threads
+        once checked by :meth:`is_cached`, ``default`` is returned if specified
+        when the data does not exist, otherwise KeyError is raised.
+        """
+        with self._lock:
+            data = self._expr_id_cached_data.pop(expr._id, _NO_DEFAULT)
+            if data is _NO_DEFAULT:
+                if default is _NO_DEFAULT:
+                    raise KeyError(expr._id)
+                return default
+            # move to the end as the most recently used
+            self._expr_id_cached_data[expr._id] = data
+            return data
 
     def uncache(self, expr):
-        if expr._id in self._expr_id_cached_data:
-            del self._expr_id_cached_data[expr._id]
+        with self._lock:
+            self._remove(expr._id)
+
+    def track(self, expr):
+        """
+        Keep a weak reference to the expression. When all the tracked expressions
+        of the same id are garbage collected, the data is released and release
+        callbacks are called with the id.
+        """
+        if not self._bounded:
+            return
+
+        expr_id = expr._id
+
+        def on_collected(ref):
+            with self._lock:
+                refs = self._expr_id_refs.get(expr_id)
+                if refs is None:
+                    return
+                refs.discard(ref)
+                if refs:
+                    return
+                del self._expr_id_refs[expr_id]
+                if expr_id in self._expr_id_cached_data:
+                    self._releases += 1
+                self._remove(expr_id)
+                callbacks = list(self._release_callbacks)
+            for callback in callbacks:
+                callback(expr_id)
+
+        with self._lock:
+            refs = self._expr_id_refs.setdefault(expr_id, set())
+            if any(ref() is expr for ref in refs):
+                return
+            refs.add(weakref.ref(expr, on_collected))
+
+    def add_release_callback(self, callback):
+        with self._lock:
+            self._release_callbacks.append(callback)
+
+    def stats(self):
+        """
+        Statistics of the context.
+
+        :return: dict of hits, misses, evictions, releases, number and total size of cached data
+        """
+        with self._lock:
+            return dict(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                        releases=self._releases, count=len(self._expr_id_cached_data),
+                        size=self._size)
 
-context = ExecuteContext()
+context = ExecuteContext(bounded=True)
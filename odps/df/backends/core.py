@@ -331,7 +331,8 @@ class Engine(object):
 
     def _dispatch(self, expr_dag, expr, ctx):
         if expr._need_cache:
-            if not ctx.is_cached(expr):
+            cached = ctx.get_cached(expr, default=None) if ctx.is_cached(expr) else None
+            if cached is None:
                 def h():
                     def inner(*args, **kwargs):
                         ret = self._cache(*args, **kwargs)
@@ -342,7 +343,6 @@ class Engine(object):
                     return inner
                 return h()
             else:
-                cached = ctx.get_cached(expr)
                 expr_dag.substitute(expr, cached,
                                     parents=[e for e in expr_dag.successors(expr)
                                              if e is not cached])
@@ -420,6 +420,9 @@ class Engine(object):
             return e
 
         src_exprs = [rename(it[1]) for it in expr_args_kwargs]
+        for it in expr_args_kwargs:
+            # results are kept as long as the expressions are alive
+            context.track(it[1])
         exprs_dags = self._build_expr_dag([self._convert_table(e) for e in src_exprs])
         for idx, it, expr_dag in zip(itertools.count(0), expr_args_kwargs, exprs_dags):
             action, src_expr, args, kwargs = it
@@ -567,9 +570,10 @@ class Engine(object):
         return self._action(*args, **kwargs)
 
     @classmethod
-    def _get_cached_sub_expr(cls, cached_expr, ctx=None):
-        ctx = ctx or context
-        data = ctx.get_cached(cached_expr)
+    def _get_cached_sub_expr(cls, cached_expr, ctx=None, data=None):
+        if data is None:
+            ctx = ctx or context
+            data = ctx.get_cached(cached_expr)
         if isinstance(cached_expr, CollectionExpr):
             return CollectionExpr(_source_data=data,
                                   _schema=cached_expr._schema)
@@ -581,9 +585,14 @@ class Engine(object):
     def _build_expr_dag(cls, exprs, on_copy=None):
         cached_exprs = ExprDictionary()
 
-        def find_cached(_, n):
+        def find_cached(src, n):
+            if getattr(n, '_need_cache', False):
+                context.track(src)
             if context.is_cached(n) and isinstance(n, (CollectionExpr, Scalar)):
-                cached_exprs[n] = True
+                # data is fetched at once in case of being evicted by other threads
+                data = context.get_cached(n, default=None)
+                if data is not None:
+                    cached_exprs[n] = data
 
         if on_copy is not None:
             if not isinstance(on_copy, Iterable):
@@ -596,7 +605,7 @@ class Engine(object):
 
         res = tuple(expr.to_dag(copy=True, on_copy=on_copy) for expr in exprs)
         for cached in cached_exprs:
-            sub = cls._get_cached_sub_expr(cached)
+            sub = cls._get_cached_sub_expr(cached, data=cached_exprs[cached])
             for dag in res:
                 if dag.contains_node(cached):
                     dag.substitute(cached, sub)
@@ -18,21 +18,22 @@
 # under the License.
 
 import base64
+import hashlib
 import os
 import platform
-import uuid
 
 from .types import df_type_to_odps_type
 from ...expr.collections import RowAppliedCollectionExpr
 from ...expr.element import MappedExpr
 from ...expr.reduction import Aggregation, GroupedAggregation
 from ...expr.utils import get_executed_collection_table_name
-from ...utils import make_copy
+from ...utils import make_copy, is_vectorized
+from ..errors import CompileError
 from ....config import options
 from ....lib import cloudpickle
 from ....compat import OrderedDict, six, PY26, PY27
 from ....models import FileResource, TableResource
-from ....utils import to_str
+from ....utils import to_str, to_binary
 
 dirname = os.path.dirname(os.path.abspath(cloudpickle.__file__))
 CLOUD_PICKLE_FILE = os.path.join(dirname, 'cloudpickle.py')
@@ -601,8 +602,9 @@ def gen_udf(expr, func_cls_name=None, libraries=None):
     func_to_resources = OrderedDict()
     func_params = set()
     if libraries is not None:
-        libraries = [lib if isinstance(lib, six.string_types) else lib.name
-                     for lib in libraries]
+        # sort names to keep generated udfs identical
+        libraries = sorted(lib if isinstance(lib, six.string_types) else lib.name
+                           for lib in libraries)
 
     for node in expr.traverse(unique=True):
         func = getattr(node, 'func', None)
@@ -610,6 +612,8 @@ def gen_udf(expr, func_cls_name=None, libraries=None):
             continue
         if isinstance(func, six.string_types):
             continue
+        if is_vectorized(func):
+            raise CompileError('Batch functions are only supported by the pandas backend')
 
         resources = []
         collection_idx = 0
@@ -632,10 +636,11 @@ def gen_udf(expr, func_cls_name=None, libraries=None):
                     collection_idx += 1
 
                     tp = 'table'
-                    name = 'tmp_pyodps_resource_%s' % (uuid.uuid4())
                     fields = tuple(res.schema.names)
                     create = True
                     table_name = get_executed_collection_table_name(res)
+                    # resources of the same table can be shared
+                    name = 'tmp_pyodps_resource_%s' % hashlib.md5(to_binary(table_name)).hexdigest()
                 resources.append((tp, name, fields, create, table_name))
 
         if isinstance(node, MappedExpr):
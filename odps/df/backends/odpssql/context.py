@@ -17,13 +17,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import hashlib
 import itertools
 import uuid
 import time
 
 from .... import tempobj
+from ..context import context
 from ....compat import OrderedDict, six
-from ....utils import TEMP_TABLE_PREFIX
+from ....utils import TEMP_TABLE_PREFIX, to_binary
 from ....errors import ODPSError
 
 
@@ -34,6 +36,14 @@ expr_deps = dict()
 expr_ref_name = dict()
 
 
+def _release_mem_cache(expr_id):
+    expr_to_sql.pop(expr_id, None)
+    expr_deps.pop(expr_id, None)
+    expr_ref_name.pop(expr_id, None)
+
+context.add_release_callback(_release_mem_cache)
+
+
 class ODPSContext(object):
     def __init__(self, odps, indent_size=2):
         self._odps = odps
@@ -58,8 +68,6 @@ class ODPSContext(object):
         self._indent_size = indent_size
         self._mapjoin_hints = []
 
-        self._to_drops = []
-
     def next_select_id(self):
         return next(self._select_index)
 
@@ -96,8 +104,14 @@ class ODPSContext(object):
     def get_expr_compiled(self, expr):
         return self._compiled_exprs[id(expr)]
 
-    def _gen_udf_name(self):
-        return 'pyodps_udf_%s_%s' % (int(time.time()), str(uuid.uuid4()).replace('-', '_'))
+    @staticmethod
+    def _gen_udf_name(udf, resources=None):
+        # udfs are named after their contents, thus identical udfs generated
+        # by different executions or processes can share the same function
+        digest = hashlib.sha1(to_binary(udf))
+        for res in resources or ():
+            digest.update(to_binary(repr(res)))
+        return 'pyodps_udf_%s' % digest.hexdigest()
 
     def _gen_table_name(self):
         return '%s_%s_%s' % (TEMP_TABLE_PREFIX, int(time.time()),
@@ -105,21 +119,52 @@ class ODPSContext(object):
 
     def register_udfs(self, func_to_udfs, func_to_resources):
         self._func_to_udfs = func_to_udfs
-        for func in func_to_udfs.keys():
-            self._registered_funcs[func] = self._gen_udf_name()
+        for func, udf in six.iteritems(func_to_udfs):
+            self._registered_funcs[func] = self._gen_udf_name(udf, func_to_resources.get(func))
         self._func_to_resources = func_to_resources
 
     def get_udf(self, func):
         return self._registered_funcs[func]
 
+    def has_udfs(self):
+        return len(self._func_to_udfs) > 0
+
+    def _create_shared_resource(self, name, *args, **kwargs):
+        # register before checking existence to keep the resource from being
+        # dropped by other processes when they exit
+        tempobj.register_temp_resource(self._odps, name)
+        if self._odps.exist_resource(name):
+            return self._odps.get_resource(name)
+        try:
+            return self._odps.create_resource(name, *args, **kwargs)
+        except ODPSError:
+            # the resource may be created by another execution at the same time
+            if not self._odps.exist_resource(name):
+                raise
+            return self._odps.get_resource(name)
+
+    def _create_shared_function(self, name, **kwargs):
+        tempobj.register_temp_function(self._odps, name)
+        if self._odps.exist_function(name):
+            return self._odps.get_function(name)
+        try:
+            return self._odps.create_function(name, **kwargs)
+        except ODPSError:
+            if not self._odps.exist_function(name):
+                raise
+            return self._odps.get_function(name)
+
     def create_udfs(self, libraries=None):
+        """
+        Create functions and resources of registered udfs. Functions and resources
+        with identical contents are created only once in the project and reused,
+        and are dropped by tempobj when no living process refers to them.
+        """
         self._func_to_functions.clear()
 
         for func, udf in six.iteritems(self._func_to_udfs):
             udf_name = self._registered_funcs[func]
-            py_resource = self._odps.create_resource(udf_name + '.py', 'py', file_obj=udf)
-            tempobj.register_temp_resource(self._odps, udf_name + '.py')
-            self._to_drops.append(py_resource)
+            py_resource = self._create_shared_resource(udf_name + '.py', 'py', file_obj=udf)
 
             resources = [py_resource, ]
             if func in self._func_to_resources:
@@ -127,21 +172,16 @@ class ODPSContext(object):
                     if not create:
                         resources.append(name)
                     else:
-                        res = self._odps.create_resource(name, 'table',
-                                                         table_name=table_name)
-                        tempobj.register_temp_resource(self._odps, name)
+                        res = self._create_shared_resource(name, 'table', table_name=table_name)
                         resources.append(res)
-                        self._to_drops.append(res)
             if libraries is not None:
                 resources.extend(libraries)
 
-            function = self._odps.create_function(
+            function = self._create_shared_function(
                     udf_name, class_type='{0}.{1}'.format(udf_name, UDF_CLASS_NAME),
                     resources=resources)
-            tempobj.register_temp_function(self._odps, udf_name)
 
             self._func_to_functions[func] = function
-            self._to_drops.append(function)
 
     def add_need_alias_column(self, column):
         if id(column) in self._need_alias_column_indexes:
@@ -205,11 +245,7 @@ class ODPSContext(object):
             h(expr_id)
         return sqls
 
-    def _drop_silent(self, obj):
-        try:
-            obj.drop()
-        except ODPSError:
-            pass
-
     def close(self):
-        [self._drop_silent(it) for it in self._to_drops]
+        # functions and resources are shared with other executions,
+        # thus they are left to tempobj to drop
+        self._func_to_functions.clear()
@@ -26,11 +26,11 @@ import warnings
 import types as tps
 
 from ....errors import ODPSError, NoPermission
-from ....utils import write_log as log
-from ....models import Partition, Resource
+from ....utils import write_log as log, backoff_intervals, to_milliseconds
+from ....models import Partition, Resource, Instance, Table
 from ....tempobj import register_temp_table
 from ....types import PartitionSpec
-from ....ui import reload_instance_status, fetch_instance_group
+from ....ui import reload_instance_status
 from ...core import DataFrame
 from ...expr.reduction import *
 from ...expr.core import ExprDAG
@@ -49,6 +49,7 @@ from .compiler import OdpsSQLCompiler
 from .codegen import gen_udf
 from .tunnel import TunnelEngine
 from .models import MemCacheReference
+from .resultcache import get_result_cache, gen_result_key
 
 
 class SQLExecuteNode(ExecuteNode):
@@ -116,9 +117,9 @@ class ODPSSQLEngine(Engine):
 
     def _reload_ui(self, group, instance, ui):
         if group:
-            reload_instance_status(self._odps, group, instance.id)
+            inst_progress = reload_instance_status(self._odps, group, instance)
             ui.update_group()
-            return fetch_instance_group(group).instances.get(instance.id)
+            return inst_progress
 
     @classmethod
     def _get_libraries(cls, libraries):
@@ -145,8 +146,16 @@ class ODPSSQLEngine(Engine):
         ui.status('Executing', 'execution details')
 
         percent = 0
-        while not instance.is_terminated():
+        intervals = backoff_intervals(1, options.max_poll_interval)
+        while True:
             inst_progress = self._reload_ui(group, instance, ui)
+            # status of the instance is reloaded with its progress
+            if inst_progress is not None:
+                terminated = inst_progress.status == Instance.Status.TERMINATED
+            else:
+                terminated = instance.is_terminated()
+            if terminated:
+                break
 
             if inst_progress:
                 last_percent = percent
@@ -159,7 +168,7 @@ class ODPSSQLEngine(Engine):
                 percent = min(1, max(percent, last_percent))
                 ui.inc((percent - last_percent) * progress_proportion)
 
-            time.sleep(1)
+            time.sleep(next(intervals))
 
         instance.wait_for_success()
 
@@ -320,10 +329,29 @@ class ODPSSQLEngine(Engine):
         sql = self._compile(expr, libraries=libraries)
 
         cache_data = None
+        result_key = None
         if not no_permission and isinstance(expr, CollectionExpr) and not isinstance(expr, Summary):
+            if options.df.persistent_cache:
+                result_key = self._get_result_key(expr, hints=hints)
+                cache_data = self._get_cached_result(result_key)
+            if cache_data is not None:
+                log('Use cached result table: ' + cache_data.name)
+                ui.inc(progress_proportion * 0.9)
+                self._ctx.close()
+                res = self._fetch(expr, src_expr, None, ui,
+                                  cache_data=cache_data, head=head, tail=tail,
+                                  use_tunnel=use_tunnel, group=group,
+                                  progress_proportion=progress_proportion*.1,
+                                  finish=kw.get('finish', True))
+                if kw.get('ret_instance', False) is True:
+                    return None, res
+                return res
+
             # When tunnel cannot handle, we will try to create a table
             tmp_table_name = '%s%s' % (TEMP_TABLE_PREFIX, str(uuid.uuid4()).replace('-', '_'))
-            register_temp_table(self._odps, tmp_table_name)
+            if result_key is None:
+                register_temp_table(self._odps, tmp_table_name)
+            # tables of cached results are left to be dropped by their lifecycles
             cache_data = self._odps.get_table(tmp_table_name)
 
             lifecycle_str = 'LIFECYCLE {0} '.format(lifecycle) if lifecycle is not None else ''
@@ -335,6 +363,9 @@ class ODPSSQLEngine(Engine):
         instance = self._run(sql, ui, progress_proportion=progress_proportion*0.9,
                              hints=hints, priority=priority,
                              group=group, libraries=libraries)
+        if result_key is not None:
+            get_result_cache(self._odps).put(result_key, self._odps.project,
+                                             cache_data.name, lifecycle=lifecycle)
 
         self._ctx.close()  # clear udfs and resources generated
         res = self._fetch(expr, src_expr, instance, ui,
@@ -346,6 +377,43 @@ class ODPSSQLEngine(Engine):
             return instance, res
         return res
 
+    def _get_result_key(self, expr, hints=None):
+        """
+        Get the key of the result of an expression which keeps the same across
+        sessions, None if the result cannot be cached.
+        """
+        if self._ctx.has_udfs():
+            # functions may change without changing the expression
+            return
+
+        sources = []
+        for src in expr.data_source():
+            if not isinstance(src, Table):
+                return
+            src.reload()
+            sources.append([src.project.name, src.name,
+                            to_milliseconds(src.last_modified_time)])
+
+        # compile in a new context to get the same aliases
+        sql = OdpsSQLCompiler(ODPSContext(self._odps), beautify=False).compile(expr)
+        settings = dict(options.sql.settings or dict())
+        settings.update(hints or dict())
+        return gen_result_key(sql, sources, settings)
+
+    def _get_cached_result(self, result_key):
+        if result_key is None:
+            return
+        result_cache = get_result_cache(self._odps)
+        cached = result_cache.get(result_key)
+        if cached is None:
+            return
+
+        project, table_name = cached
+        if not self._odps.exist_table(table_name, project=project):
+            result_cache.remove(result_key)
+            return
+        return self._odps.get_table(table_name, project=project)
+
     def _fetch(self, expr, src_expr, instance, ui, progress_proportion=1,
                cache_data=None, head=None, tail=None, use_tunnel=True,
                group=None, finish=True):
@@ -433,13 +501,13 @@ class ODPSSQLEngine(Engine):
             if drop_table:
                 self._odps.delete_table(name, project=project, if_exists=True)
 
-            sql = self._compile(expr, prettify=False)
+            sql = self._compile(expr, prettify=False, libraries=libraries)
             lifecycle_str = 'LIFECYCLE {0} '.format(lifecycle) if lifecycle is not None else ''
             sql = 'CREATE TABLE {0} {1}AS \n{2}'.format(table_name, lifecycle_str, sql)
 
             should_cache = True
         elif partition is not None:
-            sql = self._compile(expr, prettify=False)
+            sql = self._compile(expr, prettify=False, libraries=libraries)
             t = self._odps.get_table(name, project=project)
 
             for col in expr.schema.columns:
@@ -485,7 +553,7 @@ class ODPSSQLEngine(Engine):
                 self._odps.create_table(name, Schema(columns=columns, partitions=ps), project=project)
             expr = expr[[c.name for c in expr.schema if c.name not in partitions] + partitions]
 
-            sql = self._compile(expr, prettify=False)
+            sql = self._compile(expr, prettify=False, libraries=libraries)
 
             sql = 'INSERT OVERWRITE TABLE {0} PARTITION({1}) \n{2}'.format(
                 name, ', '.join(partitions), sql
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .... import utils
+from ....compat import six
+
+CACHE_ROOT = utils.build_pyodps_dir('df_results')
+
+_result_caches = dict()
+_result_caches_lock = threading.Lock()
+
+
+def _gen_odps_key(odps):
+    return hashlib.md5('####'.join([odps.account.access_id, odps.endpoint, odps.project])
+                       .encode('utf-8')).hexdigest()
+
+
+def gen_result_key(sql, sources, settings=None):
+    """
+    Generate the key of the result of an expression.
+
+    :param sql: SQL compiled from the expression by a new context
+    :param sources: list of project name, table name and last modified time of source tables
+    :param settings: SQL settings when running the SQL
+    """
+    content = json.dumps([sql, sorted(sources), sorted(six.iteritems(settings or dict()))])
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+class ResultCache(object):
+    """
+    Result tables of DataFrame executions recorded in a local file. Tables are
+    kept until their lifecycles expire, thus executions of the same expressions
+    on unchanged sources can reuse them in later sessions.
+    """
+    def __init__(self, file_name):
+        self._file_name = file_name
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self._file_name) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _dump(self, entries):
+        dir_name = os.path.dirname(self._file_name)
+        if not os.path.exists(dir_name):
+            os.makedirs(dir_name)
+        # write into a temp file and rename to avoid reading incomplete files
+        tmp_name = '%s.%s_%s.tmp' % (self._file_name, os.getpid(), threading.current_thread().ident)
+        with open(tmp_name, 'w') as f:
+            json.dump(entries, f)
+        if os.name == 'nt' and os.path.exists(self._file_name):
+            os.unlink(self._file_name)
+        os.rename(tmp_name, self._file_name)
+
+    @staticmethod
+    def _is_expired(entry, now):
+        return entry['expire_time'] is not None and entry['expire_time'] <= now
+
+    def get(self, key):
+        """
+        Get the result table of a key.
+
+        :return: tuple of project name and table name, None if not cached or expired
+        """
+        entry = self._load().get(key)
+        if entry is None or self._is_expired(entry, time.time()):
+            return None
+        return entry['project'], entry['table']
+
+    def put(self, key, project, table, lifecycle=None):
+        """
+        Record the result table of a key.
+
+        :param lifecycle: lifecycle of the table in days, the record never expires if None
+        """
+        with self._lock:
+            now = time.time()
+            entries = dict((k, v) for k, v in six.iteritems(self._load())
+                           if not self._is_expired(v, now))
+            entries[key] = dict(project=project, table=table,
+                                expire_time=now + lifecycle * 24 * 3600 if lifecycle else None)
+            self._dump(entries)
+
+    def remove(self, key):
+        with self._lock:
+            entries = self._load()
+            if entries.pop(key, None) is not None:
+                self._dump(entries)
+
+
+def get_result_cache(odps):
+    odps_key = _gen_odps_key(odps)
+    with _result_caches_lock:
+        if odps_key not in _result_caches:
+            _result_caches[odps_key] = ResultCache(os.path.join(CACHE_ROOT, odps_key + '.json'))
+        return _result_caches[odps_key]
@@ -17,6 +17,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from odps import ODPS
 from odps.tests.core import TestBase
 from odps.compat import unittest, six, PY26
 from odps.models import Schema
@@ -25,6 +26,8 @@ from odps.df.types import validate_data_type
 from odps.df.backends.odpssql.engine import ODPSSQLEngine, UDF_CLASS_NAME
 from odps.df.expr.expressions import CollectionExpr
 from odps.df.expr.tests.core import MockTable
+from odps.df.backends.errors import CompileError
+from odps.df import vectorized
 
 # required by cloudpickle tests
 six.exec_("""
@@ -59,6 +62,29 @@ class ODPSEngine(ODPSSQLEngine):
         return self._compile(new_expr, prettify=prettify, libraries=libraries)
 
 
+class SharedObjectsODPS(ODPS):
+    def __init__(self, *args, **kwargs):
+        super(SharedObjectsODPS, self).__init__(*args, **kwargs)
+        self.created = dict()
+
+    def exist_resource(self, name, project=None):
+        return name in self.created
+
+    def get_resource(self, name, project=None):
+        return self.created[name]
+
+    def create_resource(self, name, typo, project=None, **kwargs):
+        self.created[name] = name
+        return name
+
+    exist_function = exist_resource
+    get_function = get_resource
+
+    def create_function(self, name, project=None, **kwargs):
+        self.created[name] = kwargs
+        return name
+
+
 class Test(TestBase):
     def setup(self):
         datatypes = lambda *types: [validate_data_type(t) for t in types]
@@ -197,5 +223,34 @@ class Test(TestBase):
         self.assertEqual([20, 40],
                          runners.simple_run(udtf, [('name1', 1, None, 10), ('name2', 2, None, 20)]))
 
+    def testSharedUdfs(self):
+        func = lambda x: x + 1
+        odps = SharedObjectsODPS('access_id', 'secret_access_key', 'test_project',
+                                 endpoint='http://127.0.0.1:1')
+
+        udf_names = []
+        for _ in range(2):
+            engine = ODPSEngine(odps)
+            engine.compile(self.expr.id.map(func))
+            udf_names.append(engine._ctx.get_udf(func))
+            engine._ctx.create_udfs()
+            engine._ctx.close()
+
+        # udfs with identical contents share the same function and resource
+        self.assertEqual(udf_names[0], udf_names[1])
+        self.assertEqual(2, len(odps.created))
+        self.assertEqual([udf_names[0] + '.py'], odps.created[udf_names[0]]['resources'])
+
+        engine = ODPSEngine(odps)
+        engine.compile(self.expr.id.map(lambda x: x + 2))
+        self.assertNotEqual(udf_names[0], list(engine._ctx._registered_funcs.values())[0])
+
+    def testVectorizedFunction(self):
+        @vectorized
+        def add_one(s):
+            return s + 1
+
+        self.assertRaises(CompileError, self.engine.compile, self.expr.id.map(add_one))
+
 if __name__ == '__main__':
     unittest.main()
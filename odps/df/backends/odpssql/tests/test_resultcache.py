@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+from odps import ODPS
+from odps.tests.core import TestBase
+from odps.compat import unittest
+from odps.models import Schema
+from odps.df.types import validate_data_type
+from odps.df.expr.expressions import CollectionExpr
+from odps.df.expr.tests.core import MockTable
+from odps.df.backends.odpssql.engine import ODPSSQLEngine
+from odps.df.backends.odpssql.resultcache import ResultCache
+
+
+class ReloadedMockTable(MockTable):
+    def reload(self):
+        pass
+
+
+class Test(TestBase):
+    def setup(self):
+        self.odps = ODPS('access_id', 'secret_access_key', 'test_project',
+                         endpoint='http://127.0.0.1:1')
+        datatypes = lambda *types: [validate_data_type(t) for t in types]
+        schema = Schema.from_lists(['name', 'id', 'fid'], datatypes('string', 'int64', 'float64'))
+        self.table = ReloadedMockTable(name='pyodps_test_expr_table', schema=schema)
+        self.table.last_modified_time = datetime(2017, 1, 1)
+        self.expr = CollectionExpr(_source_data=self.table, _schema=schema)
+
+        self.tempdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _get_result_key(self, engine, expr):
+        expr_dag = expr.to_dag()
+        engine._analyze(expr_dag, expr)
+        root = engine._rewrite(expr_dag)
+        engine._compile(root)
+        return engine._get_result_key(root)
+
+    def testResultCache(self):
+        cache = ResultCache(os.path.join(self.tempdir, 'sub', 'results.json'))
+        self.assertIsNone(cache.get('key'))
+
+        cache.put('key', 'project', 'table', lifecycle=1)
+        cache.put('key2', 'project', 'table2')
+        cache.put('expired', 'project', 'table3', lifecycle=1e-9)
+        time.sleep(0.01)
+
+        # records are shared by caches of the same file
+        cache = ResultCache(os.path.join(self.tempdir, 'sub', 'results.json'))
+        self.assertEqual(('project', 'table'), cache.get('key'))
+        self.assertEqual(('project', 'table2'), cache.get('key2'))
+        self.assertIsNone(cache.get('expired'))
+
+        cache.remove('key')
+        self.assertIsNone(cache.get('key'))
+        self.assertEqual(('project', 'table2'), cache.get('key2'))
+
+    def testResultKey(self):
+        def gen_expr():
+            filtered = self.expr[self.expr.id < 10]
+            return filtered.groupby('name').agg(filtered.fid.sum())
+
+        expr = gen_expr()
+
+        engine = ODPSSQLEngine(self.odps)
+        key = self._get_result_key(engine, expr)
+        self.assertIsNotNone(key)
+
+        # aliases of compilations in an engine change, while keys keep the same
+        key2 = self._get_result_key(engine, gen_expr())
+        self.assertEqual(key, key2)
+        self.assertEqual(key, self._get_result_key(ODPSSQLEngine(self.odps), expr))
+
+        self.assertNotEqual(key, self._get_result_key(engine, self.expr[self.expr.id < 11]))
+        self.assertNotEqual(key, engine._get_result_key(expr, hints={'odps.sql.mapper.split.size': '16'}))
+
+        self.table.last_modified_time = datetime(2017, 1, 2)
+        self.assertNotEqual(key, self._get_result_key(engine, expr))
+
+        # results of user defined functions are not cached
+        expr = self.expr[[self.expr.id.map(lambda x: x + 1)]]
+        self.assertIsNone(self._get_result_key(engine, expr))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+from contextlib import contextmanager
+
+from odps.tests.core import TestBase
+from odps.compat import unittest
+from odps.config import options
+from odps.models import Schema, Record
+from odps.tunnel.tabletunnel.downloadsession import TableDownloadSession
+from odps.df.expr.expressions import CollectionExpr
+from odps.df.expr.tests.core import MockTable
+from odps.df.backends.odpssql.types import odps_schema_to_df_schema
+from odps.df.backends.odpssql.tunnel import TunnelEngine
+
+
+class FakeUI(object):
+    def status(self, *args, **kwargs):
+        pass
+
+    def inc(self, *args, **kwargs):
+        pass
+
+
+class FetchState(object):
+    def __init__(self, partition_data, row_delay=None):
+        self.partition_data = partition_data
+        self.row_delay = row_delay or dict()
+        self.opened = []
+        self.n_read = dict()
+        self.lock = threading.Lock()
+
+
+class PartitionedTable(MockTable):
+    # attributes of models cannot be set freely, thus states are kept by classes
+    state = None
+
+    def iterate_partitions(self, spec=None):
+        class Partition(object):
+            def __init__(self, name):
+                self.name = name
+
+        for name in sorted(self.state.partition_data):
+            yield Partition(name)
+
+    @contextmanager
+    def open_reader(self, partition=None, **_):
+        state, schema = self.state, self.schema
+
+        with state.lock:
+            state.opened.append(partition)
+
+        class Reader(object):
+            status = TableDownloadSession.Status.Normal
+            count = len(state.partition_data[partition])
+
+            @staticmethod
+            def read(start=None, count=None, columns=None):
+                rows = state.partition_data[partition][start:]
+                for values in rows[:count]:
+                    time.sleep(state.row_delay.get(partition, 0))
+                    with state.lock:
+                        state.n_read[partition] = state.n_read.get(partition, 0) + 1
+                    yield Record(schema=schema, values=values + [partition.split('=')[1]])
+
+        yield Reader()
+
+
+class Test(TestBase):
+    def setup(self):
+        self.schema = Schema.from_lists(['id'], ['bigint'], ['ds'], ['string'])
+        self.engine = TunnelEngine(None)
+        self._old_n_threads = options.df.tunnel.n_threads
+
+    def teardown(self):
+        options.df.tunnel.n_threads = self._old_n_threads
+
+    def _gen_expr(self, partition_data, row_delay=None):
+        state = FetchState(partition_data, row_delay=row_delay)
+        table_type = type('PartitionedTable', (PartitionedTable, ), dict(state=state))
+        table = table_type(name='pyodps_test_tunnel_table', schema=self.schema)
+        expr = CollectionExpr(_source_data=table, _schema=odps_schema_to_df_schema(self.schema))
+        return state, expr
+
+    def testParallelFetch(self):
+        partition_data = dict(('ds=%02d' % i, [[i * 10 + j] for j in range(i % 3)])
+                              for i in range(20))
+        expected = [[i * 10 + j, '%02d' % i] for i in range(20) for j in range(i % 3)]
+
+        options.df.tunnel.n_threads = 1
+        _, expr = self._gen_expr(partition_data)
+        self.assertEqual(expected, self.engine.execute(expr, ui=FakeUI()).values.values.tolist())
+
+        options.df.tunnel.n_threads = 4
+        _, expr = self._gen_expr(partition_data)
+        self.assertEqual(expected, self.engine.execute(expr, ui=FakeUI()).values.values.tolist())
+
+        _, expr = self._gen_expr(partition_data)
+        res = self.engine.execute(expr, ui=FakeUI(), head=5)
+        self.assertEqual(expected[:5], res.values.values.tolist())
+
+    def testCancelFetch(self):
+        partition_data = dict(('ds=%02d' % i, [[j] for j in range(1000)]) for i in range(8))
+        row_delay = dict(('ds=%02d' % i, 0.001) for i in range(1, 8))
+
+        options.df.tunnel.n_threads = 2
+        state, expr = self._gen_expr(partition_data, row_delay=row_delay)
+        res = self.engine.execute(expr, ui=FakeUI(), head=1000)
+        self.assertEqual([[j, '00'] for j in range(1000)], res.values.values.tolist())
+
+        # other partitions are not downloaded when the first one holds rows of the head
+        self.assertEqual(['ds=00'], state.opened)
+
+        state, expr = self._gen_expr(partition_data, row_delay=row_delay)
+        res = self.engine.execute(expr, ui=FakeUI(), head=1500)
+        self.assertEqual([[j, '00'] for j in range(1000)] + [[j, '01'] for j in range(500)],
+                         res.values.values.tolist())
+
+        # other partitions are downloaded in parallel when rows are missing,
+        # and no more partitions are downloaded once rows of the head are fetched
+        self.assertEqual(['ds=00', 'ds=01', 'ds=02'], sorted(state.opened))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,12 +18,15 @@
 # under the License.
 
 import itertools
+import threading
+from collections import deque
 from contextlib import contextmanager
 
+from ....config import options
 from ....errors import ODPSError, NoPermission
 from ....utils import init_progress_ui, write_log as log
 from ....types import PartitionSpec
-from ....compat import izip
+from ....compat import izip, futures
 from ....tunnel.tabletunnel.downloadsession import TableDownloadSession
 from ...expr.arithmetic import And, Equal
 from ...expr.reduction import *
@@ -245,6 +248,13 @@ class TunnelEngine(object):
 
                 fetch_partitions = [partition] if filter_all_partitions else \
                     (p.name for p in table.iterate_partitions(partition))
+                n_threads = options.df.tunnel.n_threads
+                if not filter_all_partitions and tail is None and n_threads > 1:
+                    data = self._fetch_partitions(
+                        table, fetch_partitions, size, columns, pkv, n_threads,
+                        ui=ui, progress_proportion=progress_proportion)
+                    return ResultFrame(data, schema=expr._schema)
+
                 if tail is not None:
                     fetch_partitions = list(fetch_partitions)[::-1]
                 if size is None:
@@ -292,6 +302,76 @@ class TunnelEngine(object):
             except ODPSError:
                 return
 
+    def _read_partition(self, table, partition, count, columns, pkv, cancelled):
+        data = []
+        with _open_reader(table, partition=partition) as reader:
+            for r in reader.read(count=count, columns=columns):
+                if cancelled.is_set():
+                    break
+                if pkv:
+                    self._fill_back_partition_values(r, table, pkv)
+                data.append(r.values)
+        return data
+
+    def _fetch_partitions(self, table, partitions, size, columns, pkv, n_threads,
+                          ui=None, progress_proportion=1):
+        """
+        Download partitions with a bounded number of threads, and merge the data
+        in the order of partitions. When ``size`` is specified, the first partition
+        is downloaded alone, as it may hold enough rows, and other partitions are
+        downloaded in parallel only when rows are still missing. Downloads are
+        cancelled once ``size`` rows are fetched.
+        """
+        if size is None:
+            partitions = list(partitions)
+        n_partitions = len(partitions) if size is None else None
+        partitions = iter(partitions)
+
+        cancelled = threading.Event()
+        executor = futures.ThreadPoolExecutor(n_threads)
+        pending = deque()
+
+        def submit():
+            for partition in partitions:
+                pending.append(executor.submit(self._read_partition, table, partition,
+                                               size, columns, pkv, cancelled))
+                return True
+            return False
+
+        try:
+            for _ in range(n_threads if size is None else 1):
+                submit()
+
+            data = []
+            n_fetched = 0
+            last_percent = 0
+            while pending:
+                rows = pending.popleft().result()
+                n_fetched += 1
+
+                if size is not None:
+                    data.extend(rows[:size - len(data)])
+                    percent = float(len(data)) / size * progress_proportion
+                else:
+                    data.extend(rows)
+                    percent = float(n_fetched) / n_partitions * progress_proportion
+                ui.inc(percent - last_percent)
+                last_percent = percent
+
+                if size is not None and len(data) >= size:
+                    break
+                while len(pending) < n_threads and submit():
+                    pass
+
+            if last_percent < progress_proportion:
+                ui.inc(progress_proportion - last_percent)
+            return data
+        finally:
+            cancelled.set()
+            for f in pending:
+                f.cancel()
+            executor.shutdown(wait=True)
+
     @classmethod
     def _fill_back_partition_values(cls, record, table, pkv):
         if pkv:
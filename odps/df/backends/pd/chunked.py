@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Chunked execution of the pandas backend.
+
+Expressions made up of row-wise operations over a single source, optionally
+topped by a groupby or a summary of mergeable reductions, are executed chunk
+by chunk. Rows of every chunk are computed by the pandas compiler, reductions
+are computed into partial aggregates and merged, thus only a chunk and the
+partial aggregates are kept in memory.
+"""
+
+from ...expr.expressions import CollectionExpr, SequenceExpr, Scalar, Column, \
+    FilterCollectionExpr, ProjectCollectionExpr, Summary, AsTypedSequenceExpr
+from ...expr.arithmetic import BinOp
+from ...expr.element import ElementWise, IsIn, NotIn
+from ...expr.collections import RowAppliedCollectionExpr
+from ...expr.groupby import GroupByCollectionExpr
+from ...expr.reduction import Sum, Count, Min, Max, Mean, GroupedSum, GroupedCount, \
+    GroupedMin, GroupedMax, GroupedMean
+from ...expr.dynamic import DynamicMixin
+from ...expr.errors import ExpressionError
+from ....models import Table
+from .... import compat
+from ....compat import six, OrderedDict
+from .compiler import PandasCompiler
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# operation applied on every chunk, and operation to merge the partial results
+_PARTIAL_OPS = {
+    'sum': (('sum', 'sum'), ),
+    'count': (('size', 'sum'), ),
+    'min': (('min', 'min'), ),
+    'max': (('max', 'max'), ),
+    'mean': (('sum', 'sum'), ('count', 'sum')),
+}
+
+_REDUCTION_OPS = {
+    Sum: 'sum', GroupedSum: 'sum',
+    Count: 'count', GroupedCount: 'count',
+    Min: 'min', GroupedMin: 'min',
+    Max: 'max', GroupedMax: 'max',
+    Mean: 'mean', GroupedMean: 'mean',
+}
+
+_KEY_NAME = '__chunk_key'
+
+
+def _get_reduction_op(expr):
+    for cls, op in six.iteritems(_REDUCTION_OPS):
+        if isinstance(expr, cls):
+            return op
+
+
+def _is_row_wise_node(node):
+    if isinstance(node, DynamicMixin) or getattr(node, '_collection_resources', None):
+        return False
+    if isinstance(node, CollectionExpr):
+        if len(node.children()) == 0:
+            return True
+        if isinstance(node, Summary):
+            return False
+        return isinstance(node, (FilterCollectionExpr, ProjectCollectionExpr,
+                                 RowAppliedCollectionExpr))
+    if isinstance(node, (IsIn, NotIn)):
+        return all(isinstance(v, Scalar) for v in node._values or ())
+    if isinstance(node, (Column, AsTypedSequenceExpr, ElementWise, BinOp)):
+        return True
+    # constant scalars
+    return isinstance(node, Scalar) and len(node.children()) == 0 and \
+        node._value is not None
+
+
+def _get_chunk_source(expr):
+    """
+    Get the only source collection of a row-wise expression, None if the
+    expression cannot be executed by chunks.
+    """
+    sources = []
+    for node in expr.traverse(unique=True):
+        if not _is_row_wise_node(node):
+            return
+        if isinstance(node, CollectionExpr) and len(node.children()) == 0:
+            sources.append(node)
+    if len(sources) != 1:
+        return
+
+    source = sources[0]
+    data = source._source_data
+    if pd is not None and isinstance(data, pd.DataFrame):
+        return source
+    if isinstance(data, Table) and not data.schema.partitions:
+        return source
+
+
+class ChunkPlan(object):
+    """
+    How an expression is executed by chunks.
+
+    ``rows`` is the row-wise collection executed on every chunk. When
+    ``reductions`` is not None, ``rows`` contains the group keys named by
+    ``keys`` and inputs of reductions, each of which is a tuple of reduction
+    operation and input column name (None for counting rows).
+    """
+    def __init__(self, source, rows, keys=None, reductions=None, fields=None, names=None):
+        self.source = source
+        self.rows = rows
+        self.keys = keys
+        self.reductions = reductions
+        # tuples of key name and reduction index of output fields
+        self.fields = fields
+        self.names = names
+
+
+def _plan_reductions(root, input, bys, fields):
+    keys, key_fields, reduction_fields = [], [], []
+    projected = []
+    for i, by in enumerate(bys):
+        if not isinstance(by, SequenceExpr):
+            return
+        keys.append('__by_%d' % i)
+        projected.append(by.rename(keys[-1]))
+
+    reductions = []
+    for field in fields:
+        if any(field is by for by in bys):
+            key_fields.append(keys[[id(by) for by in bys].index(id(field))])
+            reduction_fields.append(None)
+            continue
+
+        op = _get_reduction_op(field)
+        if op is None:
+            return
+        if isinstance(field.input, CollectionExpr):
+            if op != 'count' or field.input is not input:
+                return
+            column = None
+        elif isinstance(field.input, SequenceExpr):
+            column = '__agg_%d' % len(reductions)
+            projected.append(field.input.rename(column))
+        else:
+            return
+        key_fields.append(None)
+        reduction_fields.append(len(reductions))
+        reductions.append((op, column))
+
+    if not projected:
+        rows = input
+    else:
+        try:
+            rows = input[projected]
+        except ExpressionError:
+            return
+
+    source = _get_chunk_source(rows)
+    if source is None:
+        return
+    return ChunkPlan(source, rows, keys=keys, reductions=reductions,
+                     fields=list(zip(key_fields, reduction_fields)), names=root.schema.names)
+
+
+def plan_chunks(root):
+    """
+    Plan the chunked execution of an expression.
+
+    :param root: root of the expression
+    :return: :class:`ChunkPlan`, None if the expression cannot be executed by chunks
+    """
+    if isinstance(root, GroupByCollectionExpr):
+        if root._having is not None or not root._by:
+            return
+        return _plan_reductions(root, root.input, root._by, root.fields)
+    if isinstance(root, (Summary, ProjectCollectionExpr)) and root.fields and \
+            all(isinstance(f, (Sum, Count, Min, Max, Mean)) for f in root.fields):
+        return _plan_reductions(root, root.input, [], root.fields)
+    if isinstance(root, CollectionExpr) and len(root.children()) > 0:
+        source = _get_chunk_source(root)
+        if source is not None:
+            return ChunkPlan(source, root)
+
+
+def iter_chunks(source, chunk_size):
+    """
+    Iterate chunks of a source collection as pandas DataFrames together with
+    the total number of rows. At least one chunk is generated even if the
+    source is empty.
+    """
+    data = source._source_data
+    names = source.schema.names
+
+    if isinstance(data, Table):
+        with data.open_reader() as reader:
+            count = reader.count
+            for start in compat.irange(0, max(count, 1), chunk_size):
+                chunk = reader.to_pandas(start=start, count=min(chunk_size, count - start))
+                chunk.columns = names
+                chunk.index = compat.irange(start, start + len(chunk))
+                yield chunk, count
+        return
+
+    data = data.rename(columns=dict(zip(data.columns, names)))
+    for start in compat.irange(0, max(len(data), 1), chunk_size):
+        yield data.iloc[start:start + chunk_size], len(data)
+
+
+def _partial_aggregate(rows, plan):
+    rows = rows.copy() if not plan.keys else rows
+    keys = plan.keys or [_KEY_NAME]
+    if not plan.keys:
+        rows[_KEY_NAME] = 0
+    grouped = rows.groupby(keys)
+
+    columns = OrderedDict()
+    for i, (op, column) in enumerate(plan.reductions):
+        for j, (partial_op, _) in enumerate(_PARTIAL_OPS[op]):
+            if partial_op == 'size':
+                columns['%d_%d' % (i, j)] = grouped.size()
+            else:
+                columns['%d_%d' % (i, j)] = getattr(grouped[column], partial_op)()
+    if not columns:
+        columns['size'] = grouped.size()
+    return pd.concat(list(columns.values()), axis=1, keys=list(columns.keys()))
+
+
+def _merge_partials(partials, plan):
+    merged = pd.concat(partials)
+    merge_ops = dict()
+    for i, (op, _) in enumerate(plan.reductions):
+        for j, (_, merge_op) in enumerate(_PARTIAL_OPS[op]):
+            merge_ops['%d_%d' % (i, j)] = merge_op
+    if not merge_ops:
+        merge_ops['size'] = 'sum'
+    merged = merged.groupby(level=list(range(merged.index.nlevels))).agg(merge_ops)
+    return merged[list(partials[0].columns)]
+
+
+def _finish_reductions(merged, plan):
+    if not plan.keys and len(merged) == 0:
+        # reductions over no rows
+        empty = pd.Series([], dtype=float)
+        values = [len(empty) if op == 'count' else getattr(empty, op)()
+                  for op, _ in plan.reductions]
+        return pd.DataFrame(OrderedDict(
+            (name, [values[idx]]) for name, (_, idx) in zip(plan.names, plan.fields)))
+
+    results = []
+    for i, (op, _) in enumerate(plan.reductions):
+        if op == 'mean':
+            counts = merged['%d_1' % i]
+            results.append(merged['%d_0' % i] / counts.where(counts > 0))
+        else:
+            results.append(merged['%d_0' % i])
+
+    index = merged.index
+    columns = []
+    for key, idx in plan.fields:
+        if key is not None:
+            columns.append(index.get_level_values(plan.keys.index(key)))
+        else:
+            columns.append(results[idx].values)
+    frame = pd.DataFrame(OrderedDict(zip(plan.names, columns)), columns=plan.names)
+    if plan.keys:
+        return pd.DataFrame(frame.values, columns=plan.names)
+    return frame
+
+
+def execute_chunks(plan, chunk_size, run, head=None, tail=None, on_chunk=None):
+    """
+    Execute the plan chunk by chunk.
+
+    :param plan: :class:`ChunkPlan` returned by :func:`plan_chunks`
+    :param chunk_size: number of source rows in every chunk
+    :param run: function to compute the pandas result of an expression dag and
+                its compiled pandas dag
+    :param head: stop reading chunks once so many rows of row-wise results are computed
+    :param tail: only keep so many rows at the end of row-wise results
+    :param on_chunk: called with numbers of processed and total source rows once
+                     a chunk is done
+    :return: pandas DataFrame
+    """
+    source = plan.source
+    data = source._source_data
+
+    results, n_rows = [], 0
+    partials, n_partial_rows = [], 0
+    n_processed = 0
+    try:
+        for chunk, n_total in iter_chunks(source, chunk_size):
+            source._source_data = chunk
+            expr_dag = plan.rows.to_dag(copy=False)
+            res = run(expr_dag, PandasCompiler(expr_dag).compile(plan.rows))
+
+            if plan.reductions is None:
+                results.append(res)
+                n_rows += len(res)
+                if tail is not None:
+                    results = [pd.concat(results)[-tail:]]
+            else:
+                partials.append(_partial_aggregate(res, plan))
+                n_partial_rows += len(partials[-1])
+                if len(partials) > 1 and n_partial_rows > chunk_size:
+                    # merge partial results to keep them bounded
+                    partials = [_merge_partials(partials, plan)]
+                    n_partial_rows = len(partials[0])
+
+            n_processed += len(chunk)
+            if on_chunk is not None:
+                on_chunk(n_processed, n_total)
+            if head is not None and plan.reductions is None and n_rows >= head:
+                break
+    finally:
+        source._source_data = data
+
+    if plan.reductions is None:
+        return pd.concat(results) if len(results) > 1 else results[0]
+    return _finish_reductions(_merge_partials(partials, plan), plan)
+
@@ -17,6 +17,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import functools
 import itertools
 import json
 from datetime import datetime
@@ -30,11 +31,12 @@ from ...expr.merge import JoinCollectionExpr
 from ...expr.datetimes import DTScalar
 from ...expr.collections import PivotCollectionExpr
 from ...expr import arithmetic, element
-from ...utils import traverse_until_source
+from ...utils import traverse_until_source, is_vectorized
 from ....dag import DAG
 from ..errors import CompileError
 from ..utils import refresh_dynamic
 from . import types
+from .parallel import map_chunks
 from ... import types as df_types
 from ....models import FileResource, TableResource, Schema
 from .... import compat
@@ -748,7 +750,12 @@ class PandasCompiler(Backend):
             args = expr._func_args
             kwargs = expr._func_kwargs or dict()
 
-            if resources:
+            if is_vectorized(func) and not inspect.isclass(func):
+                # arguments of batch functions are passed when called
+                agg = func(resources) if resources else func
+                if args or kwargs:
+                    agg = functools.partial(self._call_batch_func, agg, args, kwargs)
+            elif resources:
                 if not args and not kwargs:
                     agg = func(resources)
                 else:
@@ -769,13 +776,19 @@ class PandasCompiler(Backend):
                 size = len(input)
             bys = [(by * size if len(by) == 1 else by) for by in bys]
 
-            def f(x):
-                buffer = agg.buffer()
-                for it in x.iterrows():
-                    agg(buffer, *it[1])
-                ret = agg.getvalue(buffer)
-                np_type = types.df_type_to_np_type(expr.dtype)
-                return np.array([ret,], dtype=np_type)[0]
+            np_type = types.df_type_to_np_type(expr.dtype)
+
+            if is_vectorized(func):
+                def f(x):
+                    ret = agg(*(x.iloc[:, i] for i in range(x.shape[1])))
+                    return np.array([ret, ], dtype=np_type)[0]
+            else:
+                def f(x):
+                    buffer = agg.buffer()
+                    for it in x.iterrows():
+                        agg(buffer, *it[1])
+                    ret = agg.getvalue(buffer)
+                    return np.array([ret,], dtype=np_type)[0]
 
             res = input.groupby(bys).apply(f)
             if isinstance(expr, Scalar):
@@ -850,7 +863,12 @@ class PandasCompiler(Backend):
                     if resources:
                         func = func(resources)
 
-                res = input.map(func)
+                if is_vectorized(expr._func):
+                    res = self._to_batch_series(func(input), input.index, input.name)
+                elif resources:
+                    res = input.map(func)
+                else:
+                    res = pd.concat(map_chunks(lambda chunk: chunk.map(func), input))
                 if isinstance(expr.inputs[0], Scalar):
                     return res[0]
                 return res
@@ -877,8 +895,21 @@ class PandasCompiler(Backend):
                         return res
                     return next(res)
 
-                return input.apply(func, axis=1, reduce=True,
-                                   args=expr._func_args, **expr._func_kwargs)
+                if is_vectorized(expr._func):
+                    if not inspect.isfunction(expr._func):
+                        f = expr._func(resources) if resources else expr._func()
+                    else:
+                        f = expr._func(resources) if resources else expr._func
+                    res = f(input, *expr._func_args, **expr._func_kwargs)
+                    return self._to_batch_series(res, input.index)
+
+                def apply_chunk(chunk):
+                    return chunk.apply(func, axis=1, reduce=True,
+                                       args=expr._func_args, **expr._func_kwargs)
+
+                if resources:
+                    return apply_chunk(input)
+                return pd.concat(map_chunks(apply_chunk, input))
 
         self._add_node(expr, handle)
 
@@ -898,6 +929,48 @@ class PandasCompiler(Backend):
 
         self._add_node(expr, handle)
 
+    @staticmethod
+    def _call_batch_func(func, args, kwargs, *inputs):
+        return func(*(inputs + tuple(args)), **kwargs)
+
+    @staticmethod
+    def _to_batch_series(res, index, name=None):
+        if isinstance(res, pd.Series):
+            res = res.values
+        return pd.Series(np.asarray(res), index=index, name=name)
+
+    @staticmethod
+    def _to_batch_frame(res, names):
+        if isinstance(res, pd.DataFrame):
+            res = res.reset_index(drop=True)
+            res.columns = names
+            return res
+        elif isinstance(res, pd.Series):
+            return pd.DataFrame({names[0]: res.values}, columns=names)
+        return pd.DataFrame(list(res), columns=names)
+
+    def _apply_batch_func(self, expr, input, func, is_generator_function,
+                          close_func, is_close_generator_function):
+        names = expr.schema.names
+        input = input.copy()
+        input.columns = [f.name for f in expr.fields]
+
+        def to_frames(res, is_generator):
+            if res is None:
+                return []
+            if is_generator:
+                return [self._to_batch_frame(r, names) for r in res]
+            return [self._to_batch_frame(res, names)]
+
+        frames = to_frames(func(input, *expr._func_args, **expr._func_kwargs),
+                           is_generator_function)
+        if close_func:
+            frames.extend(to_frames(close_func(*expr._func_args, **expr._func_kwargs),
+                                    is_close_generator_function))
+        if not frames:
+            return pd.DataFrame([], columns=names)
+        return pd.concat(frames, ignore_index=True)
+
     def visit_apply_collection(self, expr):
         def conv(l):
             if isinstance(l, tuple):
@@ -933,16 +1006,28 @@ class PandasCompiler(Backend):
             else:
                 raise NotImplementedError
 
-            rows = []
-            for s in input.iterrows():
-                row = t(*s[1])
-                res = func(row, *expr._func_args, **expr._func_kwargs)
-                if is_generator_function:
-                    for l in res:
-                        rows.append(conv(l))
-                else:
-                    if res:
-                        rows.append(conv(res))
+            if is_vectorized(expr._func):
+                return self._apply_batch_func(expr, input, func, is_generator_function,
+                                              close_func, is_close_generator_function)
+
+            def apply_chunk(chunk):
+                chunk_rows = []
+                for s in chunk.iterrows():
+                    row = t(*s[1])
+                    res = func(row, *expr._func_args, **expr._func_kwargs)
+                    if is_generator_function:
+                        for l in res:
+                            chunk_rows.append(conv(l))
+                    else:
+                        if res:
+                            chunk_rows.append(conv(res))
+                return chunk_rows
+
+            if resources or close_func:
+                # states of functions are needed by close functions and resources
+                rows = apply_chunk(input)
+            else:
+                rows = list(itertools.chain(*map_chunks(apply_chunk, input)))
             if close_func:
                 if is_close_generator_function:
                     for l in close_func(*expr._func_args, **expr._func_kwargs):
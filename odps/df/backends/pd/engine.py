@@ -17,8 +17,6 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import itertools
-
 from .compiler import PandasCompiler
 from .types import pd_to_df_schema
 from ..core import Engine, ExecuteNode, ExprDAG
@@ -34,9 +32,12 @@ from ...utils import is_source_collection, is_constant_scalar
 from ....models import Schema, Partition
 from ....errors import ODPSError
 from ....types import PartitionSpec
-from .... import compat
+from .... import compat, types as odps_types
+from ....compat import six
 from ..context import context
+from ....config import options
 from . import analyzer as ana
+from . import chunked
 
 
 class PandasExecuteNode(ExecuteNode):
@@ -56,7 +57,12 @@ class PandasEngine(Engine):
 
     def _run(self, expr_dag, pd_dag, ui=None, progress_proportion=1, **_):
         ui.status('Try to execute by local pandas...')
+        res = self._run_dag(expr_dag, pd_dag)
+        ui.inc(progress_proportion)
+        return res
 
+    @classmethod
+    def _run_dag(cls, expr_dag, pd_dag):
         results = ExprDictionary()
         while True:
             topos = pd_dag.topological_sort()
@@ -81,8 +87,6 @@ class PandasEngine(Engine):
             if no_sub:
                 break
 
-        ui.inc(progress_proportion)
-
         try:
             return results[expr_dag.root]
         except KeyError as e:
@@ -146,12 +150,20 @@ class PandasEngine(Engine):
 
         src_expr = expr
 
-        pd_dag = self._compile(expr_dag)
-        df = self._run(expr_dag, pd_dag, ui=ui, progress_proportion=progress_proportion,
-                       **kw)
+        plan = chunked.plan_chunks(expr_dag.root) if options.df.pandas.chunk_size else None
+        # rows are partially computed when chunks are cut by head or tail
+        partial = plan is not None and plan.reductions is None and bool(head or tail)
+        if plan is not None:
+            df = self._run_chunks(plan, ui=ui, progress_proportion=progress_proportion,
+                                  head=head, tail=tail)
+        else:
+            pd_dag = self._compile(expr_dag)
+            df = self._run(expr_dag, pd_dag, ui=ui, progress_proportion=progress_proportion,
+                           **kw)
 
         if not isinstance(src_expr, Scalar):
-            context.cache(src_expr, df)
+            if not partial:
+                context.cache(src_expr, df)
             if head:
                 df = df[:head]
             elif tail:
@@ -164,39 +176,120 @@ class PandasEngine(Engine):
             context.cache(src_expr, res)
             return res
 
+    def _run_chunks(self, plan, ui=None, progress_proportion=1, head=None, tail=None):
+        ui.status('Try to execute by local pandas in chunks...')
+
+        last_percent = [0]
+
+        def on_chunk(n_processed, n_total):
+            percent = float(n_processed) / max(n_total, 1) * progress_proportion
+            ui.inc(percent - last_percent[0])
+            last_percent[0] = percent
+
+        res = chunked.execute_chunks(plan, options.df.pandas.chunk_size, self._run_dag,
+                                     head=head, tail=tail, on_chunk=on_chunk)
+        if last_percent[0] < progress_proportion:
+            ui.inc(progress_proportion - last_percent[0])
+        return res
+
+    WRITE_BATCH_ROWS = 65536
+
+    # kinds of NumPy dtypes which can be written into columns without validation
+    _WRITE_DTYPE_KINDS = {
+        odps_types.bigint: 'iub',
+        odps_types.double: 'iuf',
+        odps_types.boolean: 'b',
+        odps_types.datetime: 'M',
+    }
+
+    # types inferred from values of object columns which can be written without validation
+    _WRITE_INFERRED_TYPES = {
+        odps_types.bigint: ('integer', ),
+        odps_types.double: ('floating', 'integer', 'mixed-integer-float'),
+        odps_types.boolean: ('boolean', ),
+        odps_types.datetime: ('datetime', ),
+        odps_types.string: ('string' if six.PY3 else 'unicode', ),
+    }
+
     @classmethod
-    def _convert_pd_type(cls, values, table):
+    def _convert_pd_column(cls, series, data_type):
+        """
+        Convert a column whose dtype does not fit the type. The column is checked
+        as a whole first, and values are validated one by one only when it fails.
+        """
+        import numpy as np
         import pandas as pd
+        try:
+            from pandas.api.types import infer_dtype
+        except ImportError:
+            from pandas.lib import infer_dtype
+
+        values = series.values
+        nulls = pd.isnull(values)
+        non_nulls = values[~nulls] if nulls.any() else values
+
+        if len(non_nulls) == 0:
+            return np.empty(len(values), dtype=object)
+        if values.dtype.kind == 'f' and data_type == odps_types.bigint:
+            # like bigint columns with nulls, values are truncated as what is done in records
+            if np.isfinite(non_nulls).all():
+                data_type.validate_value(int(non_nulls.min()))
+                data_type.validate_value(int(non_nulls.max()))
+                return values
+        elif values.dtype.kind == 'O' and \
+                infer_dtype(non_nulls) in cls._WRITE_INFERRED_TYPES.get(data_type, ()):
+            if data_type == odps_types.bigint:
+                data_type.validate_value(min(non_nulls))
+                data_type.validate_value(max(non_nulls))
+            elif data_type == odps_types.string:
+                data_type.validate_value(max(non_nulls, key=len))
+            return values
+
+        # values are validated and cast as what is done in records
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = [None if null else odps_types.validate_value(v, data_type)
+                  for v, null in compat.izip(series.tolist(), nulls)]
+        return arr
 
-        retvals = []
-        for val, t in compat.izip(values, table.schema.types):
-            if pd.isnull(val):
-                retvals.append(None)
+    @classmethod
+    def _convert_pd_columns(cls, df, table):
+        schema = table.schema
+        columns = [col for col in schema.columns if not schema.is_partition(col)]
+
+        converted = []
+        for i, col in enumerate(columns):
+            series = df.iloc[:, i]
+            values = series.values
+            kind = values.dtype.kind
+            if kind in cls._WRITE_DTYPE_KINDS.get(col.type, '') and \
+                    not (kind == 'u' and values.dtype.itemsize >= 8):
+                converted.append(values)
             else:
-                retvals.append(val)
+                converted.append(cls._convert_pd_column(series, col.type))
+        return converted
+
+    def _write_frame(self, df, writer, table, ui, size, curr, last_percent,
+                     progress_proportion=1):
+        for start in compat.irange(0, len(df), self.WRITE_BATCH_ROWS):
+            batch = df.iloc[start:start + self.WRITE_BATCH_ROWS]
+            writer.write_batch(self._convert_pd_columns(batch, table))
 
-        return retvals
+            curr[0] += len(batch)
+            percent = float(curr[0]) / size * progress_proportion
+            ui.inc(percent - last_percent[0])
+            last_percent[0] = percent
 
     def _write_table_no_partitions(self, frame, table, ui, partition=None,
                                    progress_proportion=1):
-        def gen():
-            df = frame.values
-            size = len(df)
-
-            last_percent = 0
-            for i, row in zip(itertools.count(), df.values):
-                if i % 50 == 0:
-                    percent = float(i) / size * progress_proportion
-                    ui.inc(percent - last_percent)
-                    last_percent = percent
-
-                yield table.new_record(self._convert_pd_type(row, table))
-
-            if last_percent < progress_proportion:
-                ui.inc(progress_proportion - last_percent)
+        df = frame.values
+        last_percent = [0]
 
         with table.open_writer(partition=partition) as writer:
-            writer.write(gen())
+            self._write_frame(df, writer, table, ui, len(df), [0], last_percent,
+                              progress_proportion=progress_proportion)
+
+        if last_percent[0] < progress_proportion:
+            ui.inc(progress_proportion - last_percent[0])
 
     def _write_table_with_partitions(self, frame, table, partitions, ui,
                                      progress_proportion=1):
@@ -204,8 +297,11 @@ class PandasEngine(Engine):
         vals_to_partitions = dict()
         for ps in df[partitions].drop_duplicates().values:
             p = ','.join('='.join([str(n), str(v)]) for n, v in zip(partitions, ps))
-            table.create_partition(p)
             vals_to_partitions[tuple(ps)] = p
+        specs = list(vals_to_partitions.values())
+        for p, exists in zip(specs, table.exist_partitions(specs)):
+            if not exists:
+                table.create_partition(p, if_not_exists=True)
 
         size = len(df)
         curr = [0]
@@ -214,18 +310,9 @@ class PandasEngine(Engine):
             name = name if isinstance(name, tuple) else (name, )
             group = group[[it for it in group.columns.tolist() if it not in partitions]]
 
-            def gen():
-                for i, row in zip(itertools.count(), group.values):
-                    curr[0] += i
-                    if curr[0] % 50 == 0:
-                        percent = float(curr[0]) / size * progress_proportion
-                        ui.inc(percent - last_percent[0])
-                        last_percent[0] = percent
-
-                    yield table.new_record(self._convert_pd_type(row, table))
-
             with table.open_writer(partition=vals_to_partitions[name]) as writer:
-                writer.write(gen())
+                self._write_frame(group, writer, table, ui, size, curr, last_percent,
+                                  progress_proportion=progress_proportion)
 
         if last_percent[0] < progress_proportion:
             ui.inc(progress_proportion - last_percent[0])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+import os
+import threading
+
+from ....compat import six, futures
+from ....config import options
+
+_tasks = dict()
+_task_ids = itertools.count()
+_tasks_lock = threading.Lock()
+
+
+def _can_fork():
+    if not hasattr(os, 'fork'):
+        return False
+    if six.PY3:
+        import multiprocessing
+        return multiprocessing.get_start_method() == 'fork'
+    return True
+
+
+def _run_task(task_id, start, end):
+    return _tasks[task_id](start, end)
+
+
+def map_chunks(func, df, n_workers=None):
+    """
+    Split the data frame into continuous chunks and call the function on every
+    chunk in a process pool. Functions and data are inherited by forked workers
+    instead of being pickled, thus closures and local classes can be used, while
+    only results are sent back.
+
+    :param func: function called with every chunk
+    :param df: pandas DataFrame or Series to split
+    :param n_workers: number of processes, ``options.df.pandas.n_workers`` by default
+    :return: list of results in the order of chunks
+    """
+    n_workers = n_workers or options.df.pandas.n_workers
+    n_chunks = min(n_workers or 1, len(df))
+    if n_chunks <= 1 or not _can_fork():
+        return [func(df)]
+
+    chunk_size = (len(df) + n_chunks - 1) // n_chunks
+    starts = list(six.moves.range(0, len(df), chunk_size))
+    ends = starts[1:] + [len(df)]
+
+    with _tasks_lock:
+        task_id = next(_task_ids)
+        _tasks[task_id] = lambda start, end: func(df.iloc[start:end])
+    try:
+        # workers are forked when tasks are submitted, after the task is registered
+        pool = futures.ProcessPoolExecutor(len(starts))
+        try:
+            return list(pool.map(_run_task, [task_id] * len(starts), starts, ends))
+        finally:
+            pool.shutdown(wait=True)
+    finally:
+        with _tasks_lock:
+            del _tasks[task_id]
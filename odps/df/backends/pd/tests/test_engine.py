@@ -20,9 +20,12 @@
 from datetime import timedelta, datetime
 from random import randint
 from decimal import Decimal
+import os
 import re
+from contextlib import contextmanager
 
 from odps.df.backends.tests.core import TestBase, to_str, tn, pandas_case
+from odps.config import options
 from odps.compat import unittest, irange as xrange, OrderedDict
 from odps.df.types import validate_data_type
 from odps.df.expr.expressions import *
@@ -30,7 +33,7 @@ from odps.df.backends.pd.engine import PandasEngine
 from odps.df.backends.odpssql.engine import ODPSSQLEngine
 from odps.df.backends.odpssql.types import df_schema_to_odps_schema
 from odps.df.backends.context import context
-from odps.df import output_types, output_names, output, day, millisecond, agg
+from odps.df import output_types, output_names, output, vectorized, day, millisecond, agg
 
 TEMP_FILE_RESOURCE = tn('pyodps_tmp_file_resource')
 TEMP_TABLE = tn('pyodps_temp_table')
@@ -683,6 +686,188 @@ class Test(TestBase):
 
         self.assertEqual(sorted([r[0] for r in result]), sorted([r for r in gen_expected(data)]))
 
+    def testVectorizedFunctions(self):
+        data = [
+            ['name1', 4, 5.3, None, None, None],
+            ['name2', 2, 3.5, None, None, None],
+            ['name1', 4, 4.2, None, None, None],
+            ['name1', 3, 2.2, None, None, None],
+        ]
+        data = self._gen_data(data=data)
+
+        sizes = []
+
+        @vectorized
+        def add(s, n=1):
+            sizes.append(len(s))
+            return s + n
+
+        expr = self.expr.id.map(add)
+        result = self._get_result(self.engine.execute(expr))
+        self.assertEqual([[r[1] + 1] for r in data], result)
+        self.assertEqual([4], sizes)
+
+        @vectorized
+        def plus(df):
+            return df.id + df.fid
+
+        expr = self.expr['id', 'fid'].apply(plus, axis=1, reduce=True, names='s', types='float')
+        result = self._get_result(self.engine.execute(expr))
+        self.assertEqual([[r[1] + r[2]] for r in data], result)
+
+        @output(['name', 'double_id'], ['string', 'int'])
+        @vectorized
+        def double(df, times=2):
+            return df[df.id > 2].assign(id=df.id * times)
+
+        expr = self.expr['name', 'id'].apply(double, axis=1)
+        result = self._get_result(self.engine.execute(expr))
+        self.assertEqual([[r[0], r[1] * 2] for r in data if r[1] > 2], result)
+
+        @vectorized
+        class Chunks(object):
+            def __call__(self, df):
+                yield [(n, ) for n in df.name]
+                yield df[['name']].head(1)
+
+            def close(self):
+                return [('closed', )]
+
+        expr = self.expr['name', 'id'].apply(Chunks, axis=1, names='name')
+        result = self._get_result(self.engine.execute(expr))
+        self.assertEqual([[r[0]] for r in data] + [[data[0][0]], ['closed']], result)
+
+        @vectorized
+        def weighted_sum(ids, fids, bias=0):
+            return (ids * fids).sum() + bias
+
+        expr = self.expr.groupby('name').agg(s=agg([self.expr.id, self.expr.fid], weighted_sum,
+                                                     rtype='float', args=(1, )))
+        result = sorted(self._get_result(self.engine.execute(expr)))
+        expected = dict()
+        for r in data:
+            expected[r[0]] = expected.get(r[0], 1) + r[1] * r[2]
+        self.assertEqual(sorted(map(list, expected.items())), [[r[0], r[1]] for r in result])
+
+    @unittest.skipIf(not hasattr(os, 'fork'), 'Parallel execution needs fork')
+    def testParallelFunctions(self):
+        data = self._gen_data(100, value_range=(-1000, 1000))
+
+        n = 3
+        options.df.pandas.n_workers = 4
+        try:
+            expr = self.expr.id.map(lambda x: x + n)
+            result = self._get_result(self.engine.execute(expr))
+            self.assertEqual([[r[1] + n] for r in data], result)
+
+            expr = self.expr['id', 'fid'].apply(lambda row: row.id * 2, axis=1, reduce=True,
+                                                names=['id'], types=['int'])
+            result = self._get_result(self.engine.execute(expr))
+            self.assertEqual([[r[1] * 2] for r in data], result)
+
+            def handle(row):
+                yield row.name, os.getpid()
+                yield row.name, os.getpid()
+
+            expr = self.expr['name', 'id'].apply(handle, axis=1, names=['name', 'pid'],
+                                                 types=['string', 'int'])
+            result = self._get_result(self.engine.execute(expr))
+            self.assertEqual([r[0] for r in data for _ in range(2)], [r[0] for r in result])
+            # rows are handled by the pool rather than by current process
+            pids = set(r[1] for r in result)
+            self.assertNotIn(os.getpid(), pids)
+            self.assertGreater(len(pids), 1)
+        finally:
+            options.df.pandas.n_workers = 1
+
+    def testChunkedExecution(self):
+        import pandas as pd
+        from odps.df.expr.tests.core import MockTable
+
+        data = self._gen_data(100, value_range=(-10, 10), nullable_field='fid')
+
+        batch_sizes = []
+
+        @vectorized
+        def plus(s):
+            batch_sizes.append(len(s))
+            return s + 1
+
+        def gen_groupby(expr):
+            return expr.groupby('name').agg(s=expr.fid.sum(), m=expr.fid.mean(), c=expr.count(),
+                                            mi=expr.id.min(), mx=expr.id.max())
+
+        def gen_exprs():
+            # new expressions are created to avoid cached results
+            filtered = self.expr[self.expr.id < 5]
+            return [
+                filtered[filtered.name, filtered.id.map(plus, rtype='int').rename('id1')],
+                gen_groupby(filtered),
+                gen_groupby(self.expr),
+                self.expr.fid.mean(),
+                self.expr[self.expr.id.sum(), self.expr.fid.max().rename('fid_max')],
+                self.expr[self.expr.id > 10].fid.sum(),
+            ]
+
+        def assert_result_equal(expect, result):
+            # floats may differ as they are summed in a different order
+            if isinstance(expect, list):
+                self.assertEqual(len(expect), len(result))
+                for e, r in zip(expect, result):
+                    assert_result_equal(e, r)
+            elif isinstance(expect, float) and expect == expect:
+                self.assertAlmostEqual(expect, result, delta=abs(expect) * 1e-9)
+            else:
+                self.assertEqual(str(expect), str(result))
+
+        expected = [self._get_result(self.engine.execute(expr)) for expr in gen_exprs()]
+
+        options.df.pandas.chunk_size = 30
+        try:
+            del batch_sizes[:]
+            for expr, expect in zip(gen_exprs(), expected):
+                assert_result_equal(expect, self._get_result(self.engine.execute(expr)))
+            # functions are called once per chunk
+            self.assertEqual(4, len(batch_sizes))
+
+            # reading stops once the head is satisfied
+            del batch_sizes[:]
+            result = self._get_result(self.engine.execute(gen_exprs()[0], head=1))
+            self.assertEqual(expected[0][:1], result)
+            self.assertEqual(1, len(batch_sizes))
+
+            result = self._get_result(self.engine.execute(gen_exprs()[0], tail=2))
+            self.assertEqual(expected[0][-2:], result)
+
+            # partial results of head or tail are not cached
+            expr = gen_exprs()[0]
+            self.assertEqual(expected[0][:1], self._get_result(self.engine.execute(expr, head=1)))
+            self.assertEqual(expected[0][-1:], self._get_result(self.engine.execute(expr, tail=1)))
+            assert_result_equal(expected[0], self._get_result(self.engine.execute(expr)))
+
+            # ODPS tables are read by the tunnel reader chunk by chunk
+            reads = []
+
+            class ChunkedTable(MockTable):
+                @contextmanager
+                def open_reader(self, **_):
+                    class Reader(object):
+                        count = len(data)
+
+                        @staticmethod
+                        def to_pandas(start=None, count=None):
+                            reads.append((start, count))
+                            return pd.DataFrame(data[start:start + count])
+
+                    yield Reader()
+
+            table = ChunkedTable(name=tn('pyodps_test_chunked_table'), schema=self.schema)
+            expr = gen_groupby(CollectionExpr(_source_data=table, _schema=self.expr.schema))
+            assert_result_equal(expected[2], self._get_result(self.engine.execute(expr)))
+            self.assertEqual([(0, 30), (30, 30), (60, 30), (90, 10)], reads)
+        finally:
+            options.df.pandas.chunk_size = None
+
     def testMapReduceByApplyDistributeSort(self):
         data = [
             ['name key', 4, 5.3, None, None, None],
@@ -2059,6 +2244,60 @@ class Test(TestBase):
         finally:
             self.odps.delete_table(table_name, if_exists=True)
 
+    def testConvertPersistedColumns(self):
+        import numpy as np
+        import pandas as pd
+        from odps.models import Schema as OdpsSchema
+        from odps.df.expr.tests.core import MockTable
+
+        schema = OdpsSchema.from_lists(['id', 'fid', 'name', 'dt'],
+                                       ['bigint', 'double', 'string', 'datetime'], ['ds'], ['string'])
+        table = MockTable(name=tn('pyodps_test_convert_persisted_table'), schema=schema)
+
+        dt = datetime(2017, 1, 1)
+        df = pd.DataFrame(OrderedDict([('id', [1, 2]), ('fid', [1, 2]),
+                                       ('name', ['a', None]), ('dt', [dt, None])]))
+        columns = PandasEngine._convert_pd_columns(df, table)
+        # columns of compatible dtypes are written as is
+        self.assertEqual(['i', 'i'], [columns[0].dtype.kind, columns[1].dtype.kind])
+        self.assertEqual(['a', None], columns[2].tolist())
+        self.assertEqual('M', columns[3].dtype.kind)
+
+        df = pd.DataFrame(OrderedDict([('id', [1.0, np.nan]), ('fid', ['1.5', None]),
+                                       ('name', [b'a', u'b']), ('dt', [dt, None])]))
+        columns = PandasEngine._convert_pd_columns(df, table)
+        self.assertEqual('f', columns[0].dtype.kind)
+        self.assertEqual([1.5, None], columns[1].tolist())
+        self.assertEqual([u'a', u'b'], columns[2].tolist())
+
+        # columns are checked as a whole without validating every value
+        from odps import types as odps_types
+
+        def validate_value(*_):
+            raise AssertionError('Values should not be validated one by one')
+
+        old_validate_value = odps_types.validate_value
+        odps_types.validate_value = validate_value
+        try:
+            df = pd.DataFrame(OrderedDict([('id', pd.Series([1, None], dtype=object)),
+                                           ('fid', pd.Series([1, 2.5], dtype=object)),
+                                           ('name', [u'a', None]),
+                                           ('dt', pd.Series([dt, None], dtype=object))]))
+            columns = PandasEngine._convert_pd_columns(df, table)
+            self.assertEqual([1, None], columns[0].tolist())
+            self.assertEqual([1, 2.5], columns[1].tolist())
+            self.assertEqual([u'a', None], columns[2].tolist())
+            self.assertEqual([dt, None], columns[3].tolist())
+        finally:
+            odps_types.validate_value = old_validate_value
+
+        # values are validated as what is done in records
+        for values in ([1e20, 1.0], [1e20, np.nan], ['a', 1], pd.Series([2 ** 64, 1], dtype=object),
+                       np.array([2 ** 63, 1], dtype=np.uint64)):
+            df = pd.DataFrame(OrderedDict([('id', values), ('fid', [1.0, 2.0]),
+                                           ('name', ['a', 'b']), ('dt', [dt, dt])]))
+            self.assertRaises(ValueError, PandasEngine._convert_pd_columns, df, table)
+
     def testAppendID(self):
         import pandas as pd
         data = [
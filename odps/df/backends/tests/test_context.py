@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import gc
+
+from odps.tests.core import TestBase, pandas_case
+from odps.compat import unittest
+from odps.config import options
+from odps.df import DataFrame
+from odps.df.backends.context import ExecuteContext, context
+
+
+@pandas_case
+class Test(TestBase):
+    def setup(self):
+        import pandas as pd
+
+        self.pd = pd
+        self.df = DataFrame(pd.DataFrame({'id': list(range(100)), 'name': ['name'] * 100}))
+
+    def testLRUEviction(self):
+        ctx = ExecuteContext(bounded=True)
+        exprs = [self.df[self.df.id < i] for i in range(3)]
+        data = [self.pd.DataFrame({'id': list(range(100))}) for _ in range(3)]
+        size = int(data[0].memory_usage(deep=True).sum())
+
+        old_max_bytes = options.df.cache_max_bytes
+        options.df.cache_max_bytes = size * 2
+        try:
+            ctx.cache(exprs[0], data[0])
+            ctx.cache(exprs[1], data[1])
+            self.assertIs(data[0], ctx.get_cached(exprs[0]))
+
+            # the least recently used data is evicted
+            ctx.cache(exprs[2], data[2])
+            self.assertTrue(ctx.is_cached(exprs[0]))
+            self.assertFalse(ctx.is_cached(exprs[1]))
+            self.assertTrue(ctx.is_cached(exprs[2]))
+
+            # data larger than the limit is not cached
+            options.df.cache_max_bytes = size - 1
+            ctx.cache(exprs[1], data[1])
+            self.assertFalse(ctx.is_cached(exprs[1]))
+
+            stats = ctx.stats()
+            self.assertEqual(2, stats['evictions'])
+            self.assertEqual(2, stats['count'])
+            self.assertEqual(size * 2, stats['size'])
+            self.assertEqual(2, stats['hits'])
+        finally:
+            options.df.cache_max_bytes = old_max_bytes
+
+    def testGetCached(self):
+        ctx = ExecuteContext(bounded=True)
+        expr = self.df[self.df.id < 5]
+        data = self.pd.DataFrame({'id': list(range(5))})
+
+        self.assertRaises(KeyError, ctx.get_cached, expr)
+        self.assertIsNone(ctx.get_cached(expr, default=None))
+
+        # data is not sized when the cache is not limited
+        old_max_bytes = options.df.cache_max_bytes
+        options.df.cache_max_bytes = None
+        try:
+            ctx.cache(expr, data)
+        finally:
+            options.df.cache_max_bytes = old_max_bytes
+        self.assertIs(data, ctx.get_cached(expr, default=None))
+        self.assertEqual(0, ctx.stats()['size'])
+
+    def testReleaseCollected(self):
+        ctx = ExecuteContext(bounded=True)
+        released = []
+        ctx.add_release_callback(released.append)
+
+        expr = self.df[self.df.id < 10]
+        copied = expr.copy_tree()
+        expr_id = expr._id
+        ctx.track(expr)
+        ctx.track(copied)
+        ctx.cache(expr, self.pd.DataFrame({'id': list(range(10))}))
+
+        # data is kept while any tracked expression is alive
+        del expr
+        gc.collect()
+        self.assertTrue(ctx.is_cached(copied))
+        self.assertEqual([], released)
+
+        del copied
+        gc.collect()
+        self.assertEqual([expr_id], released)
+        self.assertEqual(0, ctx.stats()['count'])
+        self.assertEqual(1, ctx.stats()['releases'])
+
+    def testReleaseExecuted(self):
+        expr = self.df.id.sum()
+        self.assertEqual(sum(range(100)), expr.execute())
+        self.assertTrue(context.is_cached(expr))
+        expr_id = expr._id
+
+        class IdHolder(object):
+            _id = expr_id
+
+        del expr
+        gc.collect()
+        self.assertFalse(context.is_cached(IdHolder))
+
+        # cached expressions are kept as long as they are used
+        cached = self.df[self.df.id < 10].cache()
+        self.assertEqual(10, cached.count().execute())
+        self.assertTrue(context.is_cached(cached))
+        gc.collect()
+        self.assertTrue(context.is_cached(cached))
+
+
+if __name__ == '__main__':
+    unittest.main()
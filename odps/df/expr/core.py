@@ -24,8 +24,8 @@ import weakref
 from collections import deque, defaultdict, Iterable
 
 from ... import compat
-from ...compat import six
-from ...dag import DAG, Queue
+from ...compat import six, Queue
+from ...dag import DAG
 from . import utils
 
 
@@ -400,8 +400,7 @@ class ExprDAG(DAG):
         self._root = weakref.ref(root)
         super(ExprDAG, self).__init__()
         if dag is not None:
-            self._graph = dag._graph
-            self._map = dag._map
+            self._share_graph(dag)
 
     @property
     def root(self):
@@ -107,9 +107,9 @@ def get_executed_collection_table_name(collection):
             isinstance(collection._source_data, Table):
         return collection._source_data.name
 
-    if context.is_cached(collection) and \
-            isinstance(context.get_cached(collection), Table):
-        return context.get_cached(collection).name
+    cached = context.get_cached(collection, default=None)
+    if isinstance(cached, Table):
+        return cached.name
 
 
 def is_called_by_inspector():
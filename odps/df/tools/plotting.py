@@ -17,11 +17,15 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from ...compat import Enum, six
+from ...compat import Enum, six, OrderedDict
 from ...errors import DependencyNotInstalledError
-from ..expr.expressions import CollectionExpr, SequenceExpr, run_at_once, Expr
+from ...models import Table
+from ..expr.expressions import CollectionExpr, SequenceExpr, Scalar, run_at_once, Expr
 from ..types import is_number
 
+# at most so many outliers of every column are downloaded for box plots
+_MAX_FLIERS = 1000
+
 
 class PlottingCore(Enum):
     PANDAS = 'pandas'
@@ -42,7 +46,7 @@ def _plot_pandas(df, method='plot', **kwargs):
     x_annotate_scale = kwargs.pop('xannotatescale', 1.0)
     y_annotate_scale = kwargs.pop('yannotatescale', 1.0)
 
-    fig = getattr(df, method)(**kwargs)
+    fig = method(**kwargs) if callable(method) else getattr(df, method)(**kwargs)
 
     import numpy as np
     if isinstance(fig, np.ndarray):
@@ -92,6 +96,154 @@ def _boxplot_pandas(df, **kwargs):
     return _plot_pandas(df, method='boxplot', **kwargs)
 
 
+def _hist_summaries_pandas(hists, **kwargs):
+    import numpy as np
+    import pandas as pd
+
+    def draw(ax=None, sharex=False, sharey=False, figsize=None, layout=None, **kw):
+        import matplotlib.pyplot as plt
+
+        n = len(hists)
+        if ax is not None and n == 1:
+            axes = np.array([[ax]])
+        else:
+            if layout is None:
+                n_cols = int(np.ceil(np.sqrt(n)))
+                layout = (int(np.ceil(float(n) / n_cols)), n_cols)
+            _, axes = plt.subplots(*layout, squeeze=False, sharex=sharex,
+                                   sharey=sharey, figsize=figsize)
+        flat_axes = axes.ravel()
+        for ax, (name, (edges, counts)) in zip(flat_axes, six.iteritems(hists)):
+            pd.Series(edges[:-1]).hist(bins=edges, weights=counts, ax=ax, **kw)
+            ax.set_title(name)
+        for ax in flat_axes[n:]:
+            ax.set_visible(False)
+        return axes
+
+    return _plot_pandas(None, method=draw, **kwargs)
+
+
+def _boxplot_summaries_pandas(stats, **kwargs):
+    def draw(ax=None, grid=True, rot=0, fontsize=None, figsize=None, return_type=None, **kw):
+        import matplotlib.pyplot as plt
+
+        if ax is None:
+            if figsize is not None:
+                plt.figure(figsize=figsize)
+            ax = plt.gca()
+        ax.bxp(stats, **kw)
+        ax.grid(grid)
+        plt.setp(ax.get_xticklabels(), rotation=rot, fontsize=fontsize)
+        return ax
+
+    return _plot_pandas(None, method=draw, **kwargs)
+
+
+def _need_pushdown(expr, pushdown=None):
+    if pushdown is not None:
+        return pushdown
+    # summaries are computed by the engine only when data come from ODPS
+    return any(isinstance(source, Table) for source in expr.data_source())
+
+
+def _get_collection(expr):
+    return next(it for it in expr.traverse(top_down=True, unique=True)
+                if isinstance(it, CollectionExpr))
+
+
+def _compute_histograms(collection, seqs, bins=10):
+    """
+    Compute histograms of number sequences by aggregations, thus only edges
+    and counts of bins are downloaded instead of all the values.
+
+    :param collection: collection the sequences come from
+    :param seqs: number sequences
+    :param bins: number of bins
+    :return: list of tuples of bin edges and counts
+    """
+    import numpy as np
+
+    seqs = [seq.astype('float64') for seq in seqs]
+    fields = []
+    for i, seq in enumerate(seqs):
+        fields.extend([seq.min().rename('min_%d' % i), seq.max().rename('max_%d' % i)])
+    ranges = collection[fields].execute().values
+
+    hists = []
+    for i, seq in enumerate(seqs):
+        lo, hi = ranges['min_%d' % i][0], ranges['max_%d' % i][0]
+        counts = np.zeros(bins, dtype=np.int64)
+        if lo is None or hi is None or np.isnan(lo) or np.isnan(hi):
+            hists.append((np.linspace(0, 1, bins + 1), counts))
+            continue
+        if lo == hi:
+            lo, hi = lo - 0.5, hi + 0.5
+        edges = np.linspace(lo, hi, bins + 1)
+
+        idx = ((seq - lo) * (bins / (hi - lo))).astype('int64')
+        idx = (idx >= bins).ifelse(bins - 1, idx).rename('bin')
+        bin_counts = idx.value_counts(sort=False).execute().values
+        bin_counts = bin_counts[bin_counts['bin'].notnull()]
+        counts[bin_counts['bin'].values.astype(np.int64)] = bin_counts['count'].values
+        hists.append((edges, counts))
+    return hists
+
+
+def _compute_boxplot_stats(collection, seqs, whis=1.5, fliers=True):
+    """
+    Compute statistics of box plots of number sequences by aggregations. The
+    quartiles are medians of values not larger or not smaller than the median,
+    and at most ``_MAX_FLIERS`` outliers of every sequence are downloaded.
+
+    :param collection: collection the sequences come from
+    :param seqs: number sequences
+    :param whis: reach of whiskers beyond the quartiles in proportion of the IQR
+    :param fliers: download outliers or not
+    :return: list of dicts accepted by ``matplotlib.axes.Axes.bxp``
+    """
+    import numpy as np
+
+    def null_unless(cond, seq):
+        return cond.ifelse(seq, Scalar(_value_type=seq.dtype))
+
+    def summarize(make_fields):
+        fields = []
+        for i, seq in enumerate(seqs):
+            fields.extend(f.rename('%s_%d' % (name, i)) for name, f in make_fields(i, seq))
+        values = collection[fields].execute().values
+        return [dict((name, values['%s_%d' % (name, i)][0]) for name, _ in make_fields(i, seq))
+                for i, seq in enumerate(seqs)]
+
+    names = [seq.name for seq in seqs]
+    seqs = [seq.astype('float64') for seq in seqs]
+    stats = summarize(lambda i, seq: [('med', seq.median()), ('mean', seq.mean())])
+    quartiles = summarize(lambda i, seq: [
+        ('q1', null_unless(seq <= stats[i]['med'], seq).median()),
+        ('q3', null_unless(seq >= stats[i]['med'], seq).median()),
+    ])
+    for stat, quartile in zip(stats, quartiles):
+        stat.update(quartile)
+        iqr = stat['q3'] - stat['q1']
+        stat['lo'], stat['hi'] = stat['q1'] - whis * iqr, stat['q3'] + whis * iqr
+    whiskers = summarize(lambda i, seq: [
+        ('whislo', null_unless(seq >= stats[i]['lo'], seq).min()),
+        ('whishi', null_unless(seq <= stats[i]['hi'], seq).max()),
+    ])
+
+    results = []
+    for name, seq, stat, whisker in zip(names, seqs, stats, whiskers):
+        lo, hi = stat.pop('lo'), stat.pop('hi')
+        stat.update(whisker)
+        stat['label'] = name
+        stat['fliers'] = np.array([])
+        if fliers and not np.isnan(lo):
+            values = collection[[seq.rename('value')]]
+            outliers = values[(values.value < lo) | (values.value > hi)].limit(_MAX_FLIERS)
+            stat['fliers'] = outliers.execute().values['value'].values
+        results.append(dict((k, np.nan if v is None else v) for k, v in six.iteritems(stat)))
+    return results
+
+
 @run_at_once
 def _plot_sequence(expr, kind='line', use_cache=None, **kwargs):
     try:
@@ -108,12 +260,20 @@ def _plot_sequence(expr, kind='line', use_cache=None, **kwargs):
 
 
 @run_at_once
-def _hist_sequence(expr, use_cache=None, **kwargs):
+def _hist_sequence(expr, use_cache=None, pushdown=None, **kwargs):
     try:
         import pandas as pd
     except ImportError:
         raise DependencyNotInstalledError('plot requires for pandas')
 
+    bins = kwargs.get('bins', 10)
+    if _need_pushdown(expr, pushdown) and is_number(expr.dtype) and \
+            isinstance(bins, six.integer_types):
+        kwargs['bins'], kwargs['weights'] = \
+            _compute_histograms(_get_collection(expr), [expr], bins)[0]
+        series = pd.Series(kwargs['bins'][:-1], name=expr.name)
+        return _hist_pandas(series, **kwargs)
+
     series = expr.to_pandas(use_cache=use_cache)
     return _hist_pandas(series, **kwargs)
 
@@ -170,12 +330,27 @@ def _plot_collection(expr, x=None, y=None, kind='line', **kwargs):
 
 
 @run_at_once
-def _hist_collection(expr, **kwargs):
+def _hist_collection(expr, pushdown=None, **kwargs):
     try:
         import pandas as pd
     except ImportError:
         raise DependencyNotInstalledError('plot requires for pandas')
 
+    bins = kwargs.get('bins', 10)
+    if _need_pushdown(expr, pushdown) and kwargs.get('by') is None and \
+            isinstance(bins, six.integer_types) and \
+            not any(isinstance(v, Expr) for v in six.itervalues(kwargs)):
+        column = kwargs.pop('column', None)
+        if column is None:
+            names = [col.name for col in expr.schema.columns if is_number(col.type)]
+        else:
+            names = [column] if isinstance(column, six.string_types) else list(column)
+        kwargs.pop('bins', None)
+        hists = _compute_histograms(expr, [expr[n] for n in names], bins)
+
+        _plot_func = kwargs.pop('plot_func', _hist_summaries_pandas)
+        return _plot_func(OrderedDict(zip(names, hists)), **kwargs)
+
     fields = []
     column = kwargs.get('column')
     if isinstance(column, six.string_types):
@@ -200,12 +375,26 @@ def _hist_collection(expr, **kwargs):
 
 
 @run_at_once
-def _boxplot_collection(expr, **kwargs):
+def _boxplot_collection(expr, pushdown=None, **kwargs):
     try:
         import pandas as pd
     except ImportError:
         raise DependencyNotInstalledError('plot requires for pandas')
 
+    if _need_pushdown(expr, pushdown) and kwargs.get('by') is None and \
+            not any(isinstance(v, Expr) for v in six.itervalues(kwargs)):
+        column = kwargs.pop('column', None)
+        if column is None:
+            names = [col.name for col in expr.schema.columns if is_number(col.type)]
+        else:
+            names = [column] if isinstance(column, six.string_types) else list(column)
+        stats = _compute_boxplot_stats(expr, [expr[n] for n in names],
+                                       whis=kwargs.pop('whis', 1.5),
+                                       fliers=kwargs.get('showfliers', True))
+
+        _plot_func = kwargs.pop('plot_func', _boxplot_summaries_pandas)
+        return _plot_func(stats, **kwargs)
+
     fields = set()
 
     column = kwargs.get('column')
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from odps.tests.core import TestBase, pandas_case
+from odps.compat import unittest
+from odps.df import DataFrame
+from odps.df.tools.plotting import _compute_histograms, _compute_boxplot_stats
+
+
+@pandas_case
+class Test(TestBase):
+    def setup(self):
+        import numpy as np
+        import pandas as pd
+
+        self.np = np
+        rs = np.random.RandomState(0)
+        self.data = pd.DataFrame({'a': rs.randn(1000), 'b': rs.randint(0, 100, 1000),
+                                  'name': ['name'] * 1000})
+        self.df = DataFrame(self.data)
+
+    def testHistograms(self):
+        np = self.np
+        hists = _compute_histograms(self.df, [self.df.a, self.df.b], bins=20)
+        for name, (edges, counts) in zip(['a', 'b'], hists):
+            expected_counts, expected_edges = np.histogram(self.data[name].values, bins=20)
+            np.testing.assert_allclose(expected_edges, edges)
+            self.assertEqual(expected_counts.tolist(), counts.tolist())
+
+        df = DataFrame(self.data.assign(c=1.0))
+        (edges, counts), = _compute_histograms(df, [df.c], bins=5)
+        self.assertEqual([0.5, 1.5], [edges[0], edges[-1]])
+        self.assertEqual(1000, counts.sum())
+
+        # only summaries are passed to plotting functions
+        summaries = []
+        self.df.hist(pushdown=True, bins=5, plot_func=lambda h, **_: summaries.append(h))
+        self.assertEqual(['a', 'b'], list(summaries[0].keys()))
+        self.assertEqual(5, len(summaries[0]['b'][1]))
+
+    def testBoxplotStats(self):
+        np = self.np
+        stats = _compute_boxplot_stats(self.df, [self.df.a, self.df.b])
+        for stat in stats:
+            values = self.data[stat['label']].values
+            med = np.median(values)
+            self.assertAlmostEqual(med, stat['med'])
+            self.assertAlmostEqual(values.mean(), stat['mean'])
+            # quartiles are Tukey's hinges
+            self.assertAlmostEqual(np.median(values[values <= med]), stat['q1'])
+            self.assertAlmostEqual(np.median(values[values >= med]), stat['q3'])
+
+            iqr = stat['q3'] - stat['q1']
+            lo, hi = stat['q1'] - 1.5 * iqr, stat['q3'] + 1.5 * iqr
+            self.assertEqual(values[values >= lo].min(), stat['whislo'])
+            self.assertEqual(values[values <= hi].max(), stat['whishi'])
+            self.assertEqual(sorted(values[(values < lo) | (values > hi)]),
+                             sorted(stat['fliers']))
+
+        stats = []
+        self.df.boxplot(pushdown=True, column='b', showfliers=False,
+                        plot_func=lambda s, **_: stats.extend(s))
+        self.assertEqual(['b'], [s['label'] for s in stats])
+        self.assertEqual(0, len(stats[0]['fliers']))
+
+
+if __name__ == '__main__':
+    unittest.main()
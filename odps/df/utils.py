@@ -80,6 +80,42 @@ def output(names, types):
     return inner
 
 
+def vectorized(func):
+    """
+    Mark a function or a callable class as a batch function. When executed by
+    the pandas backend, a batch function is called once with all the input data
+    instead of once per row:
+
+    * in ``map``, it receives the whole sequence as a ``pandas.Series`` and returns
+      an array-like of the same length;
+    * in ``apply`` with ``axis=1``, it receives a ``pandas.DataFrame`` whose columns are
+      the fields of the collection, and returns a ``pandas.DataFrame`` or a sequence
+      of output rows;
+    * in ``agg``, it receives every input sequence of a group as a ``pandas.Series``
+      and returns the aggregated value.
+
+    Batch functions are not supported by the ODPS SQL backend.
+
+    :Example:
+
+    >>> @vectorized
+    >>> def add_one(s):
+    >>>     return s + 1
+    >>>
+    >>> df.id.map(add_one)
+    """
+    target = func._func if isinstance(func, FunctionWrapper) else func
+    target = getattr(target, '__func__', target)
+    target._pyodps_vectorized = True
+    return func
+
+
+def is_vectorized(func):
+    if isinstance(func, FunctionWrapper):
+        func = func._func
+    return getattr(func, '_pyodps_vectorized', False)
+
+
 def make_copy(f):
     if inspect.isfunction(f):
         if not inspect.isgeneratorfunction(f):
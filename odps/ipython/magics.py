@@ -23,12 +23,12 @@ from ..inter import enter, setup, teardown, list_rooms
 from ..compat import six, StringIO
 from .. import types as odps_types
 from .. import options, ODPS, log
-from ..utils import replace_sql_parameters, init_progress_ui
+from ..utils import replace_sql_parameters, init_progress_ui, backoff_intervals
 from ..df import DataFrame, Scalar, NullScalar
 from ..df.backends.frame import ResultFrame
-from ..models import Schema
+from ..models import Schema, Instance
 from ..ui.common import html_notify
-from ..ui.progress import create_instance_group, reload_instance_status, fetch_instance_group
+from ..ui.progress import create_instance_group, reload_instance_status
 
 try:
     import numpy as np
@@ -172,15 +172,18 @@ else:
                 if options.verbose:
                     log('Instance ID: ' + instance.id)
                     log('  Log view: ' + instance.get_logview_address())
-                reload_instance_status(self._odps, group_id, instance.id)
+                reload_instance_status(self._odps, group_id, instance)
                 progress_ui.status('Executing')
 
                 percent = 0
-                while not instance.is_terminated():
+                intervals = backoff_intervals(1, options.max_poll_interval)
+                while True:
                     last_percent = percent
 
-                    reload_instance_status(self._odps, group_id, instance.id)
-                    inst_progress = fetch_instance_group(group_id).instances.get(instance.id)
+                    # status of the instance is reloaded with its progress
+                    inst_progress = reload_instance_status(self._odps, group_id, instance)
+                    if inst_progress.status == Instance.Status.TERMINATED:
+                        break
 
                     if inst_progress is not None and len(inst_progress.tasks) > 0:
                         percent = sum(self._get_task_percent(task)
@@ -193,7 +196,7 @@ else:
                     progress_ui.update(percent)
                     progress_ui.update_group()
 
-                    time.sleep(1)
+                    time.sleep(next(intervals))
 
                 instance.wait_for_success()
                 progress_ui.update(1)
@@ -215,10 +218,12 @@ else:
                             except (ValueError, CParserError):
                                 res = reader.raw
                         except ImportError:
+                            # raw results are not available once records are read
+                            raw = reader.raw
                             try:
                                 res = ResultFrame(list(reader), columns=reader._columns)
                             except TypeError:
-                                res = reader.raw
+                                res = raw
 
                     html_notify('SQL execution succeeded')
                     return res
@@ -24,6 +24,7 @@ from .tables import Tables
 from .table import Table, TableSchema as Schema  # Schema is to keep compatible
 from .instances import Instances
 from .instance import Instance
+from .watcher import InstanceWatcher
 from .functions import Functions
 from .function import Function
 from .resources import Resources
@@ -199,7 +199,9 @@ class Instance(LazyLoad):
 
     def reload(self):
         resp = self._client.get(self.resource())
+        self._parse_reload(resp)
 
+    def _parse_reload(self, resp):
         self.owner = resp.headers.get('x-odps-owner')
         self.start_time = utils.parse_rfc822(resp.headers.get('x-odps-start-time'))
         end_time_header = 'x-odps-end-time'
@@ -233,7 +235,9 @@ class Instance(LazyLoad):
 
         params = {'result': ''}
         resp = self._client.get(self.resource(), params=params)
+        return self._parse_task_results(resp)
 
+    def _parse_task_results(self, resp):
         instance_result = Instance.InstanceResult.parse(self._client, resp)
         return compat.OrderedDict([(r.name, r.result) for r in instance_result.task_results])
 
@@ -291,8 +295,10 @@ class Instance(LazyLoad):
         params = {'taskstatus': ''}
 
         resp = self._client.get(self.resource(), params=params)
-        self.parse(self._client, resp, obj=self)
+        return self._parse_task_statuses(resp)
 
+    def _parse_task_statuses(self, resp):
+        self.parse(self._client, resp, obj=self)
         return dict([(task.name, task) for task in self._tasks])
 
     def get_task_names(self):
@@ -378,30 +384,36 @@ class Instance(LazyLoad):
     def is_sync(self):
         return self._is_sync
 
-    def wait_for_completion(self, interval=1):
+    def wait_for_completion(self, interval=1, max_interval=None):
         """
         Wait for the instance to complete, and neglect the consequence.
 
         :param interval: time interval to check
+        :param max_interval: time interval grows from ``interval`` to ``max_interval``
+                             when the instance keeps running, ``options.max_poll_interval`` by default
         :return: None
         """
 
+        if max_interval is None:
+            max_interval = options.max_poll_interval
+        intervals = utils.backoff_intervals(interval, max_interval)
         while not self.is_terminated():
             try:
-                time.sleep(interval)
+                time.sleep(next(intervals))
             except KeyboardInterrupt:
                 break
 
-    def wait_for_success(self, interval=1):
+    def wait_for_success(self, interval=1, max_interval=None):
         """
         Wait for instance to complete, and check if the instance is successful.
 
         :param interval: time interval to check
+        :param max_interval: max time interval to check
         :return: None
         :raise: :class:`odps.errors.ODPSError` if the instance failed
         """
 
-        self.wait_for_completion(interval=interval)
+        self.wait_for_completion(interval=interval, max_interval=max_interval)
 
         if not self.is_successful():
             for task_name, task in six.iteritems(self.get_task_statuses()):
@@ -550,7 +562,14 @@ class Instance(LazyLoad):
             raise errors.ODPSError(
                 'Cannot open reader, instance(%s) may fail or has not finished yet' % self.id)
 
-        sql_tasks = dict([(name, task) for name, task in six.iteritems(self.get_task_statuses())
+        task_name = self._get_sql_task_name(self.get_task_statuses(), task_name)
+        result = self.get_task_result(task_name)
+        with readers.RecordReader(schema, result) as reader:
+            yield reader
+
+    @staticmethod
+    def _get_sql_task_name(task_statuses, task_name=None):
+        sql_tasks = dict([(name, task) for name, task in six.iteritems(task_statuses)
                           if task.type.lower() == 'sql'])
         if len(sql_tasks) > 1:
             if task_name is None:
@@ -564,7 +583,4 @@ class Instance(LazyLoad):
         else:
             raise errors.ODPSError(
                 'Cannot open reader, job has no sql task')
-
-        result = self.get_task_result(task_name)
-        with readers.RecordReader(schema, result) as reader:
-            yield reader
+        return task_name
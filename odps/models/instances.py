@@ -135,6 +135,13 @@ class Instances(Iterable):
 
     def create(self, xml=None, job=None, task=None, priority=None, running_cluster=None,
                headers=None, create_callback=None):
+        xml, headers = self._get_create_content(xml=xml, job=job, task=task, priority=priority,
+                                                running_cluster=running_cluster, headers=headers)
+        resp = self._client.post(self.resource(), xml, headers=headers)
+        return self._create_from_response(resp, create_callback=create_callback)
+
+    def _get_create_content(self, xml=None, job=None, task=None, priority=None,
+                            running_cluster=None, headers=None):
         if xml is None:
             job = self._create_job(job=job, task=task, priority=priority,
                                    running_cluster=running_cluster)
@@ -143,9 +150,9 @@ class Instances(Iterable):
 
         headers = headers or dict()
         headers['Content-Type'] = 'application/xml'
-        url = self.resource()
-        resp = self._client.post(url, xml, headers=headers)
+        return xml, headers
 
+    def _create_from_response(self, resp, create_callback=None):
         location = resp.headers.get('Location')
         if location is None or len(location) == 0:
             raise errors.ODPSError('Invalid response, Location header required.')
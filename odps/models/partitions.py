@@ -17,10 +17,118 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import bisect
+import threading
+import time
+
 from .partition import Partition
 from .core import Iterable
 from .. import serializers, errors, types
 from ..compat import six
+from ..config import options
+
+
+class PartitionIndex(object):
+    """
+    Partitions of a table known by the client, keyed by tuples of partition
+    values in the order of partition columns.
+
+    Partitions listed from the server are kept in the listing order, and the
+    marker of the next page is kept to resume listing. Once all the pages are
+    listed, the index is complete, thus existence of partitions can be checked
+    and partitions can be filtered without requesting the server. The index
+    expires after ``options.partition_cache_ttl`` seconds, and is not kept
+    when the option is not set.
+    """
+    def __init__(self, names):
+        self._names = list(names)
+        self._lock = threading.RLock()
+        self._partitions = dict()
+        self._listed = []
+        self._listed_keys = set()
+        self._sorted = None
+
+        self.marker = None
+        self.complete = False
+        self.create_time = time.time()
+
+    @property
+    def lock(self):
+        return self._lock
+
+    @property
+    def expired(self):
+        ttl = options.partition_cache_ttl
+        return not ttl or time.time() - self.create_time > ttl
+
+    @property
+    def n_listed(self):
+        return len(self._listed)
+
+    def get_key(self, spec):
+        if len(spec) != len(self._names) or any(n not in spec for n in self._names):
+            return
+        return tuple(spec[n] for n in self._names)
+
+    def add(self, partition, listed=False):
+        key = self.get_key(partition.partition_spec)
+        if key is None:
+            return
+        with self._lock:
+            if listed:
+                if key not in self._listed_keys:
+                    self._listed.append(key)
+                    self._listed_keys.add(key)
+                    self._sorted = None
+                self._partitions[key] = partition
+            else:
+                self._partitions.setdefault(key, partition)
+
+    def remove(self, spec):
+        key = self.get_key(spec)
+        if key is None:
+            return
+        with self._lock:
+            self._partitions.pop(key, None)
+            if key in self._listed_keys:
+                self._listed_keys.remove(key)
+                self._listed.remove(key)
+                self._sorted = None
+
+    def contains(self, key):
+        return key in self._partitions
+
+    def get_listed(self, start=0):
+        with self._lock:
+            return [self._partitions[key] for key in self._listed[start:]]
+
+    def filter(self, spec):
+        """
+        Partitions matching the spec in the order of partition values. When keys
+        of the spec are leading partition columns, matched partitions are
+        located by binary search.
+        """
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(self._listed)
+            keys = self._sorted
+            partitions = self._partitions
+
+        spec_names = list(spec.keys)
+        if any(n not in self._names for n in spec_names):
+            return []
+        if spec_names == self._names[:len(spec_names)]:
+            prefix = tuple(spec[n] for n in spec_names)
+            size = len(prefix)
+            start = bisect.bisect_left(keys, prefix)
+            end = start
+            while end < len(keys) and keys[end][:size] == prefix:
+                end += 1
+            return [partitions[key] for key in keys[start:end]]
+
+        positions = [(self._names.index(n), spec[n]) for n in spec_names]
+        return [partitions[key] for key in keys
+                if all(key[pos] == v for pos, v in positions)]
 
 
 class Partitions(Iterable):
@@ -43,6 +151,9 @@ class Partitions(Iterable):
         return super(Partitions, self).__getitem__(item)
 
     def __contains__(self, item):
+        return self._contains(item, self._get_index())
+
+    def _contains(self, item, index, trust_absent=False):
         if isinstance(item, (six.string_types, types.PartitionSpec)):
             if isinstance(item, six.string_types):
                 item = types.PartitionSpec(item)
@@ -52,11 +163,55 @@ class Partitions(Iterable):
         else:
             return False
 
+        key = index.get_key(partition.partition_spec) if index is not None else None
+        if key is not None:
+            if index.contains(key):
+                return True
+            # partitions may be created by SQL or other clients after listing,
+            # thus absence is only trusted when just listed
+            if trust_absent and index.complete:
+                return False
+
         try:
             partition.reload()
-            return True
         except errors.NoSuchObject:
             return False
+        if key is not None:
+            index.add(partition)
+        return True
+
+    def exist_partitions(self, partition_specs):
+        """
+        Check existence of multiple partitions. All the partitions are listed once
+        instead of requesting every partition.
+
+        :param partition_specs: list of partition specs
+        :return: list of bool
+        """
+        table = self.parent
+        if not hasattr(table, '_partition_index'):
+            return [spec in self for spec in partition_specs]
+
+        index = PartitionIndex([p.name for p in table.schema.partitions])
+        self._load_index(index)
+        if options.partition_cache_ttl:
+            table._partition_index = index
+        return [self._contains(spec, index, trust_absent=True) for spec in partition_specs]
+
+    def _get_index(self):
+        table = self.parent
+        try:
+            index = table._partition_index
+        except AttributeError:
+            return
+        if index is None or index.expired:
+            names = [p.name for p in table.schema.partitions]
+            index = table._partition_index = PartitionIndex(names)
+        return index
+
+    def _invalidate_index(self):
+        if getattr(self.parent, '_partition_index', None) is not None:
+            self.parent._partition_index = None
 
     @classmethod
     def _get_partition_spec(self, partition_spec):
@@ -74,34 +229,68 @@ class Partitions(Iterable):
     def iterate_partitions(self, spec=None):
         if spec is not None:
             spec = self._get_partition_spec(spec)
+            if spec.is_empty:
+                spec = None
+
+        index = self._get_index()
+        if index is not None and index.complete:
+            return iter(index.get_listed() if spec is None else index.filter(spec))
+        if index is None or spec is not None:
+            return self._iter_pages(spec)
+        return self._iter_index(index)
 
+    def _list_page(self, spec=None, marker=None):
         params = {
             'partitions': '',
             'expectmarker': 'true'
         }
-        if spec is not None and not spec.is_empty:
+        if spec is not None:
             params['partition'] = str(spec)
+        if marker:
+            params['marker'] = marker
 
-        def _it():
-            last_marker = params.get('marker')
-            if 'marker' in params and \
-                (last_marker is None or len(last_marker) == 0):
-                return
+        url = self.resource()
+        resp = self._client.get(url, params=params)
 
-            url = self.resource()
-            resp = self._client.get(url, params=params)
+        t = self.parse(self._client, resp, obj=self)
+        return t.partitions, t.marker
 
-            t = self.parse(self._client, resp, obj=self)
-            params['marker'] = t.marker
+    def _iter_pages(self, spec=None):
+        marker = None
+        while True:
+            partitions, marker = self._list_page(spec, marker)
+            for partition in partitions:
+                yield partition
+            if not marker:
+                break
 
-            return t.partitions
+    def _load_page(self, index):
+        with index.lock:
+            if index.complete:
+                return
+            partitions, marker = self._list_page(marker=index.marker)
+            for partition in partitions:
+                index.add(partition, listed=True)
+            index.marker = marker
+            if not marker:
+                index.complete = True
+
+    def _load_index(self, index):
+        while not index.complete:
+            self._load_page(index)
 
+    def _iter_index(self, index):
+        # partitions listed before are yielded first, then listing
+        # resumes from the saved marker
+        pos = 0
         while True:
-            partitions = _it()
-            if partitions is None:
-                break
+            partitions = index.get_listed(pos)
             for partition in partitions:
                 yield partition
+            pos += len(partitions)
+            if index.complete and pos >= index.n_listed:
+                break
+            self._load_page(index)
 
     def create(self, partition_spec, if_not_exists=False, async=False):
         partition_spec = self._get_partition_spec(partition_spec)
@@ -120,8 +309,13 @@ class Partitions(Iterable):
 
         if not async:
             instance.wait_for_success()
-            return self[partition_spec]
+            partition = self[partition_spec]
+            index = self._get_index()
+            if index is not None:
+                index.add(partition, listed=index.complete)
+            return partition
         else:
+            self._invalidate_index()
             return instance
 
     def delete(self, partition_spec, if_exists=False, async=False):
@@ -144,5 +338,9 @@ class Partitions(Iterable):
 
         if not async:
             instance.wait_for_success()
+            index = self._get_index()
+            if index is not None:
+                index.remove(partition_spec)
         else:
+            self._invalidate_index()
             return instance
@@ -24,7 +24,7 @@ from .core import LazyLoad, JSONRemoteModel
 from .record import Record
 from .partitions import Partitions
 from .. import types as odps_types, serializers, utils, readers
-from ..compat import six
+from ..compat import six, OrderedDict
 
 
 class TableSchema(odps_types.OdpsSchema, JSONRemoteModel):
@@ -153,7 +153,7 @@ class Table(LazyLoad):
     __slots__ = '_is_extend_info_loaded', 'last_meta_modified_time', 'is_virtual_view', \
                 'lifecycle', 'view_text', 'size', \
                 'is_archived', 'physical_size', 'file_num', 'shard', \
-                '_table_tunnel', '_download_ids', '_upload_ids'
+                '_table_tunnel', '_download_ids', '_upload_ids', '_partition_index'
 
     name = serializers.XMLNodeField('Name')
     table_id = serializers.XMLNodeField('TableId')
@@ -173,6 +173,8 @@ class Table(LazyLoad):
         super(Table, self).__init__(**kwargs)
         self._download_ids = dict()
         self._upload_ids = dict()
+        # cached tables are initialized again, keep known partitions
+        self._partition_index = getattr(self, '_partition_index', None)
 
     def reload(self):
         url = self.resource()
@@ -306,6 +308,13 @@ class Table(LazyLoad):
         >>>     count = reader.count  # How many records of a table or its partition
         >>>     for record in reader[0: count]:
         >>>         # read all data, actually better to split into reading for many times
+        >>>
+        >>> with table.open_reader() as reader:
+        >>>     for record in reader.read(n_threads=8):
+        >>>         # download row ranges with 8 threads concurrently
+        >>>
+        >>> with table.open_reader() as reader:
+        >>>     df = reader.to_pandas()  # decode records into columns directly
         """
 
         from ..tunnel.tabletunnel import TableDownloadSession
@@ -348,7 +357,7 @@ class Table(LazyLoad):
                 return self.read(start=start, count=count, step=step)
 
             def read(self, start=None, count=None, step=None,
-                     compress=False, columns=None):
+                     compress=False, columns=None, n_threads=None, ordered=True):
                 start = start or 0
                 step = step or 1
                 count = count*step if count is not None else self.count-start
@@ -356,11 +365,49 @@ class Table(LazyLoad):
                 if count == 0:
                     return
 
+                if n_threads is not None and n_threads > 1:
+                    with download_session.open_parallel_record_reader(
+                            start, count, n_threads, compress=compress, columns=columns,
+                            step=step, ordered=ordered) as reader:
+                        for record in reader:
+                            yield record
+                    return
+
                 with download_session.open_record_reader(
                         start, count, compress=compress, columns=columns) as reader:
                     for record in reader[::step]:
                         yield record
 
+            def read_batches(self, start=None, count=None, batch_size=None,
+                             compress=False, columns=None):
+                start = start or 0
+                count = count if count is not None else self.count-start
+
+                if count == 0:
+                    return
+
+                with download_session.open_record_reader(
+                        start, count, compress=compress, columns=columns) as reader:
+                    for batch in reader.read_batches(batch_size):
+                        yield batch
+
+            def to_pandas(self, start=None, count=None, batch_size=None,
+                          compress=False, columns=None):
+                start = start or 0
+                count = count if count is not None else self.count-start
+
+                if count == 0:
+                    import pandas as pd
+
+                    schema = download_session.schema
+                    cols = schema.columns if columns is None else [schema[c] for c in columns]
+                    names = [col.name for col in cols]
+                    return pd.DataFrame(OrderedDict((n, []) for n in names), columns=names)
+
+                with download_session.open_record_reader(
+                        start, count, compress=compress, columns=columns) as reader:
+                    return reader.to_pandas(batch_size)
+
         yield RecordReader()
 
     @contextlib.contextmanager
@@ -388,6 +435,8 @@ class Table(LazyLoad):
         >>> with table.open_writer(partition='pt=test', blocks=[0, 1]):
         >>>     writer.write(0, gen_records(block=0))
         >>>     writer.write(1, gen_records(block=1))  # we can do this parallel
+        >>> with table.open_writer() as writer:
+        >>>     writer.write_pandas(df)  # write columns of a pandas DataFrame directly
         """
 
         from ..tunnel.tabletunnel import TableUploadSession
@@ -466,16 +515,37 @@ class Table(LazyLoad):
                 else:
                     raise ValueError('Cannot write no records to table.')
 
-                compress = kwargs.get('compress', False)
+                writer = cls._open_block_writer(block_id, kwargs.get('compress', False))
+                for record in records:
+                    writer.write(record)
+
+            @classmethod
+            def write_batch(cls, columns, block_id=0, compress=False):
+                """
+                Write columns of values without creating records.
+
+                :param columns: dict of column names and values, or list of column values
+                """
+                cls._open_block_writer(block_id, compress).write_batch(columns)
+
+            @classmethod
+            def write_pandas(cls, df, block_id=0, compress=False):
+                """
+                Write a pandas DataFrame whose columns are in the order of table schema.
+
+                :param df: pandas DataFrame
+                """
+                cls._open_block_writer(block_id, compress).write_pandas(df)
+
+            @classmethod
+            def _open_block_writer(cls, block_id, compress):
                 idx = blocks.index(block_id)
                 writer = blocks_writers[idx]
                 if writer is None:
                     writer = blocks_writers[idx] = \
                         upload_session.open_record_writer(block_id, compress=compress)
-
-                for record in records:
-                    writer.write(record)
                 blocks_writes[idx] = True
+                return writer
 
         yield RecordWriter()
 
@@ -503,6 +573,9 @@ class Table(LazyLoad):
     def exist_partition(self, partition_spec):
         return partition_spec in self.partitions
 
+    def exist_partitions(self, partition_specs):
+        return self.partitions.exist_partitions(partition_specs)
+
     def iterate_partitions(self, spec=None):
         return self.partitions.iterate_partitions(spec=spec)
 
@@ -183,6 +183,7 @@ class Tables(Iterable):
         if isinstance(table_name, Table):
             table_name = table_name.name
 
+        self[table_name]._partition_index = None  # forget known partitions
         del self[table_name]  # release table in cache
 
         sql = self._gen_delete_table_sql(table_name, if_exists=if_exists)
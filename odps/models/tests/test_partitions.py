@@ -21,8 +21,45 @@ from datetime import datetime
 
 from odps.tests.core import TestBase, tn
 from odps.compat import unittest
-from odps.models import Schema
-from odps import types
+from odps.config import options
+from odps.models import Schema, Table
+from odps import types, errors
+
+
+class PartitionsClient(object):
+    """
+    Client serving partitions of a table by pages.
+    """
+    endpoint = 'http://127.0.0.1:1/partitions_client'
+
+    def __init__(self, specs, page_size):
+        self.specs = specs
+        self.page_size = page_size
+        self.requests = []
+
+    @staticmethod
+    def _partition_xml(spec):
+        spec = types.PartitionSpec(spec)
+        return '<Partition>%s</Partition>' % ''.join(
+            '<Column Name="%s" Value="%s"/>' % (k, spec[k]) for k in spec.keys)
+
+    def get(self, url, params=None, **_):
+        params = params or dict()
+        self.requests.append(params)
+        if 'partitions' not in params:
+            spec = types.PartitionSpec(params['partition'])
+            if not any(all(types.PartitionSpec(s).kv.get(k) == spec[k] for k in spec.keys)
+                       for s in self.specs):
+                raise errors.NoSuchObject('No such object.')
+            return self._partition_xml(str(spec))
+
+        start = int(params.get('marker') or 0)
+        end = start + self.page_size
+        specs = [s for s in self.specs
+                 if 'partition' not in params or params['partition'] in str(types.PartitionSpec(s))]
+        marker = str(end) if end < len(specs) else ''
+        return '<Partitions><Marker>%s</Marker>%s</Partitions>' % (
+            marker, ''.join(self._partition_xml(s) for s in specs[start:end]))
 
 
 class Test(TestBase):
@@ -115,5 +152,64 @@ class Test(TestBase):
         self.odps.delete_table(test_table_name)
         self.assertFalse(table.exist_partition(partition))
 
+    def testPartitionIndex(self):
+        specs = ['pt=%d,s=%d' % (i, j) for i in range(3) for j in range(3)]
+        client = PartitionsClient(specs, page_size=4)
+        schema = Schema.from_lists(['id', ], ['string', ], ['pt', 's'], ['string', 'string'])
+        table = Table(name=tn('pyodps_t_tmp_partition_index'), schema=schema, client=client)
+        table._loaded = True
+
+        # partitions are listed once for multiple checks even if not cached
+        self.assertEqual([True, False], table.exist_partitions(['pt=2,s=0', 'pt=3,s=0']))
+        self.assertEqual(3, len(client.requests))
+        del client.requests[:]
+        self.assertTrue(table.exist_partition('pt=1,s=2'))
+        self.assertEqual(1, len(client.requests))
+
+        old_ttl = options.partition_cache_ttl
+        options.partition_cache_ttl = 60
+        try:
+            # listing is resumed from the marker of the last page
+            del client.requests[:]
+            it = table.iterate_partitions()
+            self.assertEqual(specs[:2], [str(next(it).partition_spec).replace("'", '')
+                                         for _ in range(2)])
+            self.assertEqual(1, len(client.requests))
+            self.assertEqual(specs, [str(p.partition_spec).replace("'", '')
+                                     for p in table.partitions])
+            self.assertEqual(3, len(client.requests))
+            self.assertEqual('4', client.requests[1].get('marker'))
+
+            # existence and filters are served by the complete index
+            del client.requests[:]
+            self.assertTrue(table.exist_partition('pt=1,s=2'))
+            self.assertEqual(specs[3:6], [str(p.partition_spec).replace("'", '')
+                                          for p in table.iterate_partitions('pt=1')])
+            self.assertEqual(specs[1::3], [str(p.partition_spec).replace("'", '')
+                                           for p in table.iterate_partitions('s=1')])
+            self.assertEqual([], client.requests)
+
+            # absent partitions may be created by others thus checked by the server
+            client.specs = specs + ['pt=1,s=3']
+            self.assertTrue(table.exist_partition('pt=1,s=3'))
+            self.assertFalse(table.exist_partition('pt=1,s=4'))
+            self.assertEqual(2, len(client.requests))
+
+            # partial specs are checked by the server
+            del client.requests[:]
+            self.assertTrue(table.exist_partition('pt=1'))
+            self.assertEqual(1, len(client.requests))
+
+            # partitions are listed again once the index expires
+            options.partition_cache_ttl = 0
+            del client.requests[:]
+            client.specs = specs[:-1]
+            self.assertFalse(table.exist_partition(specs[-1]))
+            self.assertEqual(specs[:-1], [str(p.partition_spec).replace("'", '')
+                                          for p in table.partitions])
+            self.assertEqual(3, len(client.requests))
+        finally:
+            options.partition_cache_ttl = old_ttl
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
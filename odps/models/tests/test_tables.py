@@ -20,7 +20,7 @@
 from datetime import datetime
 import itertools
 
-from odps.tests.core import TestBase, to_str, tn
+from odps.tests.core import TestBase, to_str, tn, pandas_case
 from odps.compat import unittest, six
 from odps.models import Schema, Record
 
@@ -279,5 +279,37 @@ class Test(TestBase):
 
         table.drop()
 
+    @pandas_case
+    def testReadEmptyTableToPandas(self):
+        from odps.models import Table
+        from odps.tunnel.tabletunnel import TableDownloadSession
+
+        schema = Schema.from_lists(['num', 'name'], ['bigint', 'string'], ['pt'], ['string'])
+        table = Table(name=tn('pyodps_t_tmp_empty_table'), schema=schema, client=self.odps.rest)
+        table._loaded = True
+
+        class DownloadSession(object):
+            id = 'download_id'
+            count = 0
+            status = TableDownloadSession.Status.Normal
+
+            def __init__(self):
+                self.schema = schema
+
+            def open_record_reader(self, *_, **__):
+                raise AssertionError('Records should not be downloaded')
+
+        class Tunnel(object):
+            def create_download_session(self, *_, **__):
+                return DownloadSession()
+
+        table._table_tunnel = Tunnel()
+        with table.open_reader() as reader:
+            df = reader.to_pandas()
+            self.assertEqual(['num', 'name', 'pt'], list(df.columns))
+            self.assertEqual(0, len(df))
+            self.assertEqual(['name'], list(reader.to_pandas(columns=['name']).columns))
+
+
 if __name__ == '__main__':
     unittest.main()
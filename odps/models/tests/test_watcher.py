@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import itertools
+import threading
+
+from odps import ODPS, utils
+from odps.tests.core import TestBase, InstanceServer
+from odps.compat import unittest, futures
+from odps.models import Instance, InstanceWatcher
+from odps.ui.progress import create_instance_group, reload_instance_status
+
+
+class Test(TestBase):
+    def _make_odps(self, server):
+        return ODPS('access_id', 'secret_access_key', 'test_project', endpoint=server.endpoint)
+
+    def testBackoffIntervals(self):
+        intervals = list(itertools.islice(utils.backoff_intervals(1, 5, factor=2), 5))
+        self.assertEqual([1, 2, 4, 5, 5], intervals)
+        intervals = list(itertools.islice(utils.backoff_intervals(1), 3))
+        self.assertEqual([1, 1, 1], intervals)
+
+    def testWatchInstances(self):
+        with InstanceServer(n_polls=3) as server:
+            odps = self._make_odps(server)
+            instances = [odps.run_sql('select * from dual') for _ in range(20)]
+
+            terminated = []
+            lock = threading.Lock()
+
+            def callback(inst):
+                with lock:
+                    terminated.append(inst.id)
+
+            with InstanceWatcher(interval=0.01, max_interval=0.05, callback=callback) as watcher:
+                fs = [watcher.watch(inst) for inst in instances]
+                # watching an instance again shares the checks
+                fs.extend(watcher.watch(inst) for inst in instances)
+                for future in futures.as_completed(fs, timeout=10):
+                    self.assertTrue(future.result().is_terminated())
+
+                self.assertEqual(sorted(inst.id for inst in instances), sorted(terminated))
+                self.assertEqual(20 * 3, server.n_requests_of['status'])
+
+                # instances terminated are not checked again
+                self.assertEqual([], watcher.wait(instances, timeout=1))
+                self.assertEqual(20 * 3, server.n_requests_of['status'])
+
+    def testUnwatchInstance(self):
+        with InstanceServer(n_polls=1000) as server:
+            odps = self._make_odps(server)
+            inst = odps.run_sql('select * from dual')
+
+            watcher = InstanceWatcher(interval=0.01, max_interval=0.01)
+            future = watcher.watch(inst)
+            self.assertEqual([inst], watcher.wait([inst], timeout=0.1))
+            watcher.unwatch(inst)
+            self.assertTrue(future.cancelled())
+
+            future = watcher.watch(inst)
+            watcher.close()
+            self.assertTrue(future.cancelled())
+            self.assertRaises(RuntimeError, watcher.watch, inst)
+
+    def testReloadInstanceStatus(self):
+        with InstanceServer(n_polls=3) as server:
+            odps = self._make_odps(server)
+            inst = odps.run_sql('select * from dual')
+            group_id = create_instance_group('test')
+
+            for _ in range(3):
+                inst_progress = reload_instance_status(odps, group_id, inst)
+            self.assertEqual(Instance.Status.TERMINATED, inst_progress.status)
+            self.assertEqual(Instance.Task.TaskStatus.SUCCESS,
+                             inst_progress.tasks['AnonymousSQLTask'].status)
+            self.assertIn('token', inst_progress.logview)
+
+            # statuses are fetched together and logview address is fetched once
+            self.assertEqual(0, server.n_requests_of['status'])
+            self.assertEqual(3, server.n_requests_of['taskstatus'])
+            self.assertEqual(1, server.n_requests_of['logview'])
+            self.assertEqual(2, server.n_requests_of['progress'])
+
+            reload_instance_status(odps, group_id, inst)
+            self.assertEqual(3, server.n_requests_of['taskstatus'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+
+from .instance import Instance
+from .. import options, utils
+from ..compat import six, futures
+
+logger = logging.getLogger(__name__)
+
+
+class _InstanceWatch(object):
+    __slots__ = 'instance', 'seq', 'intervals', 'waiters', 'n_errors'
+
+    def __init__(self, instance, seq, intervals):
+        self.instance = instance
+        self.seq = seq
+        self.intervals = intervals
+        self.waiters = []
+        self.n_errors = 0
+
+
+class InstanceWatcher(object):
+    """
+    Watch status of instances in one background thread until they terminate.
+
+    Every instance is checked with intervals growing from ``interval`` to ``max_interval``
+    while it keeps running, and an instance watched several times is checked only once
+    in every round. Termination is notified by the futures returned by :meth:`watch`
+    and by callbacks.
+
+    :param interval: time interval of the first check
+    :param max_interval: max time interval between checks, ``options.max_poll_interval`` by default
+    :param callback: function called with every terminated instance
+
+    :Example:
+
+    >>> with InstanceWatcher() as watcher:
+    >>>     fs = [watcher.watch(o.run_sql(sql)) for sql in sqls]
+    >>>     for future in futures.as_completed(fs):
+    >>>         instance = future.result()
+    """
+
+    def __init__(self, interval=1, max_interval=None, callback=None):
+        self._interval = interval
+        self._max_interval = max_interval if max_interval is not None else options.max_poll_interval
+        self._callback = callback
+
+        self._cond = threading.Condition()
+        self._watches = dict()
+        self._schedule = []
+        self._seq = itertools.count()
+        self._thread = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def watch(self, instance, callback=None):
+        """
+        Watch an instance until it terminates.
+
+        :param instance: instance to watch
+        :param callback: function called with the instance when it terminates
+        :return: future whose result is the instance
+        :rtype: :class:`concurrent.futures.Future`
+        """
+        future = futures.Future()
+        if instance._getattr('_status') == Instance.Status.TERMINATED:
+            self._notify(instance, [(future, callback)])
+            return future
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('Instance watcher is already closed.')
+
+            watch = self._watches.get(instance.id)
+            if watch is None:
+                intervals = utils.backoff_intervals(self._interval, self._max_interval)
+                watch = self._watches[instance.id] = _InstanceWatch(instance, next(self._seq), intervals)
+                heapq.heappush(self._schedule, (time.time(), watch.seq, instance.id))
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run)
+                    self._thread.daemon = True
+                    self._thread.start()
+                self._cond.notify()
+            watch.waiters.append((future, callback))
+        return future
+
+    def unwatch(self, instance):
+        """
+        Stop watching an instance. Futures of the instance are cancelled.
+
+        :param instance: instance or instance id
+        """
+        instance_id = instance.id if isinstance(instance, Instance) else instance
+        with self._cond:
+            watch = self._watches.pop(instance_id, None)
+        if watch is not None:
+            for future, _ in watch.waiters:
+                future.cancel()
+
+    def wait(self, instances, timeout=None):
+        """
+        Wait until all the instances terminate.
+
+        :param instances: instances to wait
+        :param timeout: max time to wait, wait forever if None
+        :return: instances not terminated when timeout
+        :rtype: list
+        """
+        fs = [self.watch(instance) for instance in instances]
+        futures.wait(fs, timeout=timeout)
+        return [instance for instance, future in zip(instances, fs) if not future.done()]
+
+    def close(self):
+        """
+        Stop watching all instances. Futures not done are cancelled.
+        """
+        with self._cond:
+            self._closed = True
+            watches = list(six.itervalues(self._watches))
+            self._watches = dict()
+            self._schedule = []
+            self._cond.notify()
+        for watch in watches:
+            for future, _ in watch.waiters:
+                future.cancel()
+
+    def _next_watches(self):
+        with self._cond:
+            while True:
+                if self._closed or not self._watches:
+                    self._thread = None
+                    return None
+                now = time.time()
+                if self._schedule and self._schedule[0][0] <= now:
+                    break
+                wait_time = self._schedule[0][0] - now if self._schedule else None
+                self._cond.wait(wait_time)
+
+            watches = []
+            while self._schedule and self._schedule[0][0] <= now:
+                _, seq, instance_id = heapq.heappop(self._schedule)
+                watch = self._watches.get(instance_id)
+                # skip schedules of instances unwatched
+                if watch is not None and watch.seq == seq:
+                    watches.append(watch)
+            return watches
+
+    def _run(self):
+        while True:
+            watches = self._next_watches()
+            if watches is None:
+                break
+            for watch in watches:
+                self._check(watch)
+
+    def _check(self, watch):
+        instance = watch.instance
+        try:
+            instance.reload()
+        except:
+            watch.n_errors += 1
+            if watch.n_errors <= options.retry_times:
+                logger.warning('Failed to check status of instance %s, retrying.', instance.id)
+                self._reschedule(watch)
+            else:
+                self._finish(watch, exc_info=sys.exc_info())
+            return
+
+        watch.n_errors = 0
+        if instance._getattr('_status') == Instance.Status.TERMINATED:
+            self._finish(watch)
+        else:
+            self._reschedule(watch)
+
+    def _reschedule(self, watch):
+        with self._cond:
+            if self._watches.get(watch.instance.id) is watch:
+                heapq.heappush(self._schedule, (time.time() + next(watch.intervals),
+                                                watch.seq, watch.instance.id))
+
+    def _finish(self, watch, exc_info=None):
+        with self._cond:
+            if self._watches.get(watch.instance.id) is not watch:
+                return
+            del self._watches[watch.instance.id]
+        self._notify(watch.instance, watch.waiters, exc_info=exc_info)
+
+    def _notify(self, instance, waiters, exc_info=None):
+        callbacks = [self._callback]
+        for future, callback in waiters:
+            if not future.set_running_or_notify_cancel():
+                continue
+            if exc_info is None:
+                future.set_result(instance)
+                callbacks.append(callback)
+            elif six.PY2:
+                future.set_exception_info(*exc_info[1:])
+            else:
+                future.set_exception(exc_info[1])
+
+        if exc_info is not None:
+            return
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(instance)
+            except:
+                logger.exception('Failed to call callback of instance %s.', instance.id)
@@ -17,8 +17,11 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import codecs
 import csv
 import math
+from collections import deque
+from datetime import datetime
 
 from requests import Response
 
@@ -97,19 +100,195 @@ class AbstractRecordReader(object):
                     return
 
 
+def _unescape_csv(s):
+    return s.encode('utf-8').decode('unicode_escape')
+
+
+def _convert_boolean(value):
+    if value == 'true':
+        return True
+    elif value == 'false':
+        return False
+    return types.validate_value(value, types.boolean)
+
+
+def _convert_datetime(value):
+    if len(value) == 19 and value[4] == '-' and value[10] == ' ':
+        try:
+            return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]),
+                            int(value[11:13]), int(value[14:16]), int(value[17:19]))
+        except ValueError:
+            pass
+    return types.validate_value(value, types.datetime)
+
+
+def _get_converter(data_type):
+    """
+    Get the function converting texts of CSV cells into values of the data type,
+    None if texts are values themselves.
+    """
+    if data_type == types.string:
+        return utils.to_text if six.PY2 else None
+    elif data_type == types.bigint:
+        return int
+    elif data_type == types.double:
+        return float
+    elif data_type == types.boolean:
+        return _convert_boolean
+    elif data_type == types.datetime:
+        return _convert_datetime
+    elif isinstance(data_type, types.Map):
+        def convert_map(value):
+            if not (value.startswith('{') and value.endswith('}')):
+                raise ValueError('Dict format error!')
+
+            items = []
+            for kv in value[1:-1].split(','):
+                k, v = kv.split(':', 1)
+                k = data_type.key_type.cast_value(k.strip(), types.string)
+                v = data_type.value_type.cast_value(v.strip(), types.string)
+                items.append((k, v))
+            return types.validate_value(compat.OrderedDict(items), data_type)
+
+        return convert_map
+    elif isinstance(data_type, types.Array):
+        def convert_array(value):
+            if not (value.startswith('[') and value.endswith(']')):
+                raise ValueError('Array format error!')
+
+            items = [data_type.value_type.cast_value(item.strip(), types.string)
+                     for item in value[1:-1].split(',')]
+            return types.validate_value(items, data_type)
+
+        return convert_array
+    return lambda value: types.validate_value(value, data_type)
+
+
+class CSVDecoder(object):
+    """
+    Decoder of rows of CSV results compiled from columns. Converters of
+    columns are chosen once, and only cells containing escapes are unescaped.
+    """
+
+    NULL_TOKEN = '\\N'
+
+    def __init__(self, columns):
+        self._columns = columns
+        self._converters = [_get_converter(col.type) for col in columns]
+
+    @property
+    def columns(self):
+        return self._columns
+
+    def decode(self, cells):
+        """
+        Decode cells of a row into a list of values in types of columns.
+        """
+        null_token = self.NULL_TOKEN
+        values = []
+        for cell, convert in zip(cells, self._converters):
+            if '\\' in cell:
+                cell = _unescape_csv(cell)
+                if cell == null_token:
+                    values.append(None)
+                    continue
+            values.append(cell if convert is None else convert(cell))
+        return values
+
+
 class RecordReader(AbstractRecordReader):
+    """
+    Reader of CSV results. When the stream is a response, results are decoded
+    and escaped line by line while downloading, thus records are available
+    before the whole response is received. Downloaded chunks are released once
+    decoded, thus :attr:`raw` of a response is only available before records
+    are read.
+    """
+
     NULL_TOKEN = '\\N'
     BACK_SLASH_ESCAPE = '\\x%02x' % ord('\\')
+    CHUNK_SIZE = 64 * 1024
 
     def __init__(self, schema, stream, **kwargs):
         self._schema = schema
         self._columns = None
+        self._decoder = None
+        self._name_indexes = None
         self._fp = stream
+        self._raw_chunks = deque()
+        self._raw = None
+        self._chunks_decoded = False
+        self._chunk_source = None
+        self._csv = csv.reader(self._iter_escaped_lines())
+
+    @property
+    def raw(self):
+        """
+        Whole text of the results. Note that the response is loaded into memory,
+        and the text is not available once records are read from the response.
+        """
         if isinstance(self._fp, Response):
-            self.raw = self._fp.content if six.PY2 else self._fp.text
-        else:
-            self.raw = self._fp
-        self._csv = csv.reader(six.StringIO(self._escape_csv(self.raw)))
+            if self._raw is None:
+                if self._chunks_decoded:
+                    raise IOError('Raw results are not available '
+                                  'once records are read from the response')
+                # chunks are kept until decoded for records
+                self._raw_chunks.extend(self._get_chunk_source())
+                content = bytes().join(self._raw_chunks)
+                self._raw = content if six.PY2 else content.decode('utf-8', 'replace')
+            return self._raw
+        return self._fp
+
+    def _get_chunk_source(self):
+        if self._chunk_source is None:
+            self._chunk_source = self._fp.iter_content(chunk_size=self.CHUNK_SIZE)
+        return self._chunk_source
+
+    def _iter_raw_chunks(self):
+        while True:
+            if self._raw_chunks:
+                chunk = self._raw_chunks.popleft()
+            else:
+                chunk = next(self._get_chunk_source(), None)
+                if chunk is None:
+                    return
+            self._chunks_decoded = True
+            yield chunk
+
+    def _iter_text_chunks(self):
+        if isinstance(self._fp, Response):
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            for chunk in self._iter_raw_chunks():
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            text = decoder.decode(b'', final=True)
+            if text:
+                yield text
+        elif self._fp:
+            yield utils.to_text(self._fp)
+
+    def _iter_escaped_lines(self):
+        # escaping is applied on every line instead of the whole result,
+        # lines are split only on '\n' which is kept by the escaping
+        pending = []
+        for chunk in self._iter_text_chunks():
+            start = 0
+            while True:
+                pos = chunk.find('\n', start)
+                if pos < 0:
+                    break
+                line = chunk[start:pos + 1]
+                if pending:
+                    pending.append(line)
+                    line = ''.join(pending)
+                    pending = []
+                yield self._escape_csv(line)
+                start = pos + 1
+            if start < len(chunk):
+                pending.append(chunk[start:])
+        if pending:
+            yield self._escape_csv(''.join(pending))
 
     @classmethod
     def _escape_csv(cls, s):
@@ -125,61 +304,57 @@ class RecordReader(AbstractRecordReader):
 
     @staticmethod
     def _unescape_csv(s):
-        return s.encode('utf-8').decode('unicode_escape')
+        return _unescape_csv(s)
 
-    def _readline(self):
+    def _read_cells(self):
         try:
-            values = next(self._csv)
-            res = []
-            for i, value in enumerate(values):
-                value = self._unescape_csv(value)
-                if value == self.NULL_TOKEN:
-                    res.append(None)
-                elif self._columns and self._columns[i].type == types.boolean:
-                    if value == 'true':
-                        res.append(True)
-                    elif value == 'false':
-                        res.append(False)
-                    else:
-                        res.append(value)
-                elif self._columns and isinstance(self._columns[i].type, types.Map):
-                    col_type = self._columns[i].type
-                    if not (value.startswith('{') and value.endswith('}')):
-                        raise ValueError('Dict format error!')
-
-                    items = []
-                    for kv in value[1:-1].split(','):
-                        k, v = kv.split(':', 1)
-                        k = col_type.key_type.cast_value(k.strip(), types.string)
-                        v = col_type.value_type.cast_value(v.strip(), types.string)
-                        items.append((k, v))
-                    res.append(compat.OrderedDict(items))
-                elif self._columns and isinstance(self._columns[i].type, types.Array):
-                    col_type = self._columns[i].type
-                    if not (value.startswith('[') and value.endswith(']')):
-                        raise ValueError('Array format error!')
-
-                    items = []
-                    for item in value[1:-1].split(','):
-                        item = col_type.value_type.cast_value(item.strip(), types.string)
-                        items.append(item)
-                    res.append(items)
-                else:
-                    res.append(value)
-            return res
+            return next(self._csv)
         except StopIteration:
             return
 
+    def _readline(self):
+        cells = self._read_cells()
+        if cells is None:
+            return
+        return self._decoder.decode(cells)
+
     def __next__(self):
         self._load_columns()
 
         values = self._readline()
         if values is None:
             raise StopIteration
-        return Record(self._columns, values=values)
+        # values are decoded in types of columns, thus not validated again
+        return Record._from_trusted_values(self._columns, values, self._name_indexes)
 
     next = __next__
 
+    def iter_rows(self):
+        """
+        Iterate rows of the results as tuples of values, without creating records.
+        """
+        self._load_columns()
+        decode = self._decoder.decode
+        while True:
+            cells = self._read_cells()
+            if cells is None:
+                return
+            yield tuple(decode(cells))
+
+    def read_columns(self):
+        """
+        Read the rest of the results by columns.
+
+        :return: ordered dict of column names and lists of values
+        """
+        self._load_columns()
+        arrays = [[] for _ in self._columns]
+        appends = [array.append for array in arrays]
+        for row in self.iter_rows():
+            for append, value in zip(appends, row):
+                append(value)
+        return compat.OrderedDict((col.name, array) for col, array in zip(self._columns, arrays))
+
     def read(self, start=None, count=None, step=None):
         if count is None:
             end = None
@@ -193,7 +368,7 @@ class RecordReader(AbstractRecordReader):
         if self._columns is not None:
             return
 
-        values = self._readline()
+        values = [self._unescape_csv(cell) for cell in self._read_cells() or []]
         self._columns = []
         for value in values:
             if self._schema is None:
@@ -203,6 +378,8 @@ class RecordReader(AbstractRecordReader):
                     self._columns.append(self._schema.get_partition(value))
                 else:
                     self._columns.append(self._schema.get_column(value))
+        self._decoder = CSVDecoder(self._columns)
+        self._name_indexes = dict((col.name, i) for i, col in enumerate(self._columns))
 
     def close(self):
         if hasattr(self._fp, 'close'):
@@ -21,6 +21,8 @@ from __future__ import absolute_import
 import json
 import logging
 import platform
+import threading
+import time
 from string import Template
 
 import requests
@@ -54,6 +56,74 @@ def default_user_agent():
                                        os_version='%s/%s' % (py_system, py_release))
 
 
+class ConnectionPool(object):
+    """
+    Pool of keep-alive HTTP connections shared by requests.
+
+    Connections are held by a single ``HTTPAdapter`` whose underlying urllib3
+    pools are thread-safe, while ``requests.Session`` objects mounting it are
+    kept per thread. The adapter is rebuilt when related options change or
+    when the pool has been idle longer than ``options.pool_idle_timeout``,
+    so that connections silently dropped by servers are not reused.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._adapter = None
+        self._adapter_key = None
+        self._generation = 0
+        self._last_used = None
+
+    @staticmethod
+    def _build_adapter(key):
+        retry_times, pool_connections, pool_maxsize = key
+        return requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+            max_retries=retry_times)
+
+    def _is_expired(self, now):
+        idle_timeout = options.pool_idle_timeout
+        if self._last_used is None or idle_timeout is None:
+            return False
+        return now - self._last_used > idle_timeout
+
+    def get_session(self):
+        key = (options.retry_times, options.pool_connections, options.pool_maxsize)
+        now = time.time()
+        with self._lock:
+            if self._adapter is None or self._adapter_key != key or self._is_expired(now):
+                old_adapter = self._adapter
+                self._adapter = self._build_adapter(key)
+                self._adapter_key = key
+                self._generation += 1
+                if old_adapter is not None:
+                    LOG.debug('Evicting pooled connections.')
+                    old_adapter.close()
+            self._last_used = now
+            adapter, generation = self._adapter, self._generation
+
+        session = getattr(self._local, 'session', None)
+        if session is None or self._local.generation != generation:
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+            self._local.generation = generation
+        return session
+
+    def close(self):
+        with self._lock:
+            if self._adapter is not None:
+                self._adapter.close()
+            self._adapter = None
+            self._adapter_key = None
+            self._last_used = None
+            self._generation += 1
+
+
+_shared_pool = ConnectionPool()
+
+
 class RestClient(object):
     def __init__(self, account, endpoint, project=None, user_agent=None):
         if endpoint.endswith('/'):
@@ -62,6 +132,14 @@ class RestClient(object):
         self._endpoint = endpoint
         self._user_agent = user_agent or default_user_agent()
         self.project = project
+        self._pool = ConnectionPool()
+
+    def __getstate__(self):
+        return self._account, self._endpoint, self._user_agent, self.project
+
+    def __setstate__(self, state):
+        account, endpoint, user_agent, project = state
+        self.__init__(account, endpoint, project=project, user_agent=user_agent)
 
     @property
     def endpoint(self):
@@ -71,21 +149,31 @@ class RestClient(object):
     def account(self):
         return self._account
 
-    def request(self, url, method, stream=False, **kwargs):
-        self.upload_survey_log()
+    def _get_session(self):
+        if options.keep_alive:
+            pool = _shared_pool if options.share_connection_pool else self._pool
+            return pool.get_session()
 
-        LOG.debug('Start request.')
-        LOG.debug('url: ' + url)
         session = requests.Session()
-        if LOG.level == logging.DEBUG:
-            for k, v in kwargs.items():
-                LOG.debug(k + ': ' + utils.to_text(v))
-
         # mount adapters with retry times
         session.mount(
             'http://', requests.adapters.HTTPAdapter(max_retries=options.retry_times))
         session.mount(
             'https://', requests.adapters.HTTPAdapter(max_retries=options.retry_times))
+        return session
+
+    def close(self):
+        """
+        Release pooled connections held by this client.
+        """
+        self._pool.close()
+
+    def _prepare_request(self, url, method, **kwargs):
+        LOG.debug('Start request.')
+        LOG.debug('url: ' + url)
+        if LOG.level == logging.DEBUG:
+            for k, v in kwargs.items():
+                LOG.debug(k + ': ' + utils.to_text(v))
 
         # Construct user agent without handling the letter case.
         headers = kwargs.get('headers', {})
@@ -99,11 +187,9 @@ class RestClient(object):
         prepared_req = req.prepare()
         LOG.debug("request url + params %s" % prepared_req.path_url)
         self._account.sign_request(prepared_req, self._endpoint)
+        return prepared_req
 
-        res = session.send(prepared_req, stream=stream,
-                           timeout=(options.connect_timeout, options.read_timeout),
-                           verify=False)
-
+    def _check_response(self, res, stream=False):
         LOG.debug('response.status_code %d' % res.status_code)
         LOG.debug('response.headers: \n%s' % res.headers)
         if not stream: LOG.debug('response.content: %s\n' % (res.content))
@@ -112,6 +198,16 @@ class RestClient(object):
             errors.throw_if_parsable(res)
         return res
 
+    def request(self, url, method, stream=False, **kwargs):
+        self.upload_survey_log()
+
+        session = self._get_session()
+        prepared_req = self._prepare_request(url, method, **kwargs)
+        res = session.send(prepared_req, stream=stream,
+                           timeout=(options.connect_timeout, options.read_timeout),
+                           verify=False)
+        return self._check_response(res, stream=stream)
+
     def get(self, url, stream=False, **kwargs):
         return self.request(url, 'get', stream=stream, **kwargs)
 
@@ -210,7 +210,7 @@ class BaseNodeEngine(object):
 
     def refresh_progress(self):
         for inst in self._instances:
-            reload_instance_status(self._odps, self._progress_group, inst.id)
+            reload_instance_status(self._odps, self._progress_group, inst)
 
     def show_error(self):
         # new-line symbol should not be removed.
@@ -22,7 +22,7 @@ cdef class Crc32c:
 
     cdef uint32_t _crc
 
-    cpdef update(self, bytearray buf)
+    cpdef update(self, const uint8_t[::1] buf, off=*, length=*)
 
     cpdef uint32_t getvalue(self)
 
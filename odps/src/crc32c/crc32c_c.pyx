@@ -29,9 +29,15 @@ cdef class Crc32c:
     cpdef uint32_t getvalue(self):
         return self._crc
 
-    cpdef update(self, bytearray buf):
-        cdef char* cstring = <char *>buf
-        self._crc = crc32c(self._crc, <const void*>cstring, len(buf))
+    cpdef update(self, const uint8_t[::1] buf, off=None, length=None):
+        # accepts bytes, bytearray, memoryview or any other contiguous buffer without copying
+        cdef Py_ssize_t start = off or 0
+        cdef Py_ssize_t size = length or buf.shape[0]
+
+        size = min(size, buf.shape[0] - start)
+        if size <= 0:
+            return
+        self._crc = crc32c(self._crc, <const void*>&buf[start], size)
 
     cpdef reset(self):
         self._crc = 0
\ No newline at end of file
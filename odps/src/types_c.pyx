@@ -147,6 +147,8 @@ cdef _getitem(object record, object item):
 
 
 class Record(types.Record):
+    # keep records free of instance dicts as the base class
+    __slots__ = ()
 
     def _mode(self):
         return 'c'
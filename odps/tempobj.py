@@ -40,6 +40,10 @@ TEMP_ROOT = utils.build_pyodps_dir('tempobjs')
 SESSION_KEY = '%d_%s' % (int(time.time()), uuid.uuid4())
 CLEANER_THREADS = 100
 USER_FILE_RIGHTS = stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
+# suffix of journals, which are not globbed by older versions unable to read them
+JOURNAL_SUFFIX = '.journal'
+# suffix of files holding one pickled list of objects, written by older versions
+LEGACY_SUFFIX = '.his'
 
 CLEANUP_SCRIPT_TMPL = """
 import os
@@ -115,6 +119,8 @@ class ExecutionEnv(object):
 class TempObject(object):
     __slots__ = []
     _type = ''
+    # whether the object can be referred by more than one process
+    _shared = False
 
     def __init__(self, *args, **kwargs):
         for k, v in zip(self.__slots__, args):
@@ -169,6 +175,7 @@ class TempModel(TempObject):
 class TempFunction(TempObject):
     __slots__ = 'function', 'project'
     _type = 'Function'
+    _shared = True
 
     def drop(self, odps):
         try:
@@ -180,6 +187,7 @@ class TempFunction(TempObject):
 class TempResource(TempObject):
     __slots__ = 'resource', 'project'
     _type = 'Resource'
+    _shared = True
 
     def drop(self, odps):
         try:
@@ -200,19 +208,51 @@ class TempVolumePartition(TempObject):
 
 
 class ObjectRepository(object):
+    """
+    Temp objects stored in an append-only journal. Every record of the journal
+    is a pickled tuple of an operation and a list of objects, while a pickled list,
+    which is written by compaction or by older versions, holds all the objects.
+    The journal is compacted when records are more than twice the objects.
+
+    Files not named with :data:`JOURNAL_SUFFIX` are written by older versions,
+    which only read one pickled list, thus they are always rewritten by compaction.
+    """
+    _PUT = 'put'
+    _REMOVE = 'remove'
+
     def __init__(self, file_name):
         self._container = set()
         self._file_name = file_name
+        self._pending = []
+        self._n_records = 0
+        self._is_journal = file_name is not None and file_name.endswith(JOURNAL_SUFFIX)
         if file_name and os.path.exists(file_name):
             self.load()
 
     def put(self, obj, dump=True):
+        if obj in self._container:
+            return
         self._container.add(obj)
+        self._pending.append(obj)
         if dump:
             self.dump()
 
-    def cleanup(self, odps, use_threads=True):
+    @property
+    def objects(self):
+        return set(self._container)
+
+    def cleanup(self, odps, use_threads=True, excludes=None):
+        """
+        Drop stored objects.
+
+        :param excludes: objects not to drop, for instance, objects still referred by other
+                         processes, or a function returning them, which is called once
+                         before dropping objects, and called again right before dropping
+                         objects shared by processes
+        """
         cleaned = []
+        get_excludes = excludes if callable(excludes) else lambda: excludes or ()
+        pools = []
 
         def _cleaner(obj):
             try:
@@ -221,38 +261,96 @@ class ObjectRepository(object):
             except:
                 pass
 
-        if self._container:
+        def _drop(objs):
+            referred = get_excludes()
+            to_drops = [o for o in objs if o not in referred]
+            if not to_drops:
+                return
             if use_threads:
-                pool = futures.ThreadPoolExecutor(CLEANER_THREADS)
-                list(pool.map(_cleaner, reversed(list(self._container))))
+                if not pools:
+                    pools.append(futures.ThreadPoolExecutor(CLEANER_THREADS))
+                list(pools[0].map(_cleaner, reversed(to_drops)))
             else:
-                for o in reversed(list(self._container)):
+                for o in reversed(to_drops):
                     _cleaner(o)
-        for obj in cleaned:
-            if obj in self._container:
-                self._container.remove(obj)
+
+        objs = list(self._container)
+        unshared_objs = [o for o in objs if not o._shared]
+        if unshared_objs:
+            _drop(unshared_objs)
+        # objects like udfs may be referred by running processes after cleaning
+        # starts, thus referred objects are checked again before dropping them
+        shared_objs = [o for o in objs if o._shared]
+        if shared_objs:
+            _drop(shared_objs)
+        cleaned = [obj for obj in cleaned if obj in self._container]
+        self._container.difference_update(cleaned)
         if not self._container and self._file_name:
+            self._pending = []
             try:
                 os.unlink(self._file_name)
             except OSError:
                 pass
         elif not utils.is_secret_mode():
             self.dump()
+            if cleaned:
+                self._append(self._REMOVE, cleaned)
+
+    def _append(self, op, objs):
+        if self._file_name is None:
+            return
+        if not self._is_journal or self._n_records >= max(len(self._container), 1) * 2:
+            self.compact()
+            return
+        exists = os.path.exists(self._file_name)
+        with open(self._file_name, 'ab') as outf:
+            pickle.dump((op, list(objs)), outf, protocol=0)
+        if not exists:
+            os.chmod(self._file_name, USER_FILE_RIGHTS)
+        self._n_records += 1
 
     def dump(self):
+        """
+        Write objects put since last dump into the journal.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._append(self._PUT, pending)
+
+    def compact(self):
+        """
+        Rewrite the journal with all the objects in one record.
+        """
+        self._pending = []
         if self._file_name is None:
             return
-        with open(self._file_name, 'wb') as outf:
+        tmp_name = '%s.%s.tmp' % (self._file_name, uuid.uuid4().hex)
+        with open(tmp_name, 'wb') as outf:
             pickle.dump(list(self._container), outf, protocol=0)
-            outf.close()
-        os.chmod(self._file_name, USER_FILE_RIGHTS)
+        os.chmod(tmp_name, USER_FILE_RIGHTS)
+        if os.name == 'nt' and os.path.exists(self._file_name):
+            os.unlink(self._file_name)
+        os.rename(tmp_name, self._file_name)
+        self._n_records = 1
 
     def load(self):
         try:
             with open(self._file_name, 'rb') as inpf:
-                contents = pickle.load(inpf)
-            self._container.update(contents)
-        except (EOFError, OSError):
+                while True:
+                    try:
+                        record = pickle.load(inpf)
+                    except EOFError:
+                        break
+                    self._n_records += 1
+                    if isinstance(record, list):
+                        self._container = set(record)
+                    elif record[0] == self._PUT:
+                        self._container.update(record[1])
+                    else:
+                        self._container.difference_update(record[1])
+        except (OSError, IOError, ValueError, pickle.UnpicklingError):
+            # the last record may be incomplete when the journal is being written
             pass
 
 
@@ -331,13 +429,17 @@ def _is_pid_running(pid):
             return False
 
 
-def clean_objects(odps):
-    odps_key = _gen_repository_key(odps)
+def _list_repository_files(odps_key):
     files = []
     for biz_id in _obj_repos.biz_ids:
-        files.extend(glob.glob(os.path.join(TEMP_ROOT, biz_id, odps_key, '*.his')))
+        for suffix in (JOURNAL_SUFFIX, LEGACY_SUFFIX):
+            files.extend(glob.glob(os.path.join(TEMP_ROOT, biz_id, odps_key, '*' + suffix)))
+    return files
+
 
-    for fn in files:
+def clean_objects(odps):
+    odps_key = _gen_repository_key(odps)
+    for fn in _list_repository_files(odps_key):
         repo = ObjectRepository(fn)
         repo.cleanup(odps, use_threads=False)
 
@@ -353,20 +455,26 @@ def clean_stored_objects(odps):
         return
     _cleaned_keys.add(odps_key)
 
-    files = []
-    for biz_id in _obj_repos.biz_ids:
-        files.extend(glob.glob(os.path.join(TEMP_ROOT, biz_id, odps_key, '*.his')))
+    def is_running(fn):
+        writer_pid = int(fn.rsplit('__', 1)[-1].split('.', 1)[0])
+        # we do not clean running process, unless its pid equals host_pid
+        return writer_pid != host_pid and _is_pid_running(writer_pid)
 
-    def clean_thread():
-        for fn in files:
-            writer_pid = int(fn.rsplit('__', 1)[-1].split('.', 1)[0])
+    def get_referred():
+        # objects like udfs can be shared by processes, and those referred
+        # by any running process are kept until all of them exit
+        referred = set()
+        for fn in _list_repository_files(odps_key):
+            if is_running(fn):
+                referred.update(ObjectRepository(fn).objects)
+        return referred
 
-            # we do not clean running process, unless its pid equals host_pid
-            if writer_pid != host_pid and _is_pid_running(writer_pid):
+    def clean_thread():
+        for fn in _list_repository_files(odps_key):
+            if is_running(fn):
                 continue
-
             repo = ObjectRepository(fn)
-            repo.cleanup(odps)
+            repo.cleanup(odps, excludes=get_referred)
 
     thread_obj = threading.Thread(target=clean_thread)
     thread_obj.start()
@@ -393,7 +501,7 @@ def _put_objects(odps, objs):
         file_dir = os.path.join(TEMP_ROOT, biz_id, odps_key)
         if not os.path.exists(file_dir):
             os.makedirs(file_dir)
-        file_name = os.path.join(file_dir, 'temp_objs_{0}__{1}.his'.format(SESSION_KEY, os.getpid()))
+        file_name = os.path.join(file_dir, 'temp_objs_{0}__{1}{2}'.format(SESSION_KEY, os.getpid(), JOURNAL_SUFFIX))
         _obj_repos[odps_key] = ObjectRepository(file_name)
     [_obj_repos[odps_key].put(o, False) for o in objs]
     _obj_repos[odps_key].dump()
@@ -15,10 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import collections
 import gc
 import os
 import sys
 import tempfile
+import threading
 import time
 import warnings
 
@@ -279,6 +281,180 @@ class TestBase(six.with_metaclass(TestMeta, compat.unittest.TestCase)):
                 raise SystemError('Waiting for container content time out.')
 
 
+class StubHTTPServer(object):
+    """
+    Local HTTP/1.1 server with keep-alive support used by tests and benchmarks
+    which do not need a real ODPS service. Every request is answered with
+    ``body``, or with what ``handler(request_handler, data)`` returns, which can
+    be the body or a tuple of body and headers. The number of TCP connections
+    accepted is recorded.
+    """
+    def __init__(self, body=b'OK', handler=None):
+        from ..compat import six
+        BaseHTTPServer = six.moves.BaseHTTPServer
+        socketserver = six.moves.socketserver
+
+        server = self
+
+        class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # buffer responses to avoid delayed ACKs between headers and body
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+                with server._lock:
+                    server.n_connections += 1
+
+            def _respond(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                data = self.rfile.read(length) if length else b''
+                with server._lock:
+                    server.n_requests += 1
+                    server.n_bytes_received += len(data)
+                resp = handler(self, data) if handler is not None else body
+                headers = dict()
+                if isinstance(resp, tuple):
+                    resp, headers = resp
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(resp)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(resp)
+
+            do_GET = do_POST = do_PUT = do_HEAD = do_DELETE = _respond
+
+            def log_message(self, *args):
+                pass
+
+        class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+            daemon_threads = True
+
+        self._lock = threading.Lock()
+        self.n_connections = 0
+        self.n_requests = 0
+        self.n_bytes_received = 0
+        self._server = Server(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def endpoint(self):
+        return 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+
+INSTANCE_STATUS_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Instance>
+  <Status>%s</Status>
+</Instance>
+'''
+
+TASK_STATUS_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Instance>
+  <Status>%s</Status>
+  <Tasks>
+    <Task Type="SQL">
+      <Name>AnonymousSQLTask</Name>
+      <Status>%s</Status>
+    </Task>
+  </Tasks>
+</Instance>
+'''
+
+TASK_RESULT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Instance>
+  <Tasks>
+    <Task Type="SQL">
+      <Name>AnonymousSQLTask</Name>
+      <Result Format="text"><![CDATA[%s]]></Result>
+    </Task>
+  </Tasks>
+</Instance>
+'''
+
+TASK_PROGRESS_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Progress>
+  <Stage ID="M1_Stg1">
+    <TerminatedWorkers>%d</TerminatedWorkers>
+    <RunningWorkers>1</RunningWorkers>
+    <TotalWorkers>10</TotalWorkers>
+  </Stage>
+</Progress>
+'''
+
+AUTHORIZATION_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Authorization>
+  <Result>token</Result>
+</Authorization>
+'''
+
+
+class InstanceServer(StubHTTPServer):
+    """
+    Fake service of SQL instances. Instances are running until the status is checked
+    for ``n_polls`` times, and requests of every kind are counted in ``n_requests_of``.
+    """
+    def __init__(self, n_polls=2, task_status='Success', result='"id","name"\n1,"a"\n2,"b"\n'):
+        self._n_polls = n_polls
+        self._task_status = task_status
+        self._result = result
+        self._instances = dict()
+        self._instance_lock = threading.Lock()
+        self.n_requests_of = collections.defaultdict(int)
+        super(InstanceServer, self).__init__(handler=self._handle)
+
+    def _handle(self, request, data):
+        url = compat.urlparse(request.path)
+        params = dict(compat.parse_qsl(url.query, keep_blank_values=True))
+
+        with self._instance_lock:
+            if request.command == 'POST' and url.path.endswith('/authorization'):
+                self.n_requests_of['logview'] += 1
+                return AUTHORIZATION_XML.encode('utf-8')
+            elif request.command == 'POST':
+                self.n_requests_of['create'] += 1
+                instance_id = 'instance_%d' % len(self._instances)
+                self._instances[instance_id] = 0
+                return b'', {'Location': self.endpoint + url.path + '/' + instance_id}
+
+            instance_id = url.path.rsplit('/', 1)[1]
+            if 'result' in params:
+                self.n_requests_of['result'] += 1
+                return (TASK_RESULT_XML % self._result).encode('utf-8')
+            elif 'instanceprogress' in params:
+                self.n_requests_of['progress'] += 1
+                return (TASK_PROGRESS_XML % self._instances[instance_id]).encode('utf-8')
+
+            self._instances[instance_id] += 1
+            terminated = self._instances[instance_id] >= self._n_polls
+            status = 'Terminated' if terminated else 'Running'
+            if 'taskstatus' in params:
+                self.n_requests_of['taskstatus'] += 1
+                task_status = self._task_status if terminated else 'Running'
+                return (TASK_STATUS_XML % (status, task_status)).encode('utf-8')
+
+            self.n_requests_of['status'] += 1
+            return (INSTANCE_STATUS_XML % status).encode('utf-8'), \
+                {'x-odps-owner': 'owner', 'x-odps-start-time': 'Mon, 10 Oct 2016 10:00:00 GMT'}
+
+
 try:
     from flaky import flaky
 
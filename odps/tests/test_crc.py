@@ -66,5 +66,22 @@ class Test(TestBase):
         crc.update(buf)
         self.assertEquals(2917307201, crc.getvalue())
 
+    @bothPyAndC
+    def testCrc32cBuffers(self):
+        crc = _crc.Crc32c()
+        crc.update(bytearray(b'abc'))
+        crc.update(bytearray())
+        crc.update(bytearray(b'1111111111111111111'))
+        expected = crc.getvalue()
+
+        crc = _crc.Crc32c()
+        crc.update(bytearray(b'abc1111111111111111111'))
+        self.assertEquals(expected, crc.getvalue())
+
+        crc = _crc.Crc32c()
+        buf = bytearray(b'xxabc1111111111111111111')
+        crc.update(buf, 2, len(buf) - 2)
+        self.assertEquals(expected, crc.getvalue())
+
 if __name__ == '__main__':
     unittest.main()
@@ -145,6 +145,48 @@ class Test(TestBase):
         dag.reset_graph()
         self.assertEqual(len(dag.nodes()), 0)
 
+    def testIncrementalSort(self):
+        dag = DAG()
+        nodes = list('abcd')
+        for node in nodes:
+            dag.add_node(node)
+        dag.add_edge('a', 'b')
+        dag.add_edge('b', 'c')
+
+        order = dag.topological_sort()
+        self.assertEqual(list('abc'), [n for n in order if n != 'd'])
+        # sort result is cached and not affected by changes of the returned list
+        order.reverse()
+        self.assertEqual(list('abc'), [n for n in dag.topological_sort() if n != 'd'])
+
+        # mutations invalidate the cached order
+        dag.add_edge('d', 'a')
+        self.assertEqual(list('dabc'), dag.topological_sort())
+        self.assertRaises(DAGValidationError, lambda: dag.add_edge('c', 'd'))
+        self.assertRaises(DAGValidationError, lambda: dag.add_edge('c', 'c'))
+        self.assertEqual(list('dabc'), dag.topological_sort())
+
+        dag.remove_edge('d', 'a')
+        dag.add_edge('c', 'd')
+        self.assertEqual(list('abcd'), dag.topological_sort())
+        self.assertEqual(['c'], dag.predecessors('d'))
+
+        dag.remove_node('b')
+        self.assertEqual([], dag.predecessors('c'))
+        self.assertEqual([], dag.successors('a'))
+        self.assertSetEqual(set('ac'), set(dag.indep_nodes()))
+
+        # graphs passed in are sorted without the cache
+        self.assertEqual([2, 1], dag._topological_sort_ids({1: set(), 2: set([1])}))
+        self.assertRaises(ValueError, lambda: dag._topological_sort_ids({1: set([2]), 2: set([1])}))
+
+        # dags sharing the graph share cached orders as well
+        shared = DAG()
+        shared._share_graph(dag)
+        shared.add_edge('a', 'c')
+        self.assertEqual(list('acd'), dag.topological_sort())
+        self.assertEqual(['a'], dag.predecessors('c'))
+
 
 if __name__ == '__main__':
     unittest.main()
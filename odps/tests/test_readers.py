@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from datetime import datetime
+
+from requests import Response
+
+from odps.tests.core import TestBase
+from odps.compat import unittest, six
+from odps.models import Schema
+from odps.readers import RecordReader
+
+
+class Test(TestBase):
+    def _make_response(self, text):
+        resp = Response()
+        resp.status_code = 200
+        resp.raw = six.BytesIO(text.encode('utf-8'))
+        return resp
+
+    def testReadCsvResults(self):
+        text = u'"id","name","flag"\n' \
+               u'1,"中文\\N",true\n' \
+               u'2,"multi\nline, \\\\n\\t",false\n' \
+               u'3,\\N,\\N\n' \
+               u'4,"no end",true'
+        expected = [[u'1', u'中文\\N', True],
+                    [u'2', u'multi\nline, \\\\n\\t', False],
+                    [u'3', None, None],
+                    [u'4', u'no end', True]]
+        schema = Schema.from_lists(['id', 'name', 'flag'], ['string', 'string', 'boolean'])
+
+        reader = RecordReader(schema, text)
+        self.assertEqual(expected, [r.values for r in reader])
+        self.assertEqual(text, reader.raw)
+
+        reader = RecordReader(schema, self._make_response(text))
+        # split multibyte chars and lines into different chunks
+        reader.CHUNK_SIZE = 5
+        self.assertEqual(expected, [r.values for r in reader])
+        # chunks of responses are released once records are read
+        self.assertRaises(IOError, lambda: reader.raw)
+
+        # raw text is available before records are read
+        reader = RecordReader(schema, self._make_response(text))
+        reader.CHUNK_SIZE = 5
+        self.assertEqual(text, reader.raw)
+        self.assertEqual(expected, [r.values for r in reader])
+        self.assertEqual(text, reader.raw)
+
+        reader = RecordReader(schema, self._make_response(text))
+        reader.CHUNK_SIZE = 5
+        self.assertEqual(expected[0], next(reader).values)
+        self.assertRaises(IOError, lambda: reader.raw)
+
+    def testReadStreamingResults(self):
+        schema = Schema.from_lists(['id'], ['string'])
+
+        class Stream(six.BytesIO):
+            n_reads = 0
+
+            def read(self, *args, **kwargs):
+                self.n_reads += 1
+                return super(Stream, self).read(*args, **kwargs)
+
+        resp = self._make_response(u'')
+        resp.raw = Stream(b'"id"\n' + b''.join(b'%d\n' % i for i in range(10000)))
+
+        reader = RecordReader(schema, resp)
+        self.assertEqual(u'0', next(reader)[0])
+        # only the first chunk is downloaded for the first record
+        self.assertEqual(1, resp.raw.n_reads)
+        self.assertEqual(9999, len(list(reader)))
+
+        resp = self._make_response(u'')
+        resp.raw = Stream(b'"id"\n' + b''.join(b'%d\n' % i for i in range(10000)))
+
+        reader = RecordReader(schema, resp)
+        reader.CHUNK_SIZE = 1024
+        n_records = 0
+        for _ in reader:
+            # downloaded chunks are not kept once decoded
+            self.assertEqual(0, len(reader._raw_chunks))
+            n_records += 1
+        self.assertEqual(10000, n_records)
+        self.assertGreater(resp.raw.n_reads, 10)
+
+    def testReadTypedResults(self):
+        text = u'"id","score","dt","tags","props","name"\n' \
+               u'1,1.5,2017-01-02 03:04:05,"[a, b]",{k:1},"\\N"\n' \
+               u'\\N,\\N,\\N,\\N,\\N,"\u4e2d\\t"\n'
+        expected = [[1, 1.5, datetime(2017, 1, 2, 3, 4, 5), ['a', 'b'], {'k': 1}, None],
+                    [None, None, None, None, None, u'\u4e2d\\t']]
+        schema = Schema.from_lists(['id', 'score', 'dt', 'tags', 'props', 'name'],
+                                   ['bigint', 'double', 'datetime', 'array<string>',
+                                    'map<string,bigint>', 'string'])
+
+        records = list(RecordReader(schema, text))
+        self.assertEqual(expected, [r.values for r in records])
+        self.assertEqual(1, records[0]['id'])
+        self.assertEqual([tuple(r) for r in expected], list(RecordReader(schema, text).iter_rows()))
+
+        columns = RecordReader(schema, text).read_columns()
+        self.assertEqual(schema.names, list(columns.keys()))
+        self.assertEqual([1, None], columns['id'])
+        self.assertEqual([None, u'\u4e2d\\t'], columns['name'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+
+from odps import options
+from odps.accounts import AliyunAccount
+from odps.compat import unittest
+from odps.rest import RestClient
+from odps.tests.core import TestBase, StubHTTPServer
+
+
+class Test(TestBase):
+    def setup(self):
+        self._old_keep_alive = options.keep_alive
+        self._old_idle_timeout = options.pool_idle_timeout
+
+    def teardown(self):
+        options.keep_alive = self._old_keep_alive
+        options.pool_idle_timeout = self._old_idle_timeout
+
+    def _make_client(self, endpoint):
+        return RestClient(AliyunAccount('access_id', 'secret_access_key'), endpoint)
+
+    def testKeepAlive(self):
+        options.keep_alive = True
+        with StubHTTPServer() as server:
+            client = self._make_client(server.endpoint)
+            for _ in range(10):
+                self.assertEqual(client.get(server.endpoint + '/get').content, b'OK')
+            client.put(server.endpoint + '/put', b'data')
+            client.close()
+
+            self.assertEqual(server.n_requests, 11)
+            self.assertEqual(server.n_connections, 1)
+
+    def testNoKeepAlive(self):
+        options.keep_alive = False
+        with StubHTTPServer() as server:
+            client = self._make_client(server.endpoint)
+            for _ in range(5):
+                client.get(server.endpoint + '/get')
+
+            self.assertEqual(server.n_requests, 5)
+            self.assertEqual(server.n_connections, 5)
+
+    def testIdleEviction(self):
+        options.keep_alive = True
+        options.pool_idle_timeout = 0
+        with StubHTTPServer() as server:
+            client = self._make_client(server.endpoint)
+            client.get(server.endpoint + '/get')
+            client._pool._last_used -= 1
+            client.get(server.endpoint + '/get')
+            client.close()
+
+            self.assertEqual(server.n_connections, 2)
+
+    def testThreadedRequests(self):
+        options.keep_alive = True
+        with StubHTTPServer() as server:
+            client = self._make_client(server.endpoint)
+            results = []
+
+            def run():
+                for _ in range(10):
+                    results.append(client.get(server.endpoint + '/get').content)
+
+            threads = [threading.Thread(target=run) for _ in range(4)]
+            [t.start() for t in threads]
+            [t.join() for t in threads]
+            client.close()
+
+            self.assertEqual(results, [b'OK'] * 40)
+            self.assertLessEqual(server.n_connections, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,8 +25,8 @@ import tempfile
 import json
 from time import sleep
 
-from odps import tempobj, utils
-from odps.compat import unittest
+from odps import ODPS, tempobj, utils
+from odps.compat import unittest, pickle
 from odps.tests.core import TestBase, tn, in_coverage_mode
 
 TEMP_TABLE_NAME = tn('pyodps_test_tempobj_cleanup')
@@ -97,6 +97,23 @@ for inst in insts:
 """
 
 
+dropped_objects = []
+
+
+class RecordedTempObject(tempobj.TempObject):
+    __slots__ = 'name',
+    _type = 'Recorded'
+
+    def drop(self, odps):
+        dropped_objects.append(self.name)
+
+
+class SharedRecordedTempObject(RecordedTempObject):
+    __slots__ = 'name',
+    _type = 'SharedRecorded'
+    _shared = True
+
+
 class TestTempObjs(TestBase):
     def setUp(self):
         super(TestTempObjs, self).setUp()
@@ -200,3 +217,111 @@ class TestTempObjs(TestBase):
             sleep(5)
             if trial == 0:
                 assert case()
+
+    def test_keep_referred_objects(self):
+        odps = ODPS('access_id', 'secret_access_key', 'test_project', endpoint='http://127.0.0.1:1')
+        odps_key = tempobj._gen_repository_key(odps)
+        file_dir = os.path.join(tempobj.TEMP_ROOT, 'default', odps_key)
+        if not os.path.exists(file_dir):
+            os.makedirs(file_dir)
+
+        proc = subprocess.Popen([sys.executable, '-c', 'pass'])
+        proc.wait()
+        dead_fn = os.path.join(file_dir, 'temp_objs_dead__%d.his' % proc.pid)
+        live_fn = os.path.join(file_dir, 'temp_objs_live__%d.journal' % os.getppid())
+
+        dead_repo = tempobj.ObjectRepository(dead_fn)
+        for name in ('shared', 'private'):
+            dead_repo.put(RecordedTempObject(name), False)
+        dead_repo.dump()
+        live_repo = tempobj.ObjectRepository(live_fn)
+        live_repo.put(RecordedTempObject('shared'))
+
+        old_timeout = tempobj.cleanup_timeout
+        try:
+            tempobj.cleanup_timeout = None
+            tempobj._cleaned_keys.discard(odps_key)
+            del dropped_objects[:]
+            tempobj.clean_stored_objects(odps)
+        finally:
+            tempobj.cleanup_timeout = old_timeout
+            os.unlink(live_fn)
+
+        # objects still referred by running processes are kept
+        self.assertEqual(['private'], dropped_objects)
+        self.assertEqual(set([RecordedTempObject('shared')]), tempobj.ObjectRepository(dead_fn).objects)
+        os.unlink(dead_fn)
+
+        # referred objects are checked once for objects not shared, and checked
+        # again right before dropping shared objects, as other processes may
+        # refer to them after cleaning starts
+        repo = tempobj.ObjectRepository(None)
+        for idx in range(10):
+            repo.put(RecordedTempObject('private%d' % idx), False)
+        for name in ('shared', 'referred_later', 'not_referred'):
+            repo.put(SharedRecordedTempObject(name), False)
+        checked = []
+
+        def get_referred():
+            checked.append(1)
+            if len(checked) == 1:
+                return set([SharedRecordedTempObject('shared')])
+            return set([SharedRecordedTempObject('shared'), SharedRecordedTempObject('referred_later')])
+
+        del dropped_objects[:]
+        repo.cleanup(None, use_threads=False, excludes=get_referred)
+        self.assertEqual(set(['private%d' % idx for idx in range(10)] + ['not_referred']),
+                         set(dropped_objects))
+        self.assertEqual(2, len(checked))
+        self.assertEqual(set([SharedRecordedTempObject('shared'), SharedRecordedTempObject('referred_later')]),
+                         repo.objects)
+
+    def test_repository_journal(self):
+        file_name = os.path.join(tempfile.gettempdir(), 'tmp_%d_journal.journal' % os.getpid())
+        try:
+            repo = tempobj.ObjectRepository(file_name)
+            for idx in range(10):
+                repo.put(RecordedTempObject('obj%d' % idx))
+            repo.put(RecordedTempObject('obj0'))
+            # every put appends a record rather than rewriting the file
+            self.assertEqual(10, repo._n_records)
+            objs = set(RecordedTempObject('obj%d' % idx) for idx in range(10))
+            self.assertEqual(objs, tempobj.ObjectRepository(file_name).objects)
+
+            # incomplete records are ignored
+            with open(file_name, 'ab') as f:
+                f.write(pickle.dumps(('put', [RecordedTempObject('obj10')]), protocol=0)[:-5])
+            self.assertEqual(objs, tempobj.ObjectRepository(file_name).objects)
+
+            # journals are compacted after objects are removed
+            del dropped_objects[:]
+            repo = tempobj.ObjectRepository(file_name)
+            repo.cleanup(None, use_threads=False, excludes=set(list(objs)[:2]))
+            self.assertEqual(8, len(dropped_objects))
+            self.assertEqual(1, repo._n_records)
+            self.assertEqual(set(list(objs)[:2]), tempobj.ObjectRepository(file_name).objects)
+
+            # files written by older versions can be read
+            with open(file_name, 'wb') as f:
+                pickle.dump(list(objs), f, protocol=0)
+            repo = tempobj.ObjectRepository(file_name)
+            repo.put(RecordedTempObject('obj10'))
+            self.assertEqual(11, len(tempobj.ObjectRepository(file_name).objects))
+        finally:
+            if os.path.exists(file_name):
+                os.unlink(file_name)
+
+        # files of older versions are kept as one pickled list, which older versions read
+        file_name = os.path.join(tempfile.gettempdir(), 'tmp_%d_legacy.his' % os.getpid())
+        try:
+            with open(file_name, 'wb') as f:
+                pickle.dump([RecordedTempObject('obj0')], f, protocol=0)
+            repo = tempobj.ObjectRepository(file_name)
+            repo.put(RecordedTempObject('obj1'))
+            repo.put(RecordedTempObject('obj2'))
+            with open(file_name, 'rb') as f:
+                self.assertEqual(set(RecordedTempObject('obj%d' % idx) for idx in range(3)),
+                                 set(pickle.load(f)))
+        finally:
+            if os.path.exists(file_name):
+                os.unlink(file_name)
@@ -189,6 +189,37 @@ class Test(TestBase):
         self.assertRaises(AttributeError, lambda: r['col3'])
         self.assertRaises(AttributeError, lambda: r['col3', ])
 
+    @bothPyAndC
+    def testSharedNameIndexes(self):
+        from odps.models.record import Record
+
+        s = Schema.from_lists(['col1', 'col2'], ['string', 'bigint'])
+        columns = s.columns
+        r1 = Record(columns, values=['a', 1])
+        r2 = Record._from_trusted_values(columns, [u'b', 2])
+        self.assertIs(r1._name_indexes, r2._name_indexes)
+        self.assertFalse(hasattr(r2, '__dict__'))
+
+        self.assertEqual(r2['col1'], 'b')
+        self.assertEqual(r2.col2, 2)
+        r2.col2 = '3'
+        self.assertEqual(r2['col2'], 3)
+        self.assertEqual(r2, Record(columns, values=['b', 3]))
+
+        # columns with the same names but in another list
+        r3 = Record(s.columns, values=['c', 4])
+        self.assertIs(r1._name_indexes, r3._name_indexes)
+        self.assertEqual(r3['col1'], 'c')
+
+        # lists of columns modified in place
+        columns.append(Column('col3', 'string'))
+        r4 = Record(columns, values=['d', 5, 'e'])
+        self.assertEqual(r4['col3'], 'e')
+        columns[0] = Column('renamed', 'string')
+        r5 = Record._from_trusted_values(columns, [u'f', 6, u'g'])
+        self.assertEqual(r5['renamed'], 'f')
+        self.assertRaises(AttributeError, lambda: r5['col1'])
+
     def testBizarreRepr(self):
         s = Schema.from_lists(['逗比 " \t'], ['string'], ['正常'], ['bigint'])
         s_repr = repr(s)
@@ -17,9 +17,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import os
+import time
+from datetime import datetime, timedelta
+
 from odps.tests.core import TestBase
 from odps.compat import unittest
-from odps.utils import replace_sql_parameters
+from odps.utils import replace_sql_parameters, DatetimeCodec
 
 
 class Test(TestBase):
@@ -32,6 +36,51 @@ class Test(TestBase):
         expected = 'select new_test1 from dual where :test2 > 0 and f=new_test3.abc'
         self.assertEqual(expected, replaced_sql)
 
+    def testDatetimeCodec(self):
+        codec = DatetimeCodec()
+        dt = datetime(2017, 1, 2, 3, 4, 5, 678000)
+        ms = codec.to_milliseconds(dt)
+        self.assertEqual(int(time.mktime(dt.timetuple())) * 1000 + 678, ms)
+        self.assertEqual(dt, codec.to_datetime(ms))
+
+        codec = DatetimeCodec(utc=True)
+        self.assertEqual(1483326245678, codec.to_milliseconds(dt))
+        self.assertEqual(dt, codec.to_datetime(1483326245678))
+        self.assertEqual(datetime(1969, 12, 31, 23, 59, 59, 999000), codec.to_datetime(-1))
+
+    @unittest.skipIf(not hasattr(time, 'tzset'), 'Time zones cannot be changed')
+    def testDatetimeCodecWithDST(self):
+        old_tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'America/New_York'
+        time.tzset()
+        try:
+            codec = DatetimeCodec()
+            # every 7 minutes around the day when DST starts and ends
+            starts = [datetime(2017, 3, 11), datetime(2017, 11, 4)]
+            dts = [start + timedelta(minutes=7 * i, milliseconds=i)
+                   for start in starts for i in range(3 * 24 * 60 // 7)]
+            # skip the hours which do not exist or are ambiguous
+            dts = [dt for dt in dts if (dt.month, dt.day, dt.hour) not in ((3, 12, 2), (11, 5, 1))]
+
+            milliseconds = [codec.to_milliseconds(dt) for dt in dts]
+            self.assertEqual([int(time.mktime(dt.timetuple())) * 1000 + dt.microsecond // 1000
+                              for dt in dts], milliseconds)
+            self.assertEqual(dts, [codec.to_datetime(ms) for ms in milliseconds])
+
+            try:
+                import numpy as np
+            except ImportError:
+                return
+            arr = codec.to_datetime64(np.array(milliseconds))
+            self.assertEqual(np.array(dts, dtype='datetime64[ms]').tolist(), arr.tolist())
+            self.assertEqual(milliseconds, codec.from_datetime64(arr).tolist())
+        finally:
+            if old_tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = old_tz
+            time.tzset()
+
 
 if __name__ == '__main__':
     unittest.main()
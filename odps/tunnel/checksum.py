@@ -23,13 +23,25 @@ import struct
 from ..crc import Crc32c, Crc32
 from .. import utils
 
+_INT_STRUCT = struct.Struct('<i')
+_LONG_STRUCT = struct.Struct('<q')
+_DOUBLE_STRUCT = struct.Struct('<d')
+
 
 class Checksum(object):
-    TRUE = bytearray([1])
-    FALSE = bytearray([0])
-    
+    """
+    Checksum of values in tunnel records. Values are packed into a reusable buffer
+    and the buffer is fed into CRC only when the value is fetched or the buffer
+    grows large, so CRC is usually updated once for every record.
+    """
+
+    TRUE = b'\x01'
+    FALSE = b'\x00'
+    BUFFER_LIMIT = 4096
+
     def __init__(self, method='crc32c'):
         self.crc = Crc32c() if method.lower() == 'crc32c' else Crc32()
+        self._buffer = bytearray()
 
     def _mode(self):
         # use for UT to check if use c extension
@@ -43,31 +55,38 @@ class Checksum(object):
     def update_bool(self, val):
         assert isinstance(val, bool)
 
-        val = self.TRUE if val else self.FALSE
-        self._update(val)
+        self._buffer += self.TRUE if val else self.FALSE
 
     def update_int(self, val):
-        val = struct.pack('<i', val)
-        self._update(val)
+        self._buffer += _INT_STRUCT.pack(val)
 
     def update_long(self, val):
-        val = struct.pack('<q', val)
-        self._update(val)
+        self._buffer += _LONG_STRUCT.pack(val)
 
     def update_float(self, val):
-        val = struct.pack('<d', val)
-        self._update(val)
+        self._buffer += _DOUBLE_STRUCT.pack(val)
+
+    def _flush(self):
+        if self._buffer:
+            self.crc.update(self._buffer)
+            del self._buffer[:]
 
     def _update(self, b):
         # update crc without type checking
-        self.crc.update(bytearray(b))
-            
+        if len(self._buffer) + len(b) <= self.BUFFER_LIMIT:
+            self._buffer += b
+        else:
+            self._flush()
+            self.crc.update(bytearray(b))
+
     def update(self, b):
         b = utils.to_binary(b)
         self._update(b)
-        
+
     def getvalue(self):
+        self._flush()
         return self.crc.getvalue()
-    
+
     def reset(self):
+        del self._buffer[:]
         return self.crc.reset()
@@ -19,11 +19,13 @@
 from libc.stdint cimport *
 from libc.string cimport *
 
-from ..crc32c_c import Crc32c
-
 cdef class Checksum:
 
     cdef object crc
+    cdef bint _use_crc32c
+    cdef uint32_t _crc32c
+
+    cdef int _update(self, const void *buf, size_t length) except -1
 
     cpdef update_bool(self, bint val)
 
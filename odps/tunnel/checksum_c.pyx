@@ -19,33 +19,54 @@
 from libc.stdint cimport *
 from libc.string cimport *
 
-from ..crc32c_c import Crc32c
 from ..crc import Crc32
 
+
+cdef extern from "../src/crc32c/crc32c.c":
+    uint32_t crc32c(uint32_t crc, const void *buf, size_t length)
+
+
 cdef class Checksum:
+    """
+    Checksum of values in tunnel records. CRC32C is computed directly over
+    the memory of values without packing them into Python objects.
+    """
 
     def __cinit__(self, method='crc32c'):
-        self.crc = Crc32c() if method == 'crc32c' else Crc32()
+        self._use_crc32c = method == 'crc32c'
+        self._crc32c = 0
+        self.crc = None if self._use_crc32c else Crc32()
+
+    cdef int _update(self, const void *buf, size_t length) except -1:
+        if self._use_crc32c:
+            self._crc32c = crc32c(self._crc32c, buf, length)
+        else:
+            self.crc.update(bytearray((<const char *>buf)[:length]))
+        return 0
 
     cpdef update_bool(self, bint val):
         cdef char retval
         retval = 1 if val else 0
-        self.update((<char *>&retval)[:1])
+        self._update(&retval, 1)
 
     cpdef update_int(self, int32_t val):
-        self.update((<char *>&val)[:sizeof(int32_t)])
+        self._update(&val, sizeof(int32_t))
 
     cpdef update_long(self, int64_t val):
-        self.update((<char *>&val)[:sizeof(int64_t)])
+        self._update(&val, sizeof(int64_t))
 
     cpdef update_float(self, double val):
-        self.update((<char *>&val)[:sizeof(double)])
+        self._update(&val, sizeof(double))
 
     cpdef update(self, bytes b):
-        self.crc.update(bytearray(b))
+        self._update(<const char *>b, len(b))
 
     cpdef uint32_t getvalue(self):
+        if self._use_crc32c:
+            return self._crc32c
         return self.crc.getvalue()
 
     cpdef reset(self):
-        return self.crc.reset()
\ No newline at end of file
+        self._crc32c = 0
+        if not self._use_crc32c:
+            self.crc.reset()
@@ -22,11 +22,42 @@ import zlib
 
 import threading
 from .. import errors, compat
-from ..compat import Enum, raise_exc
+from ..compat import Enum, raise_exc, six
 
 # used for test case to force thread io
 _FORCE_THREAD = False
 
+# data is split into at most so many chunks unless chunks grow larger than MAX_CHUNK_SIZE
+_MAX_CHUNKS = 16
+MAX_CHUNK_SIZE = 256 * 1024
+
+
+def get_chunk_size(chunk_size, data_size):
+    """
+    Size of chunks to send data of given size. Larger data is sent in larger
+    chunks to reduce system calls, while ``chunk_size`` is the lower bound.
+    """
+    adaptive_size = min((data_size + _MAX_CHUNKS - 1) // _MAX_CHUNKS, MAX_CHUNK_SIZE)
+    return max(chunk_size, adaptive_size)
+
+
+def iter_chunks(data, chunk_size):
+    """
+    Split data into chunks. Under Python 3, chunks are memoryviews of the data
+    thus no bytes are copied.
+    """
+    size = len(data)
+    chunk_size = get_chunk_size(chunk_size, size)
+    if size <= chunk_size:
+        if size:
+            yield data
+        return
+
+    if six.PY3:
+        data = memoryview(data)
+    for idx in compat.irange(0, size, chunk_size):
+        yield data[idx:idx + chunk_size]
+
 
 class RequestsIO(object):
     _async_err = None
@@ -63,10 +94,8 @@ class RequestsIO(object):
         while True:
             data = self.get()
             if data is not None:
-                while data:
-                    to_send = data[:self._chunk_size]
-                    data = data[self._chunk_size:]
-                    yield to_send
+                for chunk in iter_chunks(data, self._chunk_size):
+                    yield chunk
             else:
                 break
 
@@ -205,50 +234,36 @@ class SnappyOutputStream(object):
 
 class SimpleInputStream(object):
 
-    READ_BLOCK_SIZE = 1024 * 10
+    READ_BLOCK_SIZE = 1024 * 64
 
     def __init__(self, input):
         self._input = input
-        self._internal_buffer = compat.BytesIO()
-        self._buffered_len = 0
+        self._buffer = bytes()
+        self._pos = 0
 
     def read(self, limit):
-        if limit <= self._buffered_len - self._internal_buffer.tell():
-            return self._internal_buffer.read(limit)
-
-        bufs = list()
-        size_left = limit
+        pos = self._pos
+        available = len(self._buffer) - pos
+        if limit <= available:
+            self._pos = pos + limit
+            return self._buffer[pos:pos + limit]
+
+        bufs = [self._buffer[pos:]] if available else []
+        size_left = limit - available
+        self._buffer, self._pos = bytes(), 0
         while size_left > 0:
-            content = self._internal_read(size_left)
-            if not content:
-                break
-            bufs.append(content)
-            size_left -= len(content)
-        return bytes().join(bufs)
-
-    def _internal_read(self, limit):
-        if self._internal_buffer.tell() == self._buffered_len:
-            self._refill_buffer()
-        b = self._internal_buffer.read(limit)
-        return b
-
-    def _refill_buffer(self):
-        self._buffered_len = 0
-
-        buffer = []
-        left = self.READ_BLOCK_SIZE
-        while True:
             content = self._buffer_next_chunk()
             if content is None:
                 break
-            if content:
-                length = len(content)
-                left -= length
-                self._buffered_len += length
-                buffer.append(content)
+            if len(content) > size_left:
+                # keep the rest of the block for following reads
+                bufs.append(content[:size_left])
+                self._buffer, self._pos = content, size_left
                 break
-
-        self._internal_buffer = compat.BytesIO(bytes().join(buffer))
+            if content:
+                bufs.append(content)
+                size_left -= len(content)
+        return bufs[0] if len(bufs) == 1 else bytes().join(bufs)
 
     def _read_block(self):
         content = self._input.read(self.READ_BLOCK_SIZE)
@@ -265,24 +280,25 @@ class RequestsInputStream(SimpleInputStream):
 
 
 class DeflateInputStream(SimpleInputStream):
+    # bound sizes of decompressed blocks, as highly compressed data expands a lot
+    MAX_DECOMPRESS_SIZE = 1024 * 256
+
     def __init__(self, input):
         super(DeflateInputStream, self).__init__(input)
         self._decompressor = zlib.decompressobj(zlib.MAX_WBITS)
 
     def _buffer_next_chunk(self):
-        data = self._read_block()
+        data = self._decompressor.unconsumed_tail or self._read_block()
         if data is None:
             return None
         if data:
-            return self._decompressor.decompress(data)
+            return self._decompressor.decompress(data, self.MAX_DECOMPRESS_SIZE)
         else:
             return self._decompressor.flush()
 
 
 class SnappyInputStream(SimpleInputStream):
 
-    READ_BLOCK_SIZE = 1024
-
     def __init__(self, input):
         super(SnappyInputStream, self).__init__(input)
         try:
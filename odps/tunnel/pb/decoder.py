@@ -19,8 +19,6 @@ The original author is: robinson@google.com (Will Robinson).
 Modified by onesuperclark@gmail.com(onesuper).
 """
 
-import struct
-
 from . import input_stream
 from . import wire_format
 
@@ -39,7 +37,7 @@ class Decoder(object):
 
     def read_field_number_and_wire_type(self):
         """Reads a tag from the wire. Returns a (field_number, wire_type) pair."""
-        tag_and_type = self.read_uint32()
+        tag_and_type = self._stream.read_var_uint32()
         return wire_format.unpack_tag(tag_and_type)
 
     def read_int32(self):
@@ -92,13 +90,11 @@ class Decoder(object):
 
     def read_float(self):
         """Reads and returns a 4-byte floating-point number."""
-        serialized = self._stream.read_string(4)
-        return struct.unpack('f', serialized)[0]
+        return self._stream.read_float()
 
     def read_double(self):
         """Reads and returns an 8-byte floating-point number."""
-        serialized = self._stream.read_string(8)
-        return struct.unpack('d', serialized)[0]
+        return self._stream.read_double()
 
     def read_bool(self):
         """Reads and returns a bool."""
@@ -25,22 +25,52 @@ from . import errors
 from . import wire_format
 
 
+_uint32_le = struct.Struct(wire_format.FORMAT_UINT32_LITTLE_ENDIAN)
+_uint64_le = struct.Struct(wire_format.FORMAT_UINT64_LITTLE_ENDIAN)
+_float = struct.Struct('f')
+_double = struct.Struct('d')
+
+
 class InputStream(object):
     """Contains all logic for reading bits, and dealing with stream position.
 
+    Bytes are read from the input into a window in bulk, and values are
+    decoded from the window at an offset cursor without slicing.
+
     If an InputStream method ever raises an exception, the stream is left
     in an indeterminate state and is not safe for further use.
     """
 
+    WINDOW_SIZE = 64 * 1024
+
     def __init__(self, input):
         self._input = input
-        self._pos = 0
+        self._buf = bytearray()
+        self._view = memoryview(self._buf)
+        self._offset = 0
+        # position of the window in the stream
+        self._base = 0
 
     def position(self):
         """Returns the current position in the stream, or equivalently, the
         number of bytes read so far.
         """
-        return self._pos
+        return self._base + self._offset
+
+    def _fill(self, size):
+        """Reads from the input until at least 'size' bytes are available in
+        the window or the input is exhausted, and returns the number of
+        available bytes.
+        """
+        buf = self._buf[self._offset:]
+        while len(buf) < size:
+            data = self._input.read(max(size - len(buf), self.WINDOW_SIZE))
+            if not data:
+                break
+            buf += data
+        self._base += self._offset
+        self._buf, self._view, self._offset = buf, memoryview(buf), 0
+        return len(buf)
 
     def read_string(self, size):
         """Reads up to 'size' bytes from the stream, stopping early
@@ -49,35 +79,45 @@ class InputStream(object):
         """
         if size < 0:
             raise errors.DecodeError('Negative size %d' % size)
-        s = self._input.read(size)
-        if len(s) != size:
-            raise errors.DecodeError('String claims to have %d bytes, but read %d' % (size, len(s)))
-        self._pos += len(s)  # Only advance by the number of bytes actually read.
-        return s
+        available = len(self._buf) - self._offset
+        if available < size:
+            available = self._fill(size)
+            if available < size:
+                raise errors.DecodeError(
+                    'String claims to have %d bytes, but read %d' % (size, available))
+        offset = self._offset
+        self._offset = offset + size
+        return self._view[offset:offset + size].tobytes()
+
+    def _unpack(self, fmt):
+        if len(self._buf) - self._offset < fmt.size:
+            self._fill(fmt.size)
+        try:
+            value = fmt.unpack_from(self._buf, self._offset)[0]
+        except struct.error as e:
+            raise errors.DecodeError(e)
+        self._offset += fmt.size
+        return value
 
     def read_little_endian32(self):
         """Interprets the next 4 bytes of the stream as a little-endian
         encoded, unsiged 32-bit integer, and returns that integer.
         """
-        try:
-            i = struct.unpack(wire_format.FORMAT_UINT32_LITTLE_ENDIAN,
-                              self._input.read(4))
-            self._pos += 4
-            return i[0]  # unpack() result is a 1-element tuple.
-        except struct.error as e:
-            raise errors.DecodeError(e)
+        return self._unpack(_uint32_le)
 
     def read_little_endian64(self):
         """Interprets the next 8 bytes of the stream as a little-endian
         encoded, unsiged 64-bit integer, and returns that integer.
         """
-        try:
-            i = struct.unpack(wire_format.FORMAT_UINT64_LITTLE_ENDIAN,
-                              self._input.read(8))
-            self._pos += 8
-            return i[0]  # unpack() result is a 1-element tuple.
-        except struct.error as e:
-            raise errors.DecodeError(e)
+        return self._unpack(_uint64_le)
+
+    def read_float(self):
+        """Interprets the next 4 bytes of the stream as a float."""
+        return self._unpack(_float)
+
+    def read_double(self):
+        """Interprets the next 8 bytes of the stream as a double."""
+        return self._unpack(_double)
 
     def read_varint32(self):
         """Reads a varint from the stream, interprets this varint
@@ -92,6 +132,11 @@ class InputStream(object):
         """Reads a varint from the stream, interprets this varint
         as an unsigned, 32-bit integer, and returns the integer.
         """
+        buf, offset = self._buf, self._offset
+        if offset < len(buf) and buf[offset] < 0x80:
+            self._offset = offset + 1
+            return buf[offset]
+
         i = self.read_var_uint64()
         if i > wire_format.UINT32_MAX:
             raise errors.DecodeError('Value out of range for uint32: %d' % i)
@@ -110,6 +155,11 @@ class InputStream(object):
         """Reads a varint from the stream, interprets this varint
         as an unsigned, 64-bit integer, and returns the integer.
         """
+        buf, offset = self._buf, self._offset
+        if offset < len(buf) and buf[offset] < 0x80:
+            self._offset = offset + 1
+            return buf[offset]
+
         i = self._read_varint_helper()
         if not 0 <= i <= wire_format.UINT64_MAX:
             raise errors.DecodeError('Value out of range for uint64: %d' % i)
@@ -123,17 +173,24 @@ class InputStream(object):
         Does no bounds checking except to ensure that we read at most as many bytes
         as could possibly be present in a varint-encoded 64-bit number.
         """
+        buf, offset = self._buf, self._offset
+        if len(buf) - offset < 10:
+            # a varint-encoded 64-bit number takes at most 10 bytes
+            self._fill(10)
+            buf, offset = self._buf, self._offset
+
         result = 0
         shift = 0
         while 1:
             if shift >= 64:
                 raise errors.DecodeError('Too many bytes when decoding varint.')
             try:
-                b = ord(self._input.read(1))
+                b = buf[offset]
             except IndexError:
                 raise errors.DecodeError('Truncated varint.')
-            self._pos += 1
+            offset += 1
             result |= ((b & 0x7f) << shift)
             shift += 7
             if not (b & 0x80):
+                self._offset = offset
                 return result
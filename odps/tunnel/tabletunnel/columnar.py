@@ -0,0 +1,276 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Typed column buffers used by tunnel readers and writers to handle records in batches."""
+
+from decimal import Decimal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ... import types, utils, compat
+
+DEFAULT_BATCH_SIZE = 65536
+
+KIND_INT = 0
+KIND_DOUBLE = 1
+KIND_BOOL = 2
+KIND_OBJECT = 3
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError('NumPy is needed to read records in batches.')
+
+
+def get_column_kind(data_type):
+    if data_type == types.bigint or data_type == types.datetime:
+        return KIND_INT
+    elif data_type == types.double:
+        return KIND_DOUBLE
+    elif data_type == types.boolean:
+        return KIND_BOOL
+    return KIND_OBJECT
+
+
+def null_mask(arr):
+    """
+    Get a boolean array marking None, NaN and NaT values in ``arr``.
+    """
+    if arr.dtype.kind in 'fc':
+        return np.isnan(arr)
+    elif arr.dtype.kind in 'mM':
+        return np.isnat(arr)
+    elif arr.dtype.kind == 'O':
+        return np.fromiter((v is None or v != v for v in arr), dtype=np.bool_, count=len(arr))
+    return np.zeros(len(arr), dtype=np.bool_)
+
+
+class ColumnBuffers(object):
+    """
+    Preallocated buffers for one batch of columns. Values of bigint and datetime
+    columns are stored in ``ints``, double in ``doubles``, boolean in ``bools``
+    and others in lists of ``objects``. ``kinds`` and ``slots`` locate the buffer
+    of every column, and ``nulls`` marks null values (1 for null).
+    """
+    def __init__(self, columns, batch_size):
+        _check_numpy()
+
+        self.columns = columns
+        kinds = [get_column_kind(col.type) for col in columns]
+        counts = [0] * 4
+        slots = []
+        for kind in kinds:
+            slots.append(counts[kind])
+            counts[kind] += 1
+
+        self.kinds = np.array(kinds, dtype=np.int32)
+        self.slots = np.array(slots, dtype=np.int32)
+        self.ints = np.empty((counts[KIND_INT], batch_size), dtype=np.int64)
+        self.doubles = np.empty((counts[KIND_DOUBLE], batch_size), dtype=np.float64)
+        self.bools = np.empty((counts[KIND_BOOL], batch_size), dtype=np.uint8)
+        self.objects = [[None] * batch_size for _ in range(counts[KIND_OBJECT])]
+        self.nulls = np.ones((len(columns), batch_size), dtype=np.uint8)
+
+    def set_column(self, idx, values):
+        """
+        Fill buffers of a column with values in a sequence or a NumPy array.
+        None, NaN and NaT values are treated as nulls.
+        """
+        values = np.asarray(values)
+        n_rows = len(values)
+        data_type = self.columns[idx].type
+        kind, slot = self.kinds[idx], self.slots[idx]
+        mask = null_mask(values)
+        has_null = mask.any()
+        self.nulls[idx, :n_rows] = mask
+
+        if kind == KIND_INT:
+            if data_type == types.datetime:
+                if values.dtype.kind == 'M':
+                    values = values.copy()
+                    values[mask] = 0
+                    self.ints[slot, :n_rows] = utils.from_datetime64(values)
+                else:
+                    self.ints[slot, :n_rows] = [0 if m else utils.to_milliseconds(v)
+                                                for v, m in zip(values, mask)]
+            else:
+                self.ints[slot, :n_rows] = np.where(mask, 0, values) if has_null else values
+        elif kind == KIND_DOUBLE:
+            self.doubles[slot, :n_rows] = np.where(mask, 0, values) if has_null else values
+        elif kind == KIND_BOOL:
+            self.bools[slot, :n_rows] = np.where(mask, False, values) if has_null else values
+        else:
+            objects = values.tolist()
+            if has_null:
+                for i in np.flatnonzero(mask):
+                    objects[i] = None
+            self.objects[slot][:n_rows] = objects
+
+    def _to_array(self, idx, n_rows):
+        data_type = self.columns[idx].type
+        kind, slot = self.kinds[idx], self.slots[idx]
+        mask = self.nulls[idx, :n_rows].astype(np.bool_)
+        has_null = mask.any()
+
+        if kind == KIND_INT:
+            arr = self.ints[slot, :n_rows]
+            if data_type == types.datetime:
+                arr[mask] = 0
+                arr = utils.to_datetime64(arr)
+                arr[mask] = np.datetime64('NaT')
+            elif has_null:
+                arr = arr.astype(np.float64)
+                arr[mask] = np.nan
+        elif kind == KIND_DOUBLE:
+            arr = self.doubles[slot, :n_rows]
+            arr[mask] = np.nan
+        elif kind == KIND_BOOL:
+            arr = self.bools[slot, :n_rows].astype(np.bool_)
+            if has_null:
+                arr = arr.astype(object)
+                arr[mask] = None
+        else:
+            values = self.objects[slot]
+            arr = np.empty(n_rows, dtype=object)
+            if data_type == types.string:
+                arr[:] = [utils.to_text(v) for v in values[:n_rows]]
+            elif data_type == types.decimal:
+                arr[:] = [Decimal(utils.to_str(v)) if v is not None else None
+                          for v in values[:n_rows]]
+            else:
+                for i in compat.irange(n_rows):
+                    arr[i] = values[i]
+        return arr
+
+    def to_columns(self, n_rows):
+        return compat.OrderedDict((col.name, self._to_array(idx, n_rows))
+                                  for idx, col in enumerate(self.columns))
+
+
+class ColumnarReaderMixin(object):
+    """
+    Methods to read records in batches of columns instead of one record per row.
+    Readers should implement ``_read_batch_into(buffers, batch_size)`` which decodes
+    at most ``batch_size`` records into :class:`ColumnBuffers` and returns the number
+    of records decoded.
+    """
+
+    def read_batch(self, batch_size=None):
+        """
+        Read at most ``batch_size`` records as columns.
+
+        :param batch_size: max number of records in the batch
+        :return: ordered dict of column names and NumPy arrays, None when no records left
+        """
+        batch_size = batch_size or DEFAULT_BATCH_SIZE
+        buffers = ColumnBuffers(self._columns, batch_size)
+        n_rows = self._read_batch_into(buffers, batch_size)
+        if n_rows == 0:
+            return None
+        return buffers.to_columns(n_rows)
+
+    def read_batches(self, batch_size=None):
+        """
+        Iterate over batches of columns.
+
+        :param batch_size: max number of records in every batch
+        :return: generator of ordered dicts of column names and NumPy arrays
+        """
+        while True:
+            batch = self.read_batch(batch_size)
+            if batch is None:
+                break
+            yield batch
+
+    def to_pandas(self, batch_size=None):
+        """
+        Read all rest records into a pandas DataFrame.
+
+        :param batch_size: max number of records decoded in every batch
+        :return: pandas DataFrame
+        """
+        import pandas as pd
+
+        names = [col.name for col in self._columns]
+        frames = [pd.DataFrame(batch, columns=names)
+                  for batch in self.read_batches(batch_size)]
+        if not frames:
+            return pd.DataFrame(compat.OrderedDict((n, []) for n in names), columns=names)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+
+class ColumnarWriterMixin(object):
+    """
+    Methods to write columns of values without creating records for every row.
+    Writers should implement ``_write_buffers(buffers, start, end)`` which encodes
+    records between ``start`` and ``end`` in :class:`ColumnBuffers`.
+    """
+
+    WRITE_BATCH_ROWS = 4096
+
+    def write_batch(self, columns):
+        """
+        Write columns of values into the table. Values are not validated as
+        what is done in records, and None, NaN and NaT values are written as nulls.
+
+        :param columns: dict of column names and values, or list of column values
+                        in the order of table schema
+        """
+        data_columns = [col for col in self._columns if not self._schema.is_partition(col)]
+        if isinstance(columns, dict):
+            names = set(col.name for col in data_columns)
+            for name in columns:
+                if name not in names:
+                    raise ValueError('Column %s does not exist in schema.' % name)
+            idx_values = [(idx, columns[col.name]) for idx, col in enumerate(self._columns)
+                          if col.name in columns]
+        else:
+            columns = list(columns)
+            if len(columns) > len(data_columns):
+                raise ValueError('Columns count is more than schema.')
+            idx_values = list(zip(range(len(self._columns)), columns))
+
+        if not idx_values:
+            return
+        n_rows = len(idx_values[0][1])
+        if any(len(values) != n_rows for _, values in idx_values):
+            raise ValueError('All columns should have the same length.')
+        if n_rows == 0:
+            return
+
+        buffers = ColumnBuffers(self._columns, n_rows)
+        for idx, values in idx_values:
+            buffers.set_column(idx, values)
+
+        for start in compat.irange(0, n_rows, self.WRITE_BATCH_ROWS):
+            self._write_buffers(buffers, start, min(start + self.WRITE_BATCH_ROWS, n_rows))
+
+    def write_pandas(self, df):
+        """
+        Write a pandas DataFrame into the table. Columns of the DataFrame are
+        written in the order of table schema.
+
+        :param df: pandas DataFrame
+        """
+        self.write_batch([df.iloc[:, i].values for i in range(df.shape[1])])
@@ -22,7 +22,7 @@ from ... import serializers, types, compat
 from ...compat import Enum, six
 from ...models import Schema
 from ... import errors
-from .reader import TableTunnelReader
+from .reader import TableTunnelReader, ParallelTableTunnelReader
 
 
 class TableDownloadSession(serializers.JSONSerializableModel):
@@ -151,3 +151,25 @@ class TableDownloadSession(serializers.JSONSerializableModel):
 
         return TableTunnelReader(self.schema, input_stream, columns=columns)
 
+    def open_parallel_record_reader(self, start, count, n_threads, compress=False,
+                                    columns=None, step=None, ordered=True, split_size=None):
+        """
+        Open a reader which splits the records into row ranges and downloads them
+        concurrently with ``n_threads`` threads.
+
+        :param start: the record where read starts with
+        :param count: number of records to read
+        :param n_threads: number of concurrent downloading threads
+        :param compress: if True, the data will be compressed during downloading
+        :param columns: the columns' names which are the parts of table's columns
+        :param step: step of records to read, default as 1
+        :param ordered: if False, records are returned once their ranges are downloaded
+        :param split_size: number of records in each row range
+        :return: reader
+        """
+        def open_reader(range_start, range_count):
+            return self.open_record_reader(range_start, range_count,
+                                           compress=compress, columns=columns)
+
+        return ParallelTableTunnelReader(open_reader, start, count, n_threads, step=step,
+                                         ordered=ordered, split_size=split_size)
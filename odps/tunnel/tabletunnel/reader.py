@@ -18,14 +18,17 @@
 # under the License.
 
 import warnings
+from decimal import Decimal
 
 from ..pb.decoder import Decoder
 from ..checksum import Checksum
 from ..wireconstants import ProtoWireConstants
+from .columnar import ColumnarReaderMixin, KIND_INT, KIND_DOUBLE, KIND_BOOL
 from ... import utils, types, compat
 from ...models import Record
 from ...readers import AbstractRecordReader
 from ...config import options
+from ...compat import futures
 
 try:
     if not options.force_py:
@@ -38,7 +41,7 @@ except ImportError as e:
     TableTunnelReader = None
 
 if TableTunnelReader is None:
-    class TableTunnelReader(AbstractRecordReader):
+    class TableTunnelReader(AbstractRecordReader, ColumnarReaderMixin):
 
         def __init__(self, schema, input_stream, columns=None):
             self._schema = schema
@@ -46,11 +49,13 @@ if TableTunnelReader is None:
                 self._columns = self._schema.columns
             else:
                 self._columns = [self._schema[c] for c in columns]
+            self._name_indexes = dict((col.name, i) for i, col in enumerate(self._columns))
             self._reader = Decoder(input_stream)
             self._crc = Checksum()
             self._crccrc = Checksum()
             self._curr_cursor = 0
             self._read_limit = options.table_read_limit
+            self._stream_end = False
 
         def _mode(self):
             return 'py'
@@ -85,12 +90,31 @@ if TableTunnelReader is None:
 
             return res
 
+        def _read_record_end(self):
+            checksum = utils.long_to_int(self._crc.getvalue())
+            if int(self._reader.read_uint32()) != utils.int_to_uint(checksum):
+                raise IOError('Checksum invalid')
+            self._crc.reset()
+            self._crccrc.update_int(checksum)
+
+        def _read_stream_end(self):
+            if self.count != self._reader.read_sint64():
+                raise IOError('count does not match')
+            idx_of_checksum, _ = self._reader.read_field_number_and_wire_type()
+            if ProtoWireConstants.TUNNEL_META_CHECKSUM != idx_of_checksum:
+                raise IOError('Invalid stream data.')
+            if int(self._crccrc.getvalue()) != self._reader.read_uint32():
+                raise IOError('Checksum invalid.')
+            # if not self._reader.at_end():
+            #     raise IOError('Expect at the end of stream, but not.')
+            self._stream_end = True
+
         def read(self):
             if self._read_limit is not None and self.count >= self._read_limit:
                 warnings.warn('Number of lines read via tunnel already reaches the limitation.')
                 return None
 
-            record = Record(self._columns)
+            values = [None] * len(self._columns)
 
             while True:
                 index, _ = self._reader.read_field_number_and_wire_type()
@@ -98,24 +122,11 @@ if TableTunnelReader is None:
                 if index == 0:
                     continue
                 if index == ProtoWireConstants.TUNNEL_END_RECORD:
-                    checksum = utils.long_to_int(self._crc.getvalue())
-                    if int(self._reader.read_uint32()) != utils.int_to_uint(checksum):
-                        raise IOError('Checksum invalid')
-                    self._crc.reset()
-                    self._crccrc.update_int(checksum)
+                    self._read_record_end()
                     break
 
                 if index == ProtoWireConstants.TUNNEL_META_COUNT:
-                    if self.count != self._reader.read_sint64():
-                        raise IOError('count does not match')
-                    idx_of_checksum, _ = self._reader.read_field_number_and_wire_type()
-                    if ProtoWireConstants.TUNNEL_META_CHECKSUM != idx_of_checksum:
-                        raise IOError('Invalid stream data.')
-                    if int(self._crccrc.getvalue()) != self._reader.read_uint32():
-                        raise IOError('Checksum invalid.')
-                    # if not self._reader.at_end():
-                    #     raise IOError('Expect at the end of stream, but not.')
-
+                    self._read_stream_end()
                     return
 
                 if index > len(self._columns):
@@ -129,40 +140,112 @@ if TableTunnelReader is None:
                 if data_type == types.double:
                     val = self._reader.read_double()
                     self._crc.update_float(val)
-                    record[i] = val
+                    values[i] = val
                 elif data_type == types.boolean:
                     val = self._reader.read_bool()
                     self._crc.update_bool(val)
-                    record[i] = val
+                    values[i] = val
                 elif data_type == types.bigint:
                     val = self._reader.read_sint64()
                     self._crc.update_long(val)
-                    record[i] = val
+                    values[i] = val
                 elif data_type == types.string:
                     val = utils.to_text(self._reader.read_string())
                     self._crc.update(val)
-                    record[i] = val
+                    values[i] = val
                 elif data_type == types.datetime:
                     val = self._reader.read_sint64()
                     self._crc.update_long(val)
-                    record[i] = utils.to_datetime(val)
+                    values[i] = utils.to_datetime(val)
                 elif data_type == types.decimal:
                     val = self._reader.read_string()
                     self._crc.update(val)
-                    record[i] = val
+                    values[i] = Decimal(utils.to_str(val))
                 elif isinstance(data_type, types.Array):
                     val = self._read_array(data_type.value_type)
-                    record[i] = val
+                    values[i] = val
                 elif isinstance(data_type, types.Map):
                     keys = self._read_array(data_type.key_type)
-                    values = self._read_array(data_type.value_type)
-                    val = compat.OrderedDict(zip(keys, values))
-                    record[i] = val
+                    map_values = self._read_array(data_type.value_type)
+                    val = compat.OrderedDict(zip(keys, map_values))
+                    values[i] = val
                 else:
                     raise IOError('Unsupported type %s' % data_type)
 
             self._curr_cursor += 1
-            return record
+            # values are decoded in types of columns, thus not validated again
+            return Record._from_trusted_values(self._columns, values, self._name_indexes)
+
+        def _read_batch_into(self, buffers, batch_size):
+            kinds, slots, nulls = buffers.kinds, buffers.slots, buffers.nulls
+            ints, doubles, bools, objects = \
+                buffers.ints, buffers.doubles, buffers.bools, buffers.objects
+            n_columns = len(self._columns)
+
+            row = 0
+            while row < batch_size and not self._stream_end:
+                if self._read_limit is not None and self.count >= self._read_limit:
+                    warnings.warn('Number of lines read via tunnel already reaches the limitation.')
+                    break
+
+                while True:
+                    index, _ = self._reader.read_field_number_and_wire_type()
+
+                    if index == 0:
+                        continue
+                    if index == ProtoWireConstants.TUNNEL_END_RECORD:
+                        self._read_record_end()
+                        self._curr_cursor += 1
+                        row += 1
+                        break
+
+                    if index == ProtoWireConstants.TUNNEL_META_COUNT:
+                        self._read_stream_end()
+                        break
+
+                    if index > n_columns:
+                        raise IOError('Invalid protobuf tag. Perhaps the datastream '
+                                      'from server is crushed.')
+
+                    self._crc.update_int(index)
+
+                    i = index - 1
+                    kind, slot = kinds[i], slots[i]
+                    if kind == KIND_INT:
+                        val = self._reader.read_sint64()
+                        self._crc.update_long(val)
+                        ints[slot, row] = val
+                    elif kind == KIND_DOUBLE:
+                        val = self._reader.read_double()
+                        self._crc.update_float(val)
+                        doubles[slot, row] = val
+                    elif kind == KIND_BOOL:
+                        val = self._reader.read_bool()
+                        self._crc.update_bool(val)
+                        bools[slot, row] = val
+                    else:
+                        objects[slot][row] = self._read_object(self._columns[i].type)
+                    nulls[i, row] = 0
+
+            return row
+
+        def _read_object(self, data_type):
+            if data_type == types.string:
+                val = utils.to_text(self._reader.read_string())
+                self._crc.update(val)
+                return val
+            elif data_type == types.decimal:
+                val = self._reader.read_string()
+                self._crc.update(val)
+                return val
+            elif isinstance(data_type, types.Array):
+                return self._read_array(data_type.value_type)
+            elif isinstance(data_type, types.Map):
+                keys = self._read_array(data_type.key_type)
+                values = self._read_array(data_type.value_type)
+                return compat.OrderedDict(zip(keys, values))
+            else:
+                raise IOError('Unsupported type %s' % data_type)
 
         def __next__(self):
             record = self.read()
@@ -188,3 +271,138 @@ if TableTunnelReader is None:
         def __exit__(self, *_):
             if hasattr(self._schema, 'close'):
                 self._schema.close()
+
+
+class ParallelTableTunnelReader(AbstractRecordReader):
+    """
+    Reader which splits ``[start, start + count)`` into row ranges and downloads
+    them concurrently within one download session.
+
+    :param open_reader: callable accepting ``start`` and ``count`` which opens a reader
+                        for the given row range
+    :param start: the record where read starts with
+    :param count: number of records to read
+    :param n_threads: number of concurrent downloading threads
+    :param step: step of records to read, default as 1
+    :param ordered: if True, records are yielded in the order of the table,
+                    otherwise yielded as soon as their ranges are downloaded
+    :param split_size: number of records in each row range
+    """
+
+    DEFAULT_SPLIT_SIZE = 20000
+
+    def __init__(self, open_reader, start, count, n_threads, step=None,
+                 ordered=True, split_size=None):
+        self._open_reader = open_reader
+        self._step = step or 1
+        self._n_threads = n_threads
+        self._ordered = ordered
+
+        read_limit = options.table_read_limit
+        if read_limit is not None and count > read_limit * self._step:
+            warnings.warn('Number of lines read via tunnel already reaches the limitation.')
+            count = read_limit * self._step
+
+        split_size = split_size or min(self.DEFAULT_SPLIT_SIZE,
+                                       -(-count // n_threads))
+        # align ranges with steps to keep selected rows unchanged
+        split_size = max(-(-split_size // self._step) * self._step, self._step)
+        self._ranges = [(s, min(split_size, start + count - s))
+                        for s in compat.irange(start, start + count, split_size)]
+
+        self._executor = None
+        self._pending = compat.OrderedDict()
+        self._closed = False
+        self._curr_cursor = 0
+        self._n_bytes = 0
+        self._it = self._iter_records()
+
+    def _mode(self):
+        return 'parallel'
+
+    @property
+    def count(self):
+        return self._curr_cursor
+
+    @property
+    def n_bytes(self):
+        return self._n_bytes
+
+    def get_total_bytes(self):
+        return self.n_bytes
+
+    def _read_range(self, start, count):
+        records = []
+        with self._open_reader(start, count) as reader:
+            for idx, record in enumerate(reader):
+                if self._closed:
+                    break
+                if idx % self._step == 0:
+                    records.append(record)
+            n_bytes = reader.n_bytes
+        return records, n_bytes
+
+    def _iter_futures(self):
+        self._executor = futures.ThreadPoolExecutor(max_workers=self._n_threads)
+        # keep a bounded number of ranges in memory
+        max_pending = 2 * self._n_threads
+        ranges = iter(self._ranges)
+        pending = self._pending
+
+        def submit():
+            for rng in ranges:
+                pending[self._executor.submit(self._read_range, *rng)] = rng
+                if len(pending) >= max_pending:
+                    break
+
+        submit()
+        while pending:
+            if self._ordered:
+                fut = next(iter(pending))
+                fut.result()
+            else:
+                done, _ = futures.wait(list(pending), return_when=futures.FIRST_COMPLETED)
+                fut = next(f for f in pending if f in done)
+            del pending[fut]
+            yield fut
+            submit()
+
+    def _iter_records(self):
+        try:
+            for fut in self._iter_futures():
+                records, n_bytes = fut.result()
+                self._n_bytes += n_bytes
+                for record in records:
+                    self._curr_cursor += 1
+                    yield record
+        finally:
+            self.close()
+
+    def read(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            return None
+
+    def __next__(self):
+        return next(self._it)
+
+    next = __next__
+
+    def reads(self):
+        return self.__iter__()
+
+    def close(self):
+        self._closed = True
+        for fut in self._pending:
+            fut.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
@@ -26,11 +26,12 @@ from ..checksum_c cimport Checksum
 cdef class BaseTableTunnelReader:
 
     cdef object _schema
-    cdef object _columns
+    cdef readonly object _columns
     cdef Decoder _reader
     cdef Checksum _crc
     cdef Checksum _crccrc
     cdef int _curr_cusor
+    cdef bint _stream_end
 
     cdef list _read_array(self, object value_type)
     cdef bytes _read_string(self)
@@ -38,11 +39,12 @@ cdef class BaseTableTunnelReader:
     cdef bint _read_bool(self)
     cdef int64_t _read_bigint(self)
     cdef object _read_datetime(self)
-    cdef _set_string(self, object record, int i)
-    cdef _set_double(self, object record, int i)
-    cdef _set_bool(self, object record, int i)
-    cdef _set_bigint(self, object record, int i)
-    cdef _set_datetime(self, object record, int i)
-    cdef _set_decimal(self, object record, int i)
+    cdef _set_string(self, list values, int i)
+    cdef _set_double(self, list values, int i)
+    cdef _set_bool(self, list values, int i)
+    cdef _set_bigint(self, list values, int i)
+    cdef _set_datetime(self, list values, int i)
+    cdef _set_decimal(self, list values, int i)
     cdef dict _get_read_functions(self)
+    cdef object _read_object(self, object data_type)
     cpdef read(self)
\ No newline at end of file
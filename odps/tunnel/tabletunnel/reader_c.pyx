@@ -23,10 +23,13 @@ from ..pb.decoder_c cimport Decoder
 from ..checksum_c cimport Checksum
 
 import warnings
+from decimal import Decimal
+
 from ..wireconstants import ProtoWireConstants
 from ... import utils, types, compat, options
 from ...models import Record
 from ...readers import AbstractRecordReader
+from .columnar import ColumnarReaderMixin, KIND_INT, KIND_DOUBLE, KIND_BOOL
 
 
 cdef class BaseTableTunnelReader:
@@ -41,6 +44,7 @@ cdef class BaseTableTunnelReader:
         self._crccrc = Checksum()
         self._curr_cursor = 0
         self._read_limit = options.table_read_limit
+        self._stream_end = False
 
     def _mode(self):
         return 'c'
@@ -114,32 +118,32 @@ cdef class BaseTableTunnelReader:
         self._crc.update_long(val)
         return utils.to_datetime(val)
 
-    cdef _set_string(self, object record, int i):
+    cdef _set_string(self, list values, int i):
         cdef bytes val = self._read_string()
-        record[i] = val
+        values[i] = val.decode('utf-8')
 
-    cdef _set_double(self, object record, int i):
+    cdef _set_double(self, list values, int i):
         cdef double val = self._read_double()
-        record[i] = val
+        values[i] = val
 
-    cdef _set_bool(self, object record, int i):
+    cdef _set_bool(self, list values, int i):
         cdef bint val = self._read_bool()
-        record[i] = val
+        values[i] = val
 
-    cdef _set_bigint(self, object record, int i):
+    cdef _set_bigint(self, list values, int i):
         cdef int64_t val = self._read_bigint()
-        record[i] = val
+        values[i] = val
 
-    cdef _set_datetime(self, object record, int i):
+    cdef _set_datetime(self, list values, int i):
         cdef object val = self._read_datetime()
-        record[i] = val
+        values[i] = val
 
-    cdef _set_decimal(self, object record, int i):
+    cdef _set_decimal(self, list values, int i):
         cdef bytes val
 
         val = self._reader.read_string()
         self._crc.update(val)
-        record[i] = val
+        values[i] = Decimal(utils.to_str(val))
 
     cdef dict _get_read_functions(self):
         return {
@@ -158,12 +162,13 @@ cdef class BaseTableTunnelReader:
             int idx_of_checksum
             int i
             object data_type
-            object record
+            list values
+            dict read_functions = self._get_read_functions()
 
         if self._read_limit is not None and self.count >= self._read_limit:
             warnings.warn('Number of lines read via tunnel already reaches the limitation.')
             return None
-        record = Record(self._columns)
+        values = [None] * len(self._columns)
 
         while True:
             index, _ = self._reader.read_field_number_and_wire_type()
@@ -188,6 +193,7 @@ cdef class BaseTableTunnelReader:
                     raise IOError('Checksum invalid.')
                 # if not self._reader.at_end():
                 #     raise IOError('Expect at the end of stream, but not.')
+                self._stream_end = True
 
                 return
 
@@ -197,25 +203,109 @@ cdef class BaseTableTunnelReader:
 
             self._crc.update_int(index)
 
-            read_functions = self._get_read_functions()
-
             i = index - 1
             data_type = self._columns[i].type
             if data_type in read_functions:
-                read_functions[data_type](self, record, i)
+                read_functions[data_type](self, values, i)
             elif isinstance(data_type, types.Array):
                 val = self._read_array(data_type.value_type)
-                record[i] = val
+                values[i] = val
             elif isinstance(data_type, types.Map):
                 keys = self._read_array(data_type.key_type)
-                values = self._read_array(data_type.value_type)
-                val = compat.OrderedDict(zip(keys, values))
-                record[i] = val
+                map_values = self._read_array(data_type.value_type)
+                val = compat.OrderedDict(zip(keys, map_values))
+                values[i] = val
             else:
                 raise IOError('Unsupported type %s' % data_type)
 
         self._curr_cursor += 1
-        return record
+        # values are decoded in types of columns, thus not validated again
+        return Record._from_trusted_values(self._columns, values)
+
+    def _read_batch_into(self, object buffers, int batch_size):
+        cdef:
+            int row = 0
+            int index
+            int checksum
+            int idx_of_checksum
+            int i
+            int kind
+            int slot
+            int n_columns = len(self._columns)
+            int kind_int = KIND_INT
+            int kind_double = KIND_DOUBLE
+            int kind_bool = KIND_BOOL
+            int32_t[:] kinds = buffers.kinds
+            int32_t[:] slots = buffers.slots
+            int64_t[:, :] ints = buffers.ints
+            double[:, :] doubles = buffers.doubles
+            uint8_t[:, :] bools = buffers.bools
+            uint8_t[:, :] nulls = buffers.nulls
+            list objects = buffers.objects
+
+        while row < batch_size and not self._stream_end:
+            if self._read_limit is not None and self.count >= self._read_limit:
+                warnings.warn('Number of lines read via tunnel already reaches the limitation.')
+                break
+
+            while True:
+                index, _ = self._reader.read_field_number_and_wire_type()
+
+                if index == 0:
+                    continue
+                if index == ProtoWireConstants.TUNNEL_END_RECORD:
+                    checksum = utils.long_to_int(self._crc.getvalue())
+                    if int(self._reader.read_uint32()) != utils.int_to_uint(checksum):
+                        raise IOError('Checksum invalid')
+                    self._crc.reset()
+                    self._crccrc.update_int(checksum)
+                    self._curr_cursor += 1
+                    row += 1
+                    break
+
+                if index == ProtoWireConstants.TUNNEL_META_COUNT:
+                    if self.count != self._reader.read_sint64():
+                        raise IOError('count does not match')
+                    idx_of_checksum, _ = self._reader.read_field_number_and_wire_type()
+                    if ProtoWireConstants.TUNNEL_META_CHECKSUM != idx_of_checksum:
+                        raise IOError('Invalid stream data.')
+                    if int(self._crccrc.getvalue()) != self._reader.read_uint32():
+                        raise IOError('Checksum invalid.')
+                    self._stream_end = True
+                    break
+
+                if index > n_columns:
+                    raise IOError('Invalid protobuf tag. Perhaps the datastream '
+                                  'from server is crushed.')
+
+                self._crc.update_int(index)
+
+                i = index - 1
+                kind = kinds[i]
+                slot = slots[i]
+                if kind == kind_int:
+                    ints[slot, row] = self._read_bigint()
+                elif kind == kind_double:
+                    doubles[slot, row] = self._read_double()
+                elif kind == kind_bool:
+                    bools[slot, row] = self._read_bool()
+                else:
+                    objects[slot][row] = self._read_object(self._columns[i].type)
+                nulls[i, row] = 0
+
+        return row
+
+    cdef object _read_object(self, object data_type):
+        if data_type == types.string or data_type == types.decimal:
+            return self._read_string()
+        elif isinstance(data_type, types.Array):
+            return self._read_array(data_type.value_type)
+        elif isinstance(data_type, types.Map):
+            keys = self._read_array(data_type.key_type)
+            values = self._read_array(data_type.value_type)
+            return compat.OrderedDict(zip(keys, values))
+        else:
+            raise IOError('Unsupported type %s' % data_type)
 
     def reads(self):
         return self.__iter__()
@@ -235,7 +325,7 @@ cdef class BaseTableTunnelReader:
             self._schema.close()
 
 
-class TableTunnelReader(BaseTableTunnelReader, AbstractRecordReader):
+class TableTunnelReader(BaseTableTunnelReader, AbstractRecordReader, ColumnarReaderMixin):
     def __next__(self):
         record = self.read()
         if record is None:
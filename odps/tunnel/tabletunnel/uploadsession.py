@@ -96,7 +96,19 @@ class TableUploadSession(serializers.JSONSerializableModel):
     def new_record(self, values=None):
         return Record(self.schema.columns, values=values)
 
-    def open_record_writer(self, block_id=None, compress=False, buffer_size=None):
+    def open_record_writer(self, block_id=None, compress=False, buffer_size=None,
+                           n_threads=None, max_in_flight=None):
+        """
+        Open a writer to upload records.
+
+        :param block_id: id of the block to write, if not provided, a buffered writer
+                         which splits records into multiple blocks will be returned
+        :param compress: if True, the data will be compressed during uploading
+        :param buffer_size: size of buffer for every block, only for buffered writer
+        :param n_threads: number of threads uploading blocks, only for buffered writer
+        :param max_in_flight: max number of blocks waiting for uploading, only for buffered writer
+        :return: writer
+        """
         compress_option = self._compress_option or CompressOption()
 
         params = {}
@@ -121,10 +133,12 @@ class TableUploadSession(serializers.JSONSerializableModel):
 
         if block_id is None:
             def upload_block(blockid, data):
-                params['blockid'] = blockid
-                self._client.put(url, data=data, params=params, headers=headers)
+                block_params = params.copy()
+                block_params['blockid'] = blockid
+                self._client.put(url, data=data, params=block_params, headers=headers)
             writer = BufferredRecordWriter(self.schema, upload_block, compress_option=option,
-                                           buffer_size=buffer_size)
+                                           buffer_size=buffer_size, n_threads=n_threads,
+                                           max_in_flight=max_in_flight)
         else:
             params['blockid'] = block_id
 
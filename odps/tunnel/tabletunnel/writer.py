@@ -17,6 +17,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+
 from ...config import options
 try:
     if not options.force_py:
@@ -31,9 +33,11 @@ from ..pb.encoder import Encoder
 from ..pb.wire_format import WIRETYPE_VARINT, WIRETYPE_FIXED64, WIRETYPE_LENGTH_DELIMITED
 from ..checksum import Checksum
 from ..wireconstants import ProtoWireConstants
-from ..io import CompressOption, SnappyOutputStream, DeflateOutputStream, RequestsIO
+from ..io import CompressOption, SnappyOutputStream, DeflateOutputStream, RequestsIO, \
+    iter_chunks
+from .columnar import ColumnarWriterMixin, KIND_INT, KIND_DOUBLE, KIND_BOOL
 from ... import types, compat, utils, errors, options
-from ...compat import six
+from ...compat import six, futures
 
 
 if BaseRecordWriter is None:
@@ -138,40 +142,79 @@ if BaseRecordWriter is None:
 
                 pb_index = i + 1
                 self._crc.update_int(pb_index)
-
-                data_type = self._columns[i].type
-                if data_type == types.boolean:
-                    self._write_tag(pb_index, WIRETYPE_VARINT)
-                    self._write_bool(val)
-                elif data_type == types.datetime:
-                    val = utils.to_milliseconds(val)
-                    self._write_tag(pb_index, WIRETYPE_VARINT)
-                    self._write_long(val)
-                elif data_type == types.string:
-                    self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                    self._write_string(val)
-                elif data_type == types.double:
-                    self._write_tag(pb_index, WIRETYPE_FIXED64)
-                    self._write_double(val)
-                elif data_type == types.bigint:
-                    self._write_tag(pb_index, WIRETYPE_VARINT)
-                    self._write_long(val)
-                elif data_type == types.decimal:
-                    self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                    self._write_string(str(val))
-                elif isinstance(data_type, types.Array):
-                    self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                    self._write_raw_uint(len(val))
-                    self._write_array(val, data_type.value_type)
-                elif isinstance(data_type, types.Map):
-                    self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                    self._write_raw_uint(len(val))
-                    self._write_array(compat.lkeys(val), data_type.key_type)
-                    self._write_raw_uint(len(val))
-                    self._write_array(compat.lvalues(val), data_type.value_type)
+                self._write_field(pb_index, val, self._columns[i].type)
+
+            self._write_record_end()
+
+        def _write_buffers(self, buffers, start, end):
+            columns = []
+            for i, col in enumerate(self._columns):
+                kind, slot = buffers.kinds[i], buffers.slots[i]
+                if kind == KIND_INT:
+                    values = buffers.ints[slot, start:end].tolist()
+                elif kind == KIND_DOUBLE:
+                    values = buffers.doubles[slot, start:end].tolist()
+                elif kind == KIND_BOOL:
+                    values = buffers.bools[slot, start:end].astype(bool).tolist()
                 else:
-                    raise IOError('Invalid data type: %s' % data_type)
+                    values = buffers.objects[slot][start:end]
+                nulls = buffers.nulls[i, start:end].tolist()
+                columns.append((i + 1, kind, col.type, values, nulls))
+
+            for row in compat.irange(end - start):
+                for pb_index, kind, data_type, values, nulls in columns:
+                    if nulls[row]:
+                        continue
+
+                    self._crc.update_int(pb_index)
+                    if kind == KIND_INT:
+                        self._write_tag(pb_index, WIRETYPE_VARINT)
+                        self._write_long(values[row])
+                    elif kind == KIND_DOUBLE:
+                        self._write_tag(pb_index, WIRETYPE_FIXED64)
+                        self._write_double(values[row])
+                    elif kind == KIND_BOOL:
+                        self._write_tag(pb_index, WIRETYPE_VARINT)
+                        self._write_bool(values[row])
+                    else:
+                        self._write_field(pb_index, values[row], data_type)
+
+                self._write_record_end()
+
+        def _write_field(self, pb_index, val, data_type):
+            if data_type == types.boolean:
+                self._write_tag(pb_index, WIRETYPE_VARINT)
+                self._write_bool(val)
+            elif data_type == types.datetime:
+                val = utils.to_milliseconds(val)
+                self._write_tag(pb_index, WIRETYPE_VARINT)
+                self._write_long(val)
+            elif data_type == types.string:
+                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+                self._write_string(val)
+            elif data_type == types.double:
+                self._write_tag(pb_index, WIRETYPE_FIXED64)
+                self._write_double(val)
+            elif data_type == types.bigint:
+                self._write_tag(pb_index, WIRETYPE_VARINT)
+                self._write_long(val)
+            elif data_type == types.decimal:
+                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+                self._write_string(str(val))
+            elif isinstance(data_type, types.Array):
+                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+                self._write_raw_uint(len(val))
+                self._write_array(val, data_type.value_type)
+            elif isinstance(data_type, types.Map):
+                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+                self._write_raw_uint(len(val))
+                self._write_array(compat.lkeys(val), data_type.key_type)
+                self._write_raw_uint(len(val))
+                self._write_array(compat.lvalues(val), data_type.value_type)
+            else:
+                raise IOError('Invalid data type: %s' % data_type)
 
+        def _write_record_end(self):
             checksum = utils.long_to_int(self._crc.getvalue())
             self._write_tag(ProtoWireConstants.TUNNEL_END_RECORD, WIRETYPE_VARINT)
             self._write_raw_uint(utils.long_to_uint(checksum))
@@ -236,7 +279,7 @@ if BaseRecordWriter is None:
             self.close()
 
 
-class RecordWriter(BaseRecordWriter):
+class RecordWriter(BaseRecordWriter, ColumnarWriterMixin):
     """
     This writer uploads the output of serializer asynchronously within a long-lived http connection.
     """
@@ -273,6 +316,12 @@ class RecordWriter(BaseRecordWriter):
             raise IOError("writer abort since an async error occurs")
         super(RecordWriter, self).write(record)
 
+    def write_batch(self, columns):
+        self._start_upload()
+        if self._req_io._async_err:
+            raise IOError("writer abort since an async error occurs")
+        super(RecordWriter, self).write_batch(columns)
+
     def close(self):
         super(RecordWriter, self).close()
         self._req_io.finish()
@@ -281,16 +330,20 @@ class RecordWriter(BaseRecordWriter):
         return self.n_bytes
 
 
-class BufferredRecordWriter(BaseRecordWriter):
+class BufferredRecordWriter(BaseRecordWriter, ColumnarWriterMixin):
     """
     This writer buffers the output of serializer. When the buffer exceeds a fixed-size of limit
      (default 10 MiB), it uploads the buffered output within one http connection.
+
+    When ``n_threads`` is greater than 1, filled buffers are uploaded by a pool of threads
+    while records are being serialized into the next buffer. At most ``max_in_flight``
+    blocks (default as twice of ``n_threads``) are held in memory waiting for uploading.
     """
 
     BUFFER_SIZE = 10485760
 
     def __init__(self, schema, request_callback, compress_option=None,
-                 encoding='utf-8', buffer_size=None):
+                 encoding='utf-8', buffer_size=None, n_threads=None, max_in_flight=None):
         super(BufferredRecordWriter, self).__init__(schema, encoding)
         self._buffer_size = buffer_size or self.BUFFER_SIZE
         self._request_callback = request_callback
@@ -300,6 +353,14 @@ class BufferredRecordWriter(BaseRecordWriter):
         self._n_bytes_written = 0
         self._compress_option = compress_option
 
+        if n_threads is not None and n_threads > 1:
+            self._executor = futures.ThreadPoolExecutor(max_workers=n_threads)
+            self._in_flight = threading.BoundedSemaphore(max_in_flight or 2 * n_threads)
+        else:
+            self._executor = None
+            self._in_flight = None
+        self._upload_futures = []
+
         if self._compress_option is None:
             out = self._buffer
         elif self._compress_option.algorithm == \
@@ -321,11 +382,55 @@ class BufferredRecordWriter(BaseRecordWriter):
         if self._n_raw_bytes > self._buffer_size:
             self._flush()
 
+    def _write_buffers(self, buffers, start, end):
+        super(BufferredRecordWriter, self)._write_buffers(buffers, start, end)
+        if self._n_raw_bytes > self._buffer_size:
+            self._flush()
+
     def close(self):
         if self._n_raw_bytes > 0:
             self._flush()
         self.flush_all()
         self._buffer.close()
+        self._wait_uploads()
+
+    def _check_uploads(self):
+        # raise errors in finished uploads as early as possible
+        for fut in self._upload_futures:
+            if fut.done() and fut.exception() is not None:
+                self._wait_uploads()
+        self._upload_futures = [fut for fut in self._upload_futures if not fut.done()]
+
+    def _wait_uploads(self):
+        if self._executor is None:
+            return
+        try:
+            for fut in self._upload_futures:
+                fut.result()
+        finally:
+            self._upload_futures = []
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _upload_block(self, block_id, data):
+        def gen():  # synchronize chunk upload
+            for chunk in iter_chunks(data, options.chunk_size):
+                yield chunk
+
+        if self._executor is None:
+            self._request_callback(block_id, gen())
+            return
+
+        self._check_uploads()
+        # block serializing when too many blocks are waiting for uploading
+        self._in_flight.acquire()
+        try:
+            fut = self._executor.submit(self._request_callback, block_id, gen())
+        except:
+            self._in_flight.release()
+            raise
+        fut.add_done_callback(lambda _: self._in_flight.release())
+        self._upload_futures.append(fut)
 
     def _flush(self):
         self._write_tag(ProtoWireConstants.TUNNEL_META_COUNT, WIRETYPE_VARINT)
@@ -336,14 +441,7 @@ class BufferredRecordWriter(BaseRecordWriter):
         self._n_bytes_written += self._n_raw_bytes
         self.flush_all()
 
-        def gen():  # synchronize chunk upload
-            data = self._buffer.getvalue()
-            while data:
-                to_send = data[:options.chunk_size]
-                data = data[options.chunk_size:]
-                yield to_send
-
-        self._request_callback(self._block_id, gen())
+        self._upload_block(self._block_id, self._buffer.getvalue())
         self._blocks_written.append(self._block_id)
         self._block_id += 1
         self._buffer = compat.BytesIO()
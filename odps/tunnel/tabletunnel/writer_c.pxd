@@ -57,6 +57,12 @@ cdef class BaseRecordWriter(ProtobufRecordWriter):
 
     cpdef write(self, object record)
 
+    cpdef _write_buffers(self, object buffers, int start, int end)
+
+    cpdef _write_field(self, int pb_index, object val, object data_type)
+
+    cpdef _write_record_end(self)
+
     cpdef _write_bool(self, bint data)
 
     cpdef _write_long(self, int64_t data)
@@ -24,6 +24,7 @@ from ..pb.encoder_c cimport Encoder
 
 from ..pb.wire_format import WIRETYPE_VARINT, WIRETYPE_FIXED64, WIRETYPE_LENGTH_DELIMITED
 from ..wireconstants import ProtoWireConstants
+from .columnar import KIND_INT, KIND_DOUBLE, KIND_BOOL
 from ... import types, compat, utils, errors
 from ...compat import six
 
@@ -108,49 +109,12 @@ cdef class BaseRecordWriter(ProtobufRecordWriter):
 
         super(BaseRecordWriter, self).__init__(out)
 
-    def _get_write_functions(self):
-        def write_boolean(pb_index, val):
-            self._write_tag(pb_index, WIRETYPE_VARINT)
-            self._write_bool(val)
-
-        def write_datetime(pb_index, val):
-            val = utils.to_milliseconds(val)
-            self._write_tag(pb_index, WIRETYPE_VARINT)
-            self._write_long(val)
-
-        def write_string(pb_index, val):
-            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-            self._write_string(val)
-
-        def write_double(pb_index, val):
-            self._write_tag(pb_index, WIRETYPE_FIXED64)
-            self._write_double(val)
-
-        def write_bigint(pb_index, val):
-            self._write_tag(pb_index, WIRETYPE_VARINT)
-            self._write_long(val)
-
-        def write_decimal(pb_index, val):
-            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-            self._write_string(str(val))
-
-        return {
-            types.boolean: write_boolean,
-            types.datetime: write_datetime,
-            types.string: write_string,
-            types.double: write_double,
-            types.bigint: write_bigint,
-            types.decimal: write_decimal
-        }
-
     cpdef write(self, object record):
         cdef:
             int n_record_fields
             int n_columns
             int pb_index
             int i
-            int checksum
-            dict write_functions
 
         n_record_fields = len(record)
         n_columns = len(self._columns)
@@ -158,8 +122,6 @@ cdef class BaseRecordWriter(ProtobufRecordWriter):
         if n_record_fields > n_columns:
             raise IOError('record fields count is more than schema.')
 
-        write_functions = self._get_write_functions()
-
         for i in range(min(n_record_fields, n_columns)):
             if self._schema.is_partition(self._columns[i]):
                 continue
@@ -170,22 +132,85 @@ cdef class BaseRecordWriter(ProtobufRecordWriter):
 
             pb_index = i + 1
             self._crc.update_int(pb_index)
+            self._write_field(pb_index, val, self._columns[i].type)
 
-            data_type = self._columns[i].type
-            if data_type in write_functions:
-                write_functions[data_type](pb_index, val)
-            elif isinstance(data_type, types.Array):
-                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                self._write_raw_uint(len(val))
-                self._write_array(val, data_type.value_type)
-            elif isinstance(data_type, types.Map):
-                self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
-                self._write_raw_uint(len(val))
-                self._write_array(compat.lkeys(val), data_type.key_type)
-                self._write_raw_uint(len(val))
-                self._write_array(compat.lvalues(val), data_type.value_type)
-            else:
-                raise IOError('Invalid data type: %s' % data_type)
+        self._write_record_end()
+
+    cpdef _write_buffers(self, object buffers, int start, int end):
+        cdef:
+            int32_t[:] kinds = buffers.kinds
+            int32_t[:] slots = buffers.slots
+            int64_t[:, :] ints = buffers.ints
+            double[:, :] doubles = buffers.doubles
+            uint8_t[:, :] bools = buffers.bools
+            uint8_t[:, :] nulls = buffers.nulls
+            list objects = buffers.objects
+            list data_types = [col.type for col in self._columns]
+            int n_columns = len(data_types)
+            int kind_int = KIND_INT
+            int kind_double = KIND_DOUBLE
+            int kind_bool = KIND_BOOL
+            int row, i, kind, slot, pb_index
+
+        for row in range(start, end):
+            for i in range(n_columns):
+                if nulls[i, row]:
+                    continue
+
+                pb_index = i + 1
+                self._crc.update_int(pb_index)
+
+                kind = kinds[i]
+                slot = slots[i]
+                if kind == kind_int:
+                    self._write_tag(pb_index, WIRETYPE_VARINT)
+                    self._write_long(ints[slot, row])
+                elif kind == kind_double:
+                    self._write_tag(pb_index, WIRETYPE_FIXED64)
+                    self._write_double(doubles[slot, row])
+                elif kind == kind_bool:
+                    self._write_tag(pb_index, WIRETYPE_VARINT)
+                    self._write_bool(bools[slot, row])
+                else:
+                    self._write_field(pb_index, objects[slot][row], data_types[i])
+
+            self._write_record_end()
+
+    cpdef _write_field(self, int pb_index, object val, object data_type):
+        if data_type == types.boolean:
+            self._write_tag(pb_index, WIRETYPE_VARINT)
+            self._write_bool(val)
+        elif data_type == types.datetime:
+            val = utils.to_milliseconds(val)
+            self._write_tag(pb_index, WIRETYPE_VARINT)
+            self._write_long(val)
+        elif data_type == types.string:
+            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+            self._write_string(val)
+        elif data_type == types.double:
+            self._write_tag(pb_index, WIRETYPE_FIXED64)
+            self._write_double(val)
+        elif data_type == types.bigint:
+            self._write_tag(pb_index, WIRETYPE_VARINT)
+            self._write_long(val)
+        elif data_type == types.decimal:
+            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+            self._write_string(str(val))
+        elif isinstance(data_type, types.Array):
+            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+            self._write_raw_uint(len(val))
+            self._write_array(val, data_type.value_type)
+        elif isinstance(data_type, types.Map):
+            self._write_tag(pb_index, WIRETYPE_LENGTH_DELIMITED)
+            self._write_raw_uint(len(val))
+            self._write_array(compat.lkeys(val), data_type.key_type)
+            self._write_raw_uint(len(val))
+            self._write_array(compat.lvalues(val), data_type.value_type)
+        else:
+            raise IOError('Invalid data type: %s' % data_type)
+
+    cpdef _write_record_end(self):
+        cdef int checksum
 
         checksum = utils.long_to_int(self._crc.getvalue())
         self._write_tag(ProtoWireConstants.TUNNEL_END_RECORD, WIRETYPE_VARINT)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import struct
+
+from odps.tests.core import TestBase
+from odps.compat import unittest
+from odps.crc import Crc32
+from odps.tunnel import checksum
+
+
+class Test(TestBase):
+    def _get_checksums(self):
+        checksums = [checksum.Checksum]
+        try:
+            from odps.tunnel import checksum_c
+            checksums.append(checksum_c.Checksum)
+        except ImportError:
+            pass
+        return checksums
+
+    def _expected_value(self, crc, data):
+        crc.update(bytearray(data))
+        return crc.getvalue()
+
+    def _update_values(self, crc):
+        crc.update_int(1)
+        crc.update_long(-2 ** 63 + 1)
+        crc.update_float(3.14)
+        crc.update_bool(True)
+        crc.update(b'hello')
+        crc.update(b'x' * 10000)
+        crc.update_bool(False)
+
+    def testChecksum(self):
+        data = struct.pack('<iqd', 1, -2 ** 63 + 1, 3.14) + b'\x01hello' + b'x' * 10000 + b'\x00'
+
+        from odps.crc import Crc32c
+        expected = self._expected_value(Crc32c(), data)
+        expected_crc32 = self._expected_value(Crc32(), data)
+
+        for cls in self._get_checksums():
+            crc = cls()
+            self._update_values(crc)
+            self.assertEqual(expected, crc.getvalue())
+            # fetching value does not change the checksum
+            self.assertEqual(expected, crc.getvalue())
+
+            crc.reset()
+            self._update_values(crc)
+            self.assertEqual(expected, crc.getvalue())
+
+            crc = cls(method='crc32')
+            self._update_values(crc)
+            self.assertEqual(expected_crc32, crc.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ from odps.tunnel import io as tio
 
 import io
 import traceback
+import zlib
 
 try:
     from string import letters
@@ -93,6 +94,61 @@ class Test(TestBase):
 
         self.assertEquals(self.TEXT.encode('utf8'), b)
 
+    def testReadAcrossBlocks(self):
+        data = bytes(bytearray(i % 256 for i in range(100000)))
+
+        class SmallBlockInputStream(tio.SimpleInputStream):
+            READ_BLOCK_SIZE = 1000
+
+        for stream_cls in (tio.SimpleInputStream, SmallBlockInputStream):
+            instream = stream_cls(io.BytesIO(data))
+            parts, size = [], 1
+            while True:
+                part = instream.read(size)
+                if not part:
+                    break
+                parts.append(part)
+                size = size * 3 % 4999 + 1
+            self.assertEqual(data, bytes().join(parts))
+
+        tube = io.BytesIO()
+        outstream = tio.DeflateOutputStream(tube)
+        outstream.write(data)
+        outstream.flush()
+        tube.seek(0)
+        instream = tio.DeflateInputStream(tube)
+        self.assertEqual(data[:70000], instream.read(70000))
+        self.assertEqual(data[70000:], instream.read(70000))
+        self.assertEqual(bytes(), instream.read(1))
+
+        # decompressed blocks are bounded
+        data = bytes(bytearray(1 << 20))
+        instream = tio.DeflateInputStream(io.BytesIO(zlib.compress(data)))
+        self.assertEqual(data, instream.read(1 << 21))
+
+    def testChunks(self):
+        self.assertEqual(1024, tio.get_chunk_size(1024, 100))
+        self.assertEqual(4096, tio.get_chunk_size(1024, 4096 * 16))
+        self.assertEqual(tio.MAX_CHUNK_SIZE, tio.get_chunk_size(1024, 1 << 30))
+
+        self.assertEqual([], list(tio.iter_chunks(bytes(), 16)))
+        data = bytes(bytearray(i % 256 for i in range(10000)))
+        self.assertIs(data, next(tio.iter_chunks(data, 10000)))
+        chunks = list(tio.iter_chunks(data, 16))
+        self.assertEqual(16, len(chunks))
+        self.assertEqual(data, bytes().join(bytes(c) for c in chunks))
+
+        tio._FORCE_THREAD = True
+
+        received = []
+        req_io = tio.RequestsIO(lambda it: received.extend(bytes(c) for c in it), chunk_size=16)
+        req_io.start()
+        req_io.write(data)
+        req_io.write(data[:10])
+        req_io.finish()
+        self.assertEqual(17, len(received))
+        self.assertEqual(data + data[:10], bytes().join(received))
+
     def testClass(self):
         tio._FORCE_THREAD = False
 
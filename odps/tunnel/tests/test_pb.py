@@ -111,5 +111,39 @@ class Test(TestBase):
         except ImportError:
             warnings.warn('No Encoder or Decoder built by cython found')
 
+    def testPyDecodeAcrossWindows(self):
+        from odps.tunnel.pb.encoder import Encoder
+        from odps.tunnel.pb.decoder import Decoder
+        from odps.tunnel.pb.errors import DecodeError
+
+        class ShortReadIO(io.BytesIO):
+            def read(self, size=-1):
+                return super(ShortReadIO, self).read(min(size, 3))
+
+        encoder = Encoder()
+        for i in range(100):
+            encoder.append_tag(i, WIRETYPE_VARINT)
+            encoder.append_sint64(-2 ** (i % 63))
+            encoder.append_tag(i, WIRETYPE_FIXED64)
+            encoder.append_double(i * 0.5)
+            encoder.append_tag(i, WIRETYPE_LENGTH_DELIMITED)
+            encoder.append_string(to_binary('x' * i))
+        data = encoder.tostring()
+
+        decoder = Decoder(ShortReadIO(data))
+        decoder._stream.WINDOW_SIZE = 16
+        for i in range(100):
+            self.assertEqual((i, WIRETYPE_VARINT), decoder.read_field_number_and_wire_type())
+            self.assertEqual(-2 ** (i % 63), decoder.read_sint64())
+            self.assertEqual((i, WIRETYPE_FIXED64), decoder.read_field_number_and_wire_type())
+            self.assertEqual(i * 0.5, decoder.read_double())
+            self.assertEqual((i, WIRETYPE_LENGTH_DELIMITED), decoder.read_field_number_and_wire_type())
+            self.assertEqual(to_binary('x' * i), decoder.read_string())
+        self.assertEqual(len(data), decoder.position())
+
+        self.assertRaises(DecodeError, Decoder(io.BytesIO(b'\x00' * 5)).read_double)
+        self.assertRaises(DecodeError, Decoder(io.BytesIO(b'\xff\xff')).read_sint64)
+        self.assertRaises(DecodeError, Decoder(io.BytesIO(b'\x05abc')).read_string)
+
 if __name__ == '__main__':
     unittest.main()
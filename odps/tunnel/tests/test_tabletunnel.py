@@ -30,8 +30,8 @@ except ImportError:
     from string import ascii_letters as letters
 
 from odps.compat import reload_module
-from odps.tests.core import TestBase, to_str, tn, snappy_case
-from odps.compat import unittest, OrderedDict
+from odps.tests.core import TestBase, to_str, tn, snappy_case, numpy_case, pandas_case
+from odps.compat import unittest, OrderedDict, six
 from odps.models import Schema
 from odps import types, options
 from odps.tunnel import TableTunnel
@@ -99,9 +99,11 @@ class Test(TestBase):
         writer.close()
         upload_ss.commit([0, ])
 
-    def _buffered_upload_data(self, test_table, records, buffer_size=None, compress=False, **kw):
+    def _buffered_upload_data(self, test_table, records, buffer_size=None, compress=False,
+                              n_threads=None, **kw):
         upload_ss = self.tunnel.create_upload_session(test_table, **kw)
-        writer = upload_ss.open_record_writer(buffer_size=buffer_size, compress=compress)
+        writer = upload_ss.open_record_writer(buffer_size=buffer_size, compress=compress,
+                                              n_threads=n_threads)
         for r in records:
             record = upload_ss.new_record()
             for i, it in enumerate(r):
@@ -181,6 +183,113 @@ class Test(TestBase):
         self._assert_reads_data_equal(records, data)
         self._delete_table(table)
 
+    @bothPyAndC
+    def testMultiThreadBufferredUploadAndDownload(self):
+        table, data = self._gen_table(size=100)
+        self._buffered_upload_data(table, data, buffer_size=1024, n_threads=4)
+        records = self._download_data(table, count=len(data))
+        self.assertEqual(len(records), len(data))
+        self._assert_reads_data_equal(records, data)
+        self._delete_table(table)
+
+    @numpy_case
+    @pandas_case
+    @bothPyAndC
+    def testReadBatches(self):
+        import pandas as pd
+        from odps.tunnel.tabletunnel.reader import TableTunnelReader
+        from odps.tunnel.tabletunnel.writer import BaseRecordWriter
+
+        class BufferWriter(BaseRecordWriter):
+            pass
+
+        schema = Schema.from_lists(['id', 'int_num', 'float_num', 'dt', 'bool', 'dec', 'arr', 'm'],
+                                   ['string', 'bigint', 'double', 'datetime', 'boolean', 'decimal',
+                                    'array<string>', 'map<string,bigint>'])
+        data = self._gen_data()
+
+        def gen_stream(records):
+            buf = six.BytesIO()
+            writer = BufferWriter(schema, buf)
+            for r in records:
+                writer.write(types.Record(schema=schema, values=r))
+            writer.close()
+            return six.BytesIO(buf.getvalue())
+
+        reader = TableTunnelReader(schema, gen_stream(data + [(None, ) * 8]))
+        batches = list(reader.read_batches(batch_size=3))
+        self.assertEqual([3, 1], [len(b['id']) for b in batches])
+        self.assertEqual(len(data) + 1, reader.count)
+        self.assertEqual('int64', batches[0]['int_num'].dtype.name)
+        self.assertEqual('float64', batches[1]['int_num'].dtype.name)
+        self.assertTrue(all(pd.isnull(c[0]) for c in batches[1].values()))
+
+        df = TableTunnelReader(schema, gen_stream(data)).to_pandas(batch_size=2)
+        self.assertEqual(len(data), len(df))
+        for expected, values in zip(data, df.values.tolist()):
+            self.assertEqual(list(expected[:3]), values[:3])
+            self.assertEqual(expected[3], values[3].to_pydatetime())
+            self.assertEqual(list(expected[4:]), values[4:])
+
+    @numpy_case
+    @pandas_case
+    @bothPyAndC
+    def testWriteBatch(self):
+        import numpy as np
+        import pandas as pd
+        from odps.tunnel.tabletunnel.reader import TableTunnelReader
+        from odps.tunnel.tabletunnel.writer import BufferredRecordWriter
+
+        schema = Schema.from_lists(['id', 'int_num', 'float_num', 'dt', 'bool', 'dec', 'arr', 'm'],
+                                   ['string', 'bigint', 'double', 'datetime', 'boolean', 'decimal',
+                                    'array<string>', 'map<string,bigint>'])
+        data = self._gen_data()
+
+        def gen_blocks(write, buffer_size=None):
+            blocks = []
+            writer = BufferredRecordWriter(
+                schema, lambda block_id, chunks: blocks.append(b''.join(chunks)),
+                buffer_size=buffer_size)
+            write(writer)
+            writer.close()
+            return blocks
+
+        def write_records(records):
+            def write(writer):
+                for r in records:
+                    writer.write(types.Record(schema=schema, values=r))
+            return write
+
+        df = pd.DataFrame(data, columns=schema.names)
+        self.assertEqual(gen_blocks(write_records(data)), gen_blocks(lambda w: w.write_pandas(df)))
+
+        old_batch_rows = BufferredRecordWriter.WRITE_BATCH_ROWS
+        try:
+            BufferredRecordWriter.WRITE_BATCH_ROWS = 2
+            blocks = gen_blocks(lambda w: w.write_pandas(pd.concat([df] * 10)), buffer_size=200)
+        finally:
+            BufferredRecordWriter.WRITE_BATCH_ROWS = old_batch_rows
+        self.assertGreater(len(blocks), 1)
+        records = [r.values for b in blocks
+                   for r in TableTunnelReader(schema, six.BytesIO(b))]
+        self.assertEqual(data * 10, [tuple(r) for r in records])
+
+        null_data = [('a', 1, None, None, None, None, None, None),
+                     (None, None, 1.0, datetime(2015, 9, 19), True, None, None, None)]
+        columns = OrderedDict([
+            ('id', ['a', None]),
+            ('int_num', np.array([1, np.nan])),
+            ('float_num', np.array([np.nan, 1.0])),
+            ('dt', np.array(['NaT', '2015-09-19'], dtype='datetime64[ns]')),
+            ('bool', [None, True]),
+        ])
+        self.assertEqual(gen_blocks(write_records(null_data)),
+                         gen_blocks(lambda w: w.write_batch(columns)))
+
+        self.assertRaises(ValueError, lambda: gen_blocks(lambda w: w.write_batch({'n': [1]})))
+        self.assertRaises(ValueError, lambda: gen_blocks(
+            lambda w: w.write_batch({'id': ['a'], 'int_num': [1, 2]})))
+
     @bothPyAndC
     def testDownloadWithSpecifiedColumns(self):
         test_table_name = tn('pyodps_test_raw_tunnel_columns')
@@ -517,5 +626,27 @@ class Test(TestBase):
 
         table.drop()
 
+    @bothPyAndC
+    def testMultiThreadDownloadTunnel(self):
+        table, data = self._gen_table(size=100)
+
+        records = [table.new_record(values=d) for d in data]
+        self.odps.write_table(table, 0, records)
+
+        for step in range(1, 3):
+            with table.open_reader() as reader:
+                reads = list(reader.read(step=step, n_threads=4))
+            self._assert_reads_data_equal([r.values for r in reads], data[::step])
+            self.assertEqual(len(reads), len(data[::step]))
+
+        download_session = self.tunnel.create_download_session(table.name)
+        with download_session.open_parallel_record_reader(
+                0, len(data), 4, ordered=False, split_size=7) as reader:
+            reads = list(reader)
+        self.assertEqual(len(reads), len(data))
+        self.assertEqual(reader.count, len(data))
+
+        table.drop()
+
 if __name__ == '__main__':
     unittest.main()
@@ -355,6 +355,28 @@ class OdpsSchema(Schema):
                               partition_types=partitions_types)
 
 
+_name_indexes_cache = dict()
+_NAME_INDEXES_CACHE_SIZE = 256
+
+
+def _get_name_indexes(columns):
+    """
+    Get the map of column names to indexes. The map is built once for a list
+    of column names and shared by all the records created with the same names.
+    """
+    # keyed by names instead of the list, which may be modified in place
+    key = tuple([col.name for col in columns])
+    name_indexes = _name_indexes_cache.get(key)
+    if name_indexes is not None:
+        return name_indexes
+
+    name_indexes = dict((name, i) for i, name in enumerate(key))
+    if len(_name_indexes_cache) >= _NAME_INDEXES_CACHE_SIZE:
+        _name_indexes_cache.clear()
+    _name_indexes_cache[key] = name_indexes
+    return name_indexes
+
+
 class Record(object):
     """
     A record generally means the data of a single line in a table.
@@ -394,7 +416,27 @@ class Record(object):
         self._values = [None, ] * len(self._columns)
         if values is not None:
             self._sets(values)
-        self._name_indexes = dict((col.name, i) for i, col in enumerate(self._columns))
+        if columns:
+            self._name_indexes = _get_name_indexes(columns)
+        else:
+            # columns of schemas are created on every access, thus not cached
+            self._name_indexes = dict((col.name, i) for i, col in enumerate(self._columns))
+
+    @classmethod
+    def _from_trusted_values(cls, columns, values, name_indexes=None):
+        """
+        Create a record from a list of values already in types of columns without
+        validating them, which is used by readers of data from ODPS services.
+        The list is owned by the record afterwards. Readers owning the list of
+        columns can pass the map of column names to indexes built once.
+        """
+        if name_indexes is None:
+            name_indexes = _get_name_indexes(columns)
+        record = cls.__new__(cls)
+        object.__setattr__(record, '_columns', columns)
+        object.__setattr__(record, '_values', values)
+        object.__setattr__(record, '_name_indexes', name_indexes)
+        return record
 
     def _mode(self):
         return 'py'
@@ -94,14 +94,26 @@ def create_instance_group(name):
 
 
 def reload_instance_status(odps, group_id, instance_id):
+    """
+    Reload status and progress of an instance into an instance group. Statuses of the
+    instance and its tasks are fetched in one request, and the logview address is only
+    fetched once. An instance object can be passed instead of the id to avoid creating
+    a new one every time.
+
+    :return: progress of the instance
+    """
     if group_id not in PROGRESS_REPO:
         raise KeyError('Instance group ID not exist.')
     group_json = PROGRESS_REPO[group_id]
 
+    sub_inst = None
+    if isinstance(instance_id, Instance):
+        sub_inst, instance_id = instance_id, instance_id.id
+
     if instance_id in group_json.instances:
         inst_json = group_json.instances[instance_id]
         if inst_json.status == Instance.Status.TERMINATED:
-            return
+            return inst_json
     else:
         inst_json = _InstanceProgressJSON(id=instance_id, tasks=dict())
         group_json.instances[instance_id] = inst_json
@@ -109,12 +121,16 @@ def reload_instance_status(odps, group_id, instance_id):
     group_json.gen_time = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
     old_status = inst_json.status
 
-    sub_inst = odps.get_instance(instance_id)
-    inst_json.status = sub_inst.status
-    inst_json.logview = sub_inst.get_logview_address()
+    if sub_inst is None:
+        sub_inst = odps.get_instance(instance_id)
+    # statuses of tasks are returned with the status of the instance
+    task_statuses = sub_inst.get_task_statuses()
+    inst_json.status = sub_inst._getattr('_status') or sub_inst.status
+    if inst_json.logview is None:
+        inst_json.logview = sub_inst.get_logview_address()
 
     if old_status != Instance.Status.TERMINATED:
-        for task_name, task in six.iteritems(sub_inst.get_task_statuses()):
+        for task_name, task in six.iteritems(task_statuses):
             if task_name in inst_json.tasks:
                 task_json = inst_json.tasks[task_name]
                 task_json.status = task.status
@@ -138,6 +154,7 @@ def reload_instance_status(odps, group_id, instance_id):
                         if val is not None:
                             setattr(stage_json, field_name, val)
                 task_json.stages.append(stage_json)
+    return inst_json
 
 
 def fetch_instance_group(group_id):
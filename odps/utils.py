@@ -20,6 +20,7 @@
 from __future__ import absolute_import, print_function
 
 import bisect
+import calendar
 import codecs
 import copy
 import glob
@@ -39,7 +40,7 @@ import warnings
 import xml.dom.minidom
 from hashlib import sha1, md5
 from base64 import b64encode
-from datetime import datetime
+from datetime import datetime, timedelta
 from email.utils import parsedate_tz, formatdate
 
 from . import compat
@@ -237,14 +238,135 @@ def to_timestamp(dt):
     return int(time.mktime(dt.timetuple()))
 
 
-def to_milliseconds(dt):
-    return int((time.mktime(dt.timetuple()) + dt.microsecond/1000000.0) * 1000)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_DAY_SECONDS = 24 * 3600
 
 
-def to_datetime(milliseconds):
-    seconds = int(milliseconds / 1000)
-    microseconds = milliseconds % 1000 * 1000
-    return datetime.fromtimestamp(seconds).replace(microsecond=microseconds)
+class DatetimeCodec(object):
+    """
+    Conversion between datetimes and milliseconds since epoch.
+
+    Datetimes are local ones by default. UTC offsets are cached by days, and
+    offsets of days with DST transitions are computed for every value. When
+    ``utc`` is True, datetimes are naive ones in UTC and no offset is applied.
+    Arrays of milliseconds and ``datetime64`` arrays are converted by NumPy
+    operations in :meth:`to_datetime64` and :meth:`from_datetime64`.
+    """
+
+    _max_cache_size = 1 << 16
+
+    def __init__(self, utc=False):
+        self._utc = utc
+        # offsets keyed by days since epoch in UTC and in local time
+        self._utc_day_offsets = dict()
+        self._local_day_offsets = dict()
+        self._day_starts = dict()
+
+    @staticmethod
+    def _utc_offset(seconds):
+        return calendar.timegm(time.localtime(seconds)) - seconds
+
+    @staticmethod
+    def _local_offset(local_seconds):
+        timetuple = time.gmtime(local_seconds)[:8] + (-1, )
+        return local_seconds - int(time.mktime(timetuple))
+
+    def _get_day_offset(self, cache, day, compute):
+        try:
+            return cache[day]
+        except KeyError:
+            pass
+
+        start = day * _DAY_SECONDS
+        offset = compute(start)
+        if compute(start + _DAY_SECONDS - 1) != offset:
+            # offset changes in this day
+            offset = None
+        if len(cache) >= self._max_cache_size:
+            cache.clear()
+        cache[day] = offset
+        return offset
+
+    def _get_day_start(self, day):
+        # local datetime when the day in UTC starts, None if offset changes in the day
+        if self._utc:
+            start = _EPOCH + timedelta(days=day)
+        else:
+            offset = self._get_day_offset(self._utc_day_offsets, day, self._utc_offset)
+            start = None if offset is None else _EPOCH + timedelta(days=day, seconds=offset)
+        if len(self._day_starts) >= self._max_cache_size:
+            self._day_starts.clear()
+        self._day_starts[day] = start
+        return start
+
+    def to_datetime(self, milliseconds):
+        day, milliseconds = divmod(int(milliseconds), _DAY_SECONDS * 1000)
+        try:
+            start = self._day_starts[day]
+        except KeyError:
+            start = self._get_day_start(day)
+        if start is not None:
+            return start + timedelta(milliseconds=milliseconds)
+
+        seconds, milliseconds = divmod(milliseconds, 1000)
+        seconds += day * _DAY_SECONDS
+        seconds += self._utc_offset(seconds)
+        return _EPOCH + timedelta(seconds=seconds, milliseconds=milliseconds)
+
+    def to_milliseconds(self, dt):
+        seconds = (dt.toordinal() - _EPOCH_ORDINAL) * _DAY_SECONDS + \
+            dt.hour * 3600 + dt.minute * 60 + dt.second
+        if not self._utc:
+            offset = self._get_day_offset(self._local_day_offsets, seconds // _DAY_SECONDS,
+                                          self._local_offset)
+            seconds -= self._local_offset(seconds) if offset is None else offset
+        return seconds * 1000 + dt.microsecond // 1000
+
+    def _get_offsets(self, seconds, cache, compute):
+        import numpy as np
+
+        days, inverse = np.unique(seconds // _DAY_SECONDS, return_inverse=True)
+        day_offsets = [self._get_day_offset(cache, int(day), compute) for day in days]
+        offsets = np.array([o or 0 for o in day_offsets], dtype=np.int64)[inverse]
+
+        changed = [i for i, o in enumerate(day_offsets) if o is None]
+        if changed:
+            mask = np.in1d(inverse, changed)
+            offsets[mask] = [compute(int(s)) for s in seconds[mask]]
+        return offsets
+
+    def to_datetime64(self, arr):
+        """
+        Convert an array of milliseconds since epoch into ``datetime64[ms]``.
+        """
+        import numpy as np
+
+        arr = np.asarray(arr, dtype=np.int64)
+        if not self._utc:
+            offsets = self._get_offsets(arr // 1000, self._utc_day_offsets, self._utc_offset)
+            arr = arr + offsets * 1000
+        return arr.astype('datetime64[ms]')
+
+    def from_datetime64(self, arr):
+        """
+        Convert a ``datetime64`` array into milliseconds since epoch.
+        """
+        import numpy as np
+
+        arr = np.asarray(arr).astype('datetime64[ms]').astype(np.int64)
+        if not self._utc:
+            offsets = self._get_offsets(arr // 1000, self._local_day_offsets, self._local_offset)
+            arr = arr - offsets * 1000
+        return arr
+
+
+_local_datetime_codec = DatetimeCodec()
+
+to_milliseconds = _local_datetime_codec.to_milliseconds
+to_datetime = _local_datetime_codec.to_datetime
+to_datetime64 = _local_datetime_codec.to_datetime64
+from_datetime64 = _local_datetime_codec.from_datetime64
 
 
 def to_binary(text, encoding='utf-8'):
@@ -292,6 +414,18 @@ def interval_select(val, intervals, targets):
     return targets[bisect.bisect_left(intervals, val)]
 
 
+def backoff_intervals(interval, max_interval=None, factor=1.5):
+    """
+    Generate intervals between checks, starting from ``interval`` and growing
+    by ``factor`` until ``max_interval`` is reached. Intervals are fixed when
+    ``max_interval`` is None.
+    """
+    while True:
+        yield interval
+        if max_interval is not None and interval < max_interval:
+            interval = min(interval * factor, max_interval)
+
+
 def is_namedtuple(obj):
     return isinstance(obj, tuple) and hasattr(obj, '_fields')
 